@@ -1,22 +1,48 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 from models.board import Board
 from repositories.board_repository import BoardRepository
+from repositories.item_repository import ItemRepository
+from repositories.item_tombstone_repository import sync_cursor
+from repositories.session_repository import SessionRepository
+from utils.pagination_helper import clamp_page_size
+from utils.request_helper import parse_json_body
 from utils.response_helper import (
     success_response,
     created_response,
     bad_request_response,
     not_found_response,
+    conditional_response,
+    collection_etag,
+    entity_etag,
     server_error_response
 )
 
-repository = BoardRepository()
+
+@lru_cache(maxsize=None)
+def get_repository() -> BoardRepository:
+    """Crear el repositorio en el primer uso y reutilizarlo en el contenedor"""
+    return BoardRepository()
+
+
+@lru_cache(maxsize=None)
+def get_item_repository() -> ItemRepository:
+    """Crear el repositorio de items en el primer uso"""
+    return ItemRepository()
+
+
+@lru_cache(maxsize=None)
+def get_session_repository() -> SessionRepository:
+    """Crear el repositorio de sesiones en el primer uso"""
+    return SessionRepository()
 
 
 def create_board(event: dict, context: Any) -> dict:
     """Crear un nuevo board"""
     try:
-        body = json.loads(event.get('body', '{}'))
+        body = parse_json_body(event)
 
         board = Board(
             title=body.get('title'),
@@ -27,7 +53,7 @@ def create_board(event: dict, context: Any) -> dict:
         if not is_valid:
             return bad_request_response(error_message)
 
-        created_board = repository.create(board)
+        created_board = get_repository().create(board)
 
         return created_response(
             created_board.to_dict(),
@@ -48,12 +74,13 @@ def get_board(event: dict, context: Any) -> dict:
     try:
         board_id = event['pathParameters']['id']
 
-        board = repository.get_by_id(board_id)
+        board = get_repository().get_by_id(board_id)
 
         if not board:
             return not_found_response("Board not found")
 
-        return success_response(board.to_dict())
+        data = board.to_dict()
+        return conditional_response(event, data, entity_etag(data))
 
     except KeyError:
         return bad_request_response("Board ID is required")
@@ -62,19 +89,68 @@ def get_board(event: dict, context: Any) -> dict:
         return server_error_response(f"Error getting board: {str(e)}")
 
 
+def get_board_full(event: dict, context: Any) -> dict:
+    """
+    Obtener un board con sus items y sesiones en una sola solicitud
+
+    Incluye el cursor desde el cual pedir los cambios de items con
+    GET /items/board/{board_id}?since=<cursor>.
+    """
+    try:
+        board_id = event['pathParameters']['id']
+
+        # Antes de leer: un cambio durante la lectura vuelve en el próximo since
+        cursor = sync_cursor()
+
+        # Las tres lecturas son independientes: se lanzan en paralelo
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            board_future = executor.submit(get_repository().get_by_id, board_id)
+            items_future = executor.submit(get_item_repository().get_by_board, board_id)
+            sessions_future = executor.submit(get_session_repository().get_by_board, board_id)
+
+            board = board_future.result()
+            items = items_future.result()
+            sessions = sessions_future.result()
+
+        if not board:
+            return not_found_response("Board not found")
+
+        data = {
+            'board': board.to_dict(),
+            'items': [item.to_dict() for item in items],
+            'sessions': [session.to_dict() for session in sessions],
+            'item_count': len(items),
+            'session_count': len(sessions)
+        }
+        # El ETag se calcula sin el cursor, que cambia en cada request
+        return conditional_response(event, dict(data, cursor=cursor), collection_etag(data))
+
+    except KeyError:
+        return bad_request_response("Board ID is required")
+    except Exception as e:
+        print(f"Error getting full board: {e}")
+        return server_error_response(f"Error getting full board: {str(e)}")
+
+
 def list_boards(event: dict, context: Any) -> dict:
     """Listar todos los boards"""
     try:
         query_params = event.get('queryStringParameters') or {}
-        limit = int(query_params.get('limit', 50))
+        limit = clamp_page_size(query_params.get('limit'))
 
-        boards = repository.list_all(limit=limit)
+        boards, next_token = get_repository().list_all(
+            limit=limit,
+            next_token=query_params.get('next_token')
+        )
 
-        return success_response({
+        return conditional_response(event, {
             'boards': [board.to_dict() for board in boards],
-            'count': len(boards)
+            'count': len(boards),
+            'next_token': next_token
         })
 
+    except ValueError as e:
+        return bad_request_response(str(e))
     except Exception as e:
         print(f"Error listing boards: {e}")
         return server_error_response(f"Error listing boards: {str(e)}")
@@ -84,11 +160,7 @@ def update_board(event: dict, context: Any) -> dict:
     """Actualizar un board"""
     try:
         board_id = event['pathParameters']['id']
-        body = json.loads(event.get('body', '{}'))
-
-        existing_board = repository.get_by_id(board_id)
-        if not existing_board:
-            return not_found_response("Board not found")
+        body = parse_json_body(event)
 
         updates = {}
 
@@ -101,10 +173,10 @@ def update_board(event: dict, context: Any) -> dict:
         if not updates:
             return bad_request_response("No fields to update")
 
-        updated_board = repository.update(board_id, updates)
+        updated_board = get_repository().update(board_id, updates)
 
         if not updated_board:
-            return server_error_response("Failed to update board")
+            return not_found_response("Board not found")
 
         return success_response(
             updated_board.to_dict(),
@@ -123,11 +195,16 @@ def update_board(event: dict, context: Any) -> dict:
 
 
 def delete_board(event: dict, context: Any) -> dict:
-    """Eliminar un board"""
+    """
+    Eliminar un board
+
+    Sus items y sesiones se eliminan en segundo plano desde el stream de
+    boards (cleanup_handler.cascade_board_deletion).
+    """
     try:
         board_id = event['pathParameters']['id']
 
-        success = repository.delete(board_id)
+        success = get_repository().delete(board_id)
 
         if not success:
             return not_found_response("Board not found")
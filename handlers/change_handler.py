@@ -0,0 +1,39 @@
+from typing import Any
+
+from handlers.cleanup_handler import handle_item_removals
+from handlers.counter_handler import ITEM_COUNT_CONSUMER, apply_count_changes, get_board_repository
+from utils.change_publisher import get_publisher, stream_changes
+
+
+def handle_item_changes(event: dict, context: Any) -> dict:
+    """
+    Procesar el stream de items: limpieza de bajas, item_count y notificaciones
+
+    - Marcas de borrado y documentos de S3 (ver handle_item_removals)
+    - item_count de los boards, a lo sumo una vez por registro gracias a
+      los marcadores (ver apply_count_changes)
+    - Notificación de cada cambio a los suscriptores del board, con las
+      imágenes del stream; así se publican también los movimientos
+      masivos, las posiciones encoladas y los borrados en cascada, y un
+      item que cambia de board se informa en ambos
+
+    Se publica después de la limpieza: si esta falla, el lote se reintenta
+    y los clientes pueden recibir un cambio repetido, nunca perderlo. Un
+    fallo de los contadores se informa como respuesta parcial
+    (ReportBatchItemFailures) desde el primer registro afectado; la
+    limpieza y los contadores ya aplicados se repiten sin efecto.
+    """
+    records = event.get('Records', [])
+    result = handle_item_removals(event, context)
+
+    counts = apply_count_changes(records, 'board_id', ITEM_COUNT_CONSUMER, get_board_repository().adjust_item_count)
+
+    notified = 0
+    for board_id, changes in stream_changes(records).items():
+        # Un fallo al notificar un board no debe reprocesar la limpieza del lote
+        try:
+            notified += get_publisher().publish(board_id, changes)
+        except Exception as e:
+            print(f"Error publishing item changes for board {board_id}: {e}")
+
+    return dict(result, connections_notified=notified, **counts)
@@ -0,0 +1,146 @@
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Optional
+
+from repositories.board_summary_repository import BoardSummaryRepository
+from repositories.item_repository import ItemRepository
+from repositories.item_tombstone_repository import ItemTombstoneRepository
+from repositories.session_repository import SessionRepository
+from utils.dynamodb_helper import from_stream_image
+from utils.s3_helper import S3Helper
+
+
+@lru_cache(maxsize=None)
+def get_s3_helper() -> S3Helper:
+    """Crear el helper de S3 en el primer uso y reutilizarlo en el contenedor"""
+    return S3Helper()
+
+
+@lru_cache(maxsize=None)
+def get_item_repository() -> ItemRepository:
+    """Crear el repositorio de items en el primer uso"""
+    return ItemRepository()
+
+
+@lru_cache(maxsize=None)
+def get_tombstone_repository() -> ItemTombstoneRepository:
+    """Crear el repositorio de marcas de borrado en el primer uso"""
+    return ItemTombstoneRepository()
+
+
+@lru_cache(maxsize=None)
+def get_summary_repository() -> BoardSummaryRepository:
+    """Crear el repositorio de resúmenes en el primer uso"""
+    return BoardSummaryRepository()
+
+
+@lru_cache(maxsize=None)
+def get_session_repository() -> SessionRepository:
+    """Crear el repositorio de sesiones en el primer uso"""
+    return SessionRepository()
+
+
+def _removed_from_board(record: dict) -> Optional[dict]:
+    """Item que dejó de pertenecer a un board: eliminado o movido a otro board"""
+    images = record.get('dynamodb', {})
+    old_item = from_stream_image(images.get('OldImage'))
+    if not old_item:
+        return None
+
+    if record.get('eventName') == 'REMOVE':
+        return old_item
+
+    new_item = from_stream_image(images.get('NewImage')) or {}
+    if record.get('eventName') == 'MODIFY' and new_item.get('board_id') != old_item.get('board_id'):
+        return old_item
+    return None
+
+
+def _event_time(record: dict) -> str:
+    timestamp = record.get('dynamodb', {}).get('ApproximateCreationDateTime')
+    if timestamp:
+        return datetime.utcfromtimestamp(float(timestamp)).isoformat()
+    return datetime.utcnow().isoformat()
+
+
+def handle_item_removals(event: dict, context: Any) -> dict:
+    """
+    Procesar los items que salen de un board, desde el stream de items
+
+    - Registra una marca de borrado para la sincronización incremental
+      (items eliminados o movidos a otro board)
+    - Elimina de S3 los documentos de los items eliminados, agrupados en
+      llamadas DeleteObjects
+    """
+    tombstones = []
+    keys = []
+
+    for record in event.get('Records', []):
+        old_item = _removed_from_board(record)
+        if not old_item:
+            continue
+
+        if old_item.get('board_id'):
+            tombstones.append({
+                'id': old_item['id'],
+                'board_id': old_item['board_id'],
+                'deleted_at': _event_time(record)
+            })
+
+        if record.get('eventName') == 'REMOVE' and old_item.get('document'):
+            key = get_s3_helper().get_object_key_from_url(old_item['document'])
+            if key:
+                keys.append(key)
+
+    if tombstones:
+        get_tombstone_repository().record_many(tombstones)
+
+    if keys:
+        failed = get_s3_helper().delete_objects(keys)
+        if failed:
+            # Borrar en S3 es idempotente: fallar el lote hace que se reintente completo
+            raise RuntimeError(f"Failed to delete {len(failed)} document(s) from S3")
+
+    return {'tombstones': len(tombstones), 'documents_deleted': len(keys)}
+
+
+def cascade_board_deletion(event: dict, context: Any) -> dict:
+    """
+    Eliminar los items, sesiones y celdas de resumen de los boards borrados
+
+    Se ejecuta desde el stream de la tabla de boards, fuera del request de
+    delete_board, así boards muy grandes no afectan la latencia del usuario.
+    Los documentos de S3 de los items se eliminan en handle_item_removals
+    a partir del stream de items. Si la función se interrumpe, el
+    reintento del lote vuelve a leer lo que queda de cada partición.
+    Las bajas de items que update_board_summaries procese después no
+    recrean las celdas: solo se descuentan de celdas existentes.
+    """
+    items_deleted = 0
+    sessions_deleted = 0
+    cells_deleted = 0
+
+    for record in event.get('Records', []):
+        if record.get('eventName') != 'REMOVE':
+            continue
+
+        board_id = record.get('dynamodb', {}).get('Keys', {}).get('id', {}).get('S')
+        if not board_id:
+            continue
+
+        print(f"Cascading deletion of board {board_id}")
+        items_deleted += get_item_repository().delete_by_board(
+            board_id,
+            on_progress=lambda count: print(f"Board {board_id}: {count} item(s) deleted")
+        )
+        sessions_deleted += get_session_repository().delete_by_board(
+            board_id,
+            on_progress=lambda count: print(f"Board {board_id}: {count} session(s) deleted")
+        )
+        cells_deleted += get_summary_repository().delete_by_board(board_id)
+
+    return {
+        'items_deleted': items_deleted,
+        'sessions_deleted': sessions_deleted,
+        'summary_cells_deleted': cells_deleted
+    }
@@ -0,0 +1,76 @@
+from functools import lru_cache
+from typing import Any, Callable, List, Tuple
+
+from repositories.board_repository import BoardRepository
+from repositories.course_repository import CourseRepository
+from repositories.instructor_repository import InstructorRepository
+from utils.dynamodb_helper import stream_count_changes
+from utils.idempotency_helper import stream_marker
+
+# Nombres de los consumidores en los marcadores de registros aplicados
+ITEM_COUNT_CONSUMER = 'item-count'
+SESSION_COUNT_CONSUMER = 'session-count'
+COURSE_COUNT_CONSUMER = 'course-count'
+
+
+@lru_cache(maxsize=None)
+def get_board_repository() -> BoardRepository:
+    """Crear el repositorio de boards en el primer uso"""
+    return BoardRepository()
+
+
+@lru_cache(maxsize=None)
+def get_course_repository() -> CourseRepository:
+    """Crear el repositorio de cursos en el primer uso"""
+    return CourseRepository()
+
+
+@lru_cache(maxsize=None)
+def get_instructor_repository() -> InstructorRepository:
+    """Crear el repositorio de instructores en el primer uso"""
+    return InstructorRepository()
+
+
+def apply_count_changes(
+        records: list,
+        parent_field: str,
+        consumer: str,
+        adjust: Callable[[str, List[Tuple[str, int]]], int]
+) -> dict:
+    """
+    Aplicar los cambios de contador de un lote del stream
+
+    Cada padre se actualiza por separado. Si uno falla se informa el primer
+    registro que lo afecta (ReportBatchItemFailures) y Lambda reintenta
+    desde ahí; los registros que ya se habían aplicado se descartan por
+    sus marcadores.
+
+    Returns:
+        Respuesta parcial del lote: {'batchItemFailures': [...]}
+    """
+    failed = []
+    for parent_id, changes in stream_count_changes(records, parent_field).items():
+        try:
+            adjust(parent_id, [(stream_marker(consumer, record, parent_id), change) for record, change in changes])
+        except Exception as e:
+            print(f"Error updating counter of {parent_id}: {e}")
+            failed.extend(record['dynamodb']['SequenceNumber'] for record, _ in changes)
+
+    if not failed:
+        return {'batchItemFailures': []}
+    return {'batchItemFailures': [{'itemIdentifier': min(failed, key=int)}]}
+
+
+def update_session_counts(event: dict, context: Any) -> dict:
+    """Mantener session_count de los cursos a partir del stream de sesiones"""
+    return apply_count_changes(
+        event.get('Records', []), 'course_id', SESSION_COUNT_CONSUMER, get_course_repository().adjust_session_count
+    )
+
+
+def update_course_counts(event: dict, context: Any) -> dict:
+    """Mantener course_count de los instructores a partir del stream de cursos"""
+    return apply_count_changes(
+        event.get('Records', []), 'instructor_id', COURSE_COUNT_CONSUMER,
+        get_instructor_repository().adjust_course_count
+    )
@@ -1,22 +1,31 @@
 import json
+from functools import lru_cache
 from typing import Any
 from models.course import Course
 from repositories.course_repository import CourseRepository
+from utils.pagination_helper import clamp_page_size
+from utils.request_helper import parse_json_body
 from utils.response_helper import (
     success_response,
     created_response,
     bad_request_response,
     not_found_response,
+    conditional_response,
+    entity_etag,
     server_error_response
 )
 
-repository = CourseRepository()
+
+@lru_cache(maxsize=None)
+def get_repository() -> CourseRepository:
+    """Crear el repositorio en el primer uso y reutilizarlo en el contenedor"""
+    return CourseRepository()
 
 
 def create_course(event: dict, context: Any) -> dict:
     """Crear un nuevo curso"""
     try:
-        body = json.loads(event.get('body', '{}'))
+        body = parse_json_body(event)
 
         course = Course(
             name=body.get('name'),
@@ -28,7 +37,7 @@ def create_course(event: dict, context: Any) -> dict:
         if not is_valid:
             return bad_request_response(error_message)
 
-        created_course = repository.create(course)
+        created_course = get_repository().create(course)
 
         return created_response(
             created_course.to_dict(),
@@ -49,12 +58,13 @@ def get_course(event: dict, context: Any) -> dict:
     try:
         course_id = event['pathParameters']['id']
 
-        course = repository.get_by_id(course_id)
+        course = get_repository().get_by_id(course_id)
 
         if not course:
             return not_found_response("Course not found")
 
-        return success_response(course.to_dict())
+        data = course.to_dict()
+        return conditional_response(event, data, entity_etag(data))
 
     except KeyError:
         return bad_request_response("Course ID is required")
@@ -67,15 +77,21 @@ def list_courses(event: dict, context: Any) -> dict:
     """Listar todos los cursos"""
     try:
         query_params = event.get('queryStringParameters') or {}
-        limit = int(query_params.get('limit', 50))
+        limit = clamp_page_size(query_params.get('limit'))
 
-        courses = repository.list_all(limit=limit)
+        courses, next_token = get_repository().list_all(
+            limit=limit,
+            next_token=query_params.get('next_token')
+        )
 
-        return success_response({
+        return conditional_response(event, {
             'courses': [course.to_dict() for course in courses],
-            'count': len(courses)
+            'count': len(courses),
+            'next_token': next_token
         })
 
+    except ValueError as e:
+        return bad_request_response(str(e))
     except Exception as e:
         print(f"Error listing courses: {e}")
         return server_error_response(f"Error listing courses: {str(e)}")
@@ -86,9 +102,9 @@ def get_courses_by_instructor(event: dict, context: Any) -> dict:
     try:
         instructor_id = event['pathParameters']['instructor_id']
 
-        courses = repository.get_by_instructor(instructor_id)
+        courses = get_repository().get_by_instructor(instructor_id)
 
-        return success_response({
+        return conditional_response(event, {
             'courses': [course.to_dict() for course in courses],
             'count': len(courses)
         })
@@ -104,11 +120,7 @@ def update_course(event: dict, context: Any) -> dict:
     """Actualizar un curso"""
     try:
         course_id = event['pathParameters']['id']
-        body = json.loads(event.get('body', '{}'))
-
-        existing_course = repository.get_by_id(course_id)
-        if not existing_course:
-            return not_found_response("Course not found")
+        body = parse_json_body(event)
 
         updates = {}
 
@@ -124,10 +136,10 @@ def update_course(event: dict, context: Any) -> dict:
         if not updates:
             return bad_request_response("No fields to update")
 
-        updated_course = repository.update(course_id, updates)
+        updated_course = get_repository().update(course_id, updates)
 
         if not updated_course:
-            return server_error_response("Failed to update course")
+            return not_found_response("Course not found")
 
         return success_response(
             updated_course.to_dict(),
@@ -150,7 +162,7 @@ def delete_course(event: dict, context: Any) -> dict:
     try:
         course_id = event['pathParameters']['id']
 
-        success = repository.delete(course_id)
+        success = get_repository().delete(course_id)
 
         if not success:
             return not_found_response("Course not found")
@@ -1,17 +1,26 @@
 import json
 import hashlib
+from functools import lru_cache
 from typing import Any
 from models.instructor import Instructor
 from repositories.instructor_repository import InstructorRepository
+from utils.pagination_helper import clamp_page_size
+from utils.request_helper import parse_json_body
 from utils.response_helper import (
     success_response,
     created_response,
     bad_request_response,
     not_found_response,
+    conditional_response,
+    entity_etag,
     server_error_response
 )
 
-repository = InstructorRepository()
+
+@lru_cache(maxsize=None)
+def get_repository() -> InstructorRepository:
+    """Crear el repositorio en el primer uso y reutilizarlo en el contenedor"""
+    return InstructorRepository()
 
 
 def hash_password(password: str) -> str:
@@ -22,7 +31,7 @@ def hash_password(password: str) -> str:
 def create_instructor(event: dict, context: Any) -> dict:
     """Crear un nuevo instructor"""
     try:
-        body = json.loads(event.get('body', '{}'))
+        body = parse_json_body(event)
 
         # Crear objeto Instructor
         instructor = Instructor(
@@ -38,12 +47,12 @@ def create_instructor(event: dict, context: Any) -> dict:
             return bad_request_response(error_message)
 
         # Verificar si el email ya existe
-        existing_instructor = repository.get_by_email(instructor.email)
+        existing_instructor = get_repository().get_by_email(instructor.email)
         if existing_instructor:
             return bad_request_response("Email already registered")
 
         # Crear instructor
-        created_instructor = repository.create(instructor)
+        created_instructor = get_repository().create(instructor)
 
         return created_response(
             created_instructor.to_dict(),
@@ -64,12 +73,13 @@ def get_instructor(event: dict, context: Any) -> dict:
     try:
         instructor_id = event['pathParameters']['id']
 
-        instructor = repository.get_by_id(instructor_id)
+        instructor = get_repository().get_by_id(instructor_id)
 
         if not instructor:
             return not_found_response("Instructor not found")
 
-        return success_response(instructor.to_dict())
+        data = instructor.to_dict()
+        return conditional_response(event, data, entity_etag(data))
 
     except KeyError:
         return bad_request_response("Instructor ID is required")
@@ -82,15 +92,21 @@ def list_instructors(event: dict, context: Any) -> dict:
     """Listar todos los instructores"""
     try:
         query_params = event.get('queryStringParameters') or {}
-        limit = int(query_params.get('limit', 50))
+        limit = clamp_page_size(query_params.get('limit'))
 
-        instructors = repository.list_all(limit=limit)
+        instructors, next_token = get_repository().list_all(
+            limit=limit,
+            next_token=query_params.get('next_token')
+        )
 
-        return success_response({
+        return conditional_response(event, {
             'instructors': [instructor.to_dict() for instructor in instructors],
-            'count': len(instructors)
+            'count': len(instructors),
+            'next_token': next_token
         })
 
+    except ValueError as e:
+        return bad_request_response(str(e))
     except Exception as e:
         print(f"Error listing instructors: {e}")
         return server_error_response(f"Error listing instructors: {str(e)}")
@@ -100,12 +116,7 @@ def update_instructor(event: dict, context: Any) -> dict:
     """Actualizar un instructor"""
     try:
         instructor_id = event['pathParameters']['id']
-        body = json.loads(event.get('body', '{}'))
-
-        # Verificar que el instructor existe
-        existing_instructor = repository.get_by_id(instructor_id)
-        if not existing_instructor:
-            return not_found_response("Instructor not found")
+        body = parse_json_body(event)
 
         # Preparar actualizaciones
         updates = {}
@@ -115,7 +126,7 @@ def update_instructor(event: dict, context: Any) -> dict:
 
         if 'email' in body:
             # Verificar que el nuevo email no esté en uso
-            email_instructor = repository.get_by_email(body['email'])
+            email_instructor = get_repository().get_by_email(body['email'])
             if email_instructor and email_instructor.id != instructor_id:
                 return bad_request_response("Email already in use")
             updates['email'] = body['email']
@@ -130,10 +141,10 @@ def update_instructor(event: dict, context: Any) -> dict:
             return bad_request_response("No fields to update")
 
         # Actualizar instructor
-        updated_instructor = repository.update(instructor_id, updates)
+        updated_instructor = get_repository().update(instructor_id, updates)
 
         if not updated_instructor:
-            return server_error_response("Failed to update instructor")
+            return not_found_response("Instructor not found")
 
         return success_response(
             updated_instructor.to_dict(),
@@ -156,7 +167,7 @@ def delete_instructor(event: dict, context: Any) -> dict:
     try:
         instructor_id = event['pathParameters']['id']
 
-        success = repository.delete(instructor_id)
+        success = get_repository().delete(instructor_id)
 
         if not success:
             return not_found_response("Instructor not found")
@@ -177,12 +188,13 @@ def get_instructor_by_email(event: dict, context: Any) -> dict:
     try:
         email = event['pathParameters']['email']
 
-        instructor = repository.get_by_email(email)
+        instructor = get_repository().get_by_email(email)
 
         if not instructor:
             return not_found_response("Instructor not found")
 
-        return success_response(instructor.to_dict())
+        data = instructor.to_dict()
+        return conditional_response(event, data, entity_etag(data))
 
     except KeyError:
         return bad_request_response("Email is required")
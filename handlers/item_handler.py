@@ -1,24 +1,83 @@
 import json
-from typing import Any
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Optional
 from models.item import Item
-from utils.item_repository import ItemRepository
+from repositories.board_repository import BoardRepository
+from repositories.item_repository import ItemRepository, VersionConflictError, position_seq
+from repositories.item_tombstone_repository import (
+    SYNC_SAFETY_WINDOW_SECONDS,
+    TOMBSTONE_TTL_SECONDS,
+    ItemTombstoneRepository,
+    sync_cursor
+)
 from utils.s3_helper import S3Helper
+from utils.pagination_helper import clamp_page_size
+from utils.spatial_helper import parse_bbox
+from utils.request_helper import parse_json_body
+from utils.aws_clients import get_sqs_client
+from utils.cache_helper import TTLCache
+from utils.json_helper import dumps
+from utils.write_buffer import CoalescingBuffer
 from utils.response_helper import (
+    create_response,
     success_response,
     created_response,
     bad_request_response,
     not_found_response,
+    conflict_response,
+    conditional_response,
+    collection_etag,
+    entity_etag,
+    etag_matches,
+    not_modified_response,
     server_error_response
 )
 
-repository = ItemRepository()
-s3_helper = S3Helper()
+MAX_BATCH_GET_IDS = 500
+MAX_BULK_CREATE_ITEMS = 500
+MAX_BULK_MOVE_ITEMS = 500
+# Intervalo mínimo entre dos posiciones encoladas de un mismo item en un
+# contenedor; las intermedias que llegan antes se descartan
+POSITION_QUEUE_INTERVAL_MS = int(os.environ.get('POSITION_QUEUE_INTERVAL_MS', 250))
+
+
+@lru_cache(maxsize=None)
+def get_repository() -> ItemRepository:
+    """Crear el repositorio en el primer uso y reutilizarlo en el contenedor"""
+    return ItemRepository()
+
+
+@lru_cache(maxsize=None)
+def get_tombstone_repository() -> ItemTombstoneRepository:
+    """Crear el repositorio de marcas de borrado en el primer uso"""
+    return ItemTombstoneRepository()
+
+
+@lru_cache(maxsize=None)
+def get_board_repository() -> BoardRepository:
+    """Crear el repositorio de boards en el primer uso"""
+    return BoardRepository()
+
+
+@lru_cache(maxsize=None)
+def get_position_throttle() -> TTLCache:
+    """Items con una posición encolada hace menos de POSITION_QUEUE_INTERVAL_MS en el contenedor"""
+    return TTLCache(ttl=POSITION_QUEUE_INTERVAL_MS / 1000)
+
+
+@lru_cache(maxsize=None)
+def get_s3_helper() -> S3Helper:
+    """Crear el helper de S3 solo cuando un handler lo necesita"""
+    return S3Helper()
 
 
 def create_item(event: dict, context: Any) -> dict:
     """Crear un nuevo item"""
     try:
-        body = json.loads(event.get('body', '{}'))
+        body = parse_json_body(event)
 
         item = Item(
             board_id=body.get('board_id'),
@@ -31,7 +90,7 @@ def create_item(event: dict, context: Any) -> dict:
         if not is_valid:
             return bad_request_response(error_message)
 
-        created_item = repository.create(item)
+        created_item = get_repository().create(item)
 
         return created_response(
             created_item.to_dict(),
@@ -47,17 +106,74 @@ def create_item(event: dict, context: Any) -> dict:
         return server_error_response(f"Error creating item: {str(e)}")
 
 
+def bulk_create_items(event: dict, context: Any) -> dict:
+    """Crear varios items en una sola solicitud"""
+    try:
+        body = parse_json_body(event)
+        payloads = body.get('items')
+
+        if not isinstance(payloads, list) or not payloads:
+            return bad_request_response("items must be a non-empty list")
+
+        if len(payloads) > MAX_BULK_CREATE_ITEMS:
+            return bad_request_response(f"A maximum of {MAX_BULK_CREATE_ITEMS} items is allowed")
+
+        # Validar todos los items antes de escribir
+        results = []
+        valid_items = []
+        for index, payload in enumerate(payloads):
+            try:
+                item = Item(
+                    board_id=payload.get('board_id'),
+                    x=float(payload.get('x', 0)),
+                    y=float(payload.get('y', 0)),
+                    document=payload.get('document')
+                )
+                is_valid, error_message = item.validate()
+            except (AttributeError, TypeError, ValueError):
+                is_valid, error_message = False, "Invalid item payload"
+
+            if is_valid:
+                valid_items.append((index, item))
+                results.append(None)
+            else:
+                results.append({'index': index, 'status': 'invalid', 'error': error_message})
+
+        outcomes = get_repository().create_many([item for _, item in valid_items]) if valid_items else []
+
+        for (index, item), created in zip(valid_items, outcomes):
+            if created:
+                results[index] = {'index': index, 'status': 'created', 'item': item.to_dict()}
+            else:
+                results[index] = {'index': index, 'status': 'failed', 'error': "Failed to create item"}
+
+        created_count = sum(1 for created in outcomes if created)
+
+        return created_response({
+            'results': results,
+            'created': created_count,
+            'failed': len(payloads) - created_count
+        }, "Items processed successfully")
+
+    except json.JSONDecodeError:
+        return bad_request_response("Invalid JSON in request body")
+    except Exception as e:
+        print(f"Error creating items in bulk: {e}")
+        return server_error_response(f"Error creating items in bulk: {str(e)}")
+
+
 def get_item(event: dict, context: Any) -> dict:
     """Obtener un item por ID"""
     try:
         item_id = event['pathParameters']['id']
 
-        item = repository.get_by_id(item_id)
+        item = get_repository().get_by_id(item_id)
 
         if not item:
             return not_found_response("Item not found")
 
-        return success_response(item.to_dict())
+        data = item.to_dict()
+        return conditional_response(event, data, entity_etag(data))
 
     except KeyError:
         return bad_request_response("Item ID is required")
@@ -66,38 +182,170 @@ def get_item(event: dict, context: Any) -> dict:
         return server_error_response(f"Error getting item: {str(e)}")
 
 
+def batch_get_items(event: dict, context: Any) -> dict:
+    """Obtener varios items por ID en una sola solicitud"""
+    try:
+        body = parse_json_body(event)
+        ids = body.get('ids')
+
+        if not isinstance(ids, list) or not ids:
+            return bad_request_response("ids must be a non-empty list")
+
+        if len(ids) > MAX_BATCH_GET_IDS:
+            return bad_request_response(f"A maximum of {MAX_BATCH_GET_IDS} ids is allowed")
+
+        if not all(isinstance(item_id, str) and item_id for item_id in ids):
+            return bad_request_response("Every id must be a non-empty string")
+
+        items = get_repository().get_many(ids)
+
+        return success_response({
+            'items': [item.to_dict() for item in items if item],
+            'not_found': [item_id for item_id, item in zip(ids, items) if not item],
+            'count': sum(1 for item in items if item)
+        }, event=event)
+
+    except json.JSONDecodeError:
+        return bad_request_response("Invalid JSON in request body")
+    except Exception as e:
+        print(f"Error getting items in batch: {e}")
+        return server_error_response(f"Error getting items in batch: {str(e)}")
+
+
 def list_items(event: dict, context: Any) -> dict:
     """Listar todos los items"""
     try:
         query_params = event.get('queryStringParameters') or {}
-        limit = int(query_params.get('limit', 50))
+        limit = clamp_page_size(query_params.get('limit'))
 
-        items = repository.list_all(limit=limit)
+        items, next_token = get_repository().list_all(
+            limit=limit,
+            next_token=query_params.get('next_token')
+        )
 
-        return success_response({
+        return conditional_response(event, {
             'items': [item.to_dict() for item in items],
-            'count': len(items)
+            'count': len(items),
+            'next_token': next_token
         })
 
+    except ValueError as e:
+        return bad_request_response(str(e))
     except Exception as e:
         print(f"Error listing items: {e}")
         return server_error_response(f"Error listing items: {str(e)}")
 
 
+def _parse_since(since: str) -> datetime:
+    try:
+        parsed = datetime.fromisoformat(since)
+    except ValueError:
+        raise ValueError("since must be an ISO 8601 timestamp")
+
+    # updated_at se guarda en UTC sin zona horaria
+    if parsed.tzinfo:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _get_item_changes(board_id: str, since: str) -> dict:
+    """Cambios de un board desde un cursor: items modificados e IDs eliminados"""
+    since_time = _parse_since(since)
+    now = datetime.utcnow()
+
+    if since_time < now - timedelta(seconds=TOMBSTONE_TTL_SECONDS):
+        raise ValueError("since is older than the change retention window, reload the full board")
+
+    since = since_time.isoformat()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        items_future = executor.submit(get_repository().get_changed_since, board_id, since)
+        deleted_future = executor.submit(get_tombstone_repository().get_since, board_id, since)
+        items = items_future.result()
+        deleted_ids = deleted_future.result()
+
+    # El cursor queda un poco atrás del reloj: el índice es eventualmente
+    # consistente y una marca de borrado se escribe hasta
+    # TOMBSTONE_MAX_WRITE_SECONDS después de su hora.
+    # Los clientes pueden recibir un cambio repetido, nunca perderlo.
+    cursor = max(since_time, now - timedelta(seconds=SYNC_SAFETY_WINDOW_SECONDS)).isoformat()
+
+    # Un item que salió del board y volvió está vigente: no se informa como eliminado
+    current_ids = {item.id for item in items}
+
+    return {
+        'items': [item.to_dict() for item in items],
+        'deleted': [item_id for item_id in deleted_ids if item_id not in current_ids],
+        'count': len(items),
+        'cursor': cursor
+    }
+
+
+def _board_items_version(board_id: str) -> Optional[list]:
+    """
+    Resumen de versión de los items de un board: último cambio y versión de items
+
+    Las altas y modificaciones quedan en BoardUpdatedIndex; los borrados y
+    los items que pasan a otro board incrementan items_version del board en
+    el mismo request (las marcas de borrado llegan por el stream segundos
+    después y no sirven para el ETag).
+
+    Returns:
+        None si alguna lectura falla; la respuesta se arma sin este atajo
+    """
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            updated_future = executor.submit(get_repository().get_last_updated_at, board_id)
+            version_future = executor.submit(get_board_repository().get_items_version, board_id)
+            return [updated_future.result(), version_future.result()]
+    except Exception as e:
+        print(f"Error reading items version of board {board_id}: {e}")
+        return None
+
+
 def get_items_by_board(event: dict, context: Any) -> dict:
-    """Obtener items por board"""
+    """
+    Obtener items por board
+
+    Con bbox=x0,y0,x1,y1 solo devuelve los items del viewport. Con since=<cursor>
+    devuelve solo los items creados o modificados y los IDs eliminados
+    después del cursor. Todas las respuestas incluyen el cursor para la
+    siguiente consulta incremental.
+    """
     try:
         board_id = event['pathParameters']['board_id']
+        query_params = event.get('queryStringParameters') or {}
 
-        items = repository.get_by_board(board_id)
-
-        return success_response({
-            'items': [item.to_dict() for item in items],
-            'count': len(items)
-        })
+        if query_params.get('since'):
+            return success_response(_get_item_changes(board_id, query_params['since']), event=event)
+
+        bbox = parse_bbox(query_params['bbox']) if query_params.get('bbox') else None
+
+        # La versión se lee antes que los items: si cambia en medio, el ETag
+        # queda desactualizado y el cliente vuelve a pedir, nunca al revés.
+        # Sin versión, conditional_response calcula el ETag del contenido
+        version = _board_items_version(board_id)
+        etag = collection_etag(board_id, bbox, version) if version is not None else None
+        if etag and etag_matches(event, etag):
+            return not_modified_response(etag, event)
+
+        # Antes de leer: un cambio durante la lectura vuelve en el próximo since
+        cursor = sync_cursor()
+        if bbox:
+            items = [item.to_dict() for item in get_repository().get_by_viewport(board_id, bbox)]
+        else:
+            # El board completo se serializa desde los dicts de DynamoDB sin pasar por Item
+            items = list(get_repository().iter_records_by_board(board_id))
+
+        return conditional_response(event, {
+            'items': items,
+            'count': len(items),
+            'cursor': cursor
+        }, etag)
 
     except KeyError:
         return bad_request_response("Board ID is required")
+    except ValueError as e:
+        return bad_request_response(str(e))
     except Exception as e:
         print(f"Error getting items by board: {e}")
         return server_error_response(f"Error getting items by board: {str(e)}")
@@ -107,11 +355,7 @@ def update_item(event: dict, context: Any) -> dict:
     """Actualizar un item"""
     try:
         item_id = event['pathParameters']['id']
-        body = json.loads(event.get('body', '{}'))
-
-        existing_item = repository.get_by_id(item_id)
-        if not existing_item:
-            return not_found_response("Item not found")
+        body = parse_json_body(event)
 
         updates = {}
 
@@ -130,10 +374,18 @@ def update_item(event: dict, context: Any) -> dict:
         if not updates:
             return bad_request_response("No fields to update")
 
-        updated_item = repository.update(item_id, updates)
+        expected_version = int(body['version']) if body.get('version') is not None else None
+
+        # El board anterior pierde el item: su versión de items debe cambiar
+        previous = get_repository().get_by_id(item_id) if 'board_id' in updates else None
+
+        updated_item = get_repository().update(item_id, updates, expected_version)
 
         if not updated_item:
-            return server_error_response("Failed to update item")
+            return not_found_response("Item not found")
+
+        if previous and previous.board_id != updated_item.board_id:
+            get_board_repository().bump_items_version(previous.board_id)
 
         return success_response(
             updated_item.to_dict(),
@@ -144,6 +396,8 @@ def update_item(event: dict, context: Any) -> dict:
         return bad_request_response("Invalid JSON in request body")
     except KeyError:
         return bad_request_response("Item ID is required")
+    except VersionConflictError as e:
+        return conflict_response(str(e))
     except ValueError as e:
         return bad_request_response(str(e))
     except Exception as e:
@@ -151,24 +405,163 @@ def update_item(event: dict, context: Any) -> dict:
         return server_error_response(f"Error updating item: {str(e)}")
 
 
-def delete_item(event: dict, context: Any) -> dict:
-    """Eliminar un item y su documento de S3"""
+def update_item_position(event: dict, context: Any) -> dict:
+    """
+    Actualizar la posición de un item mientras se arrastra
+
+    Las posiciones intermedias se muestrean: se encola en SQS a lo sumo una
+    cada POSITION_QUEUE_INTERVAL_MS por item y contenedor, y las demás se
+    descartan sin escribir (la siguiente o la final las reemplaza). Con
+    'final': true (al soltar el item) la posición se escribe de inmediato
+    en la tabla. En ambos casos la secuencia es la de recepción en el
+    servidor, así una posición encolada que se aplique tarde no pisa una
+    escritura posterior.
+    """
     try:
         item_id = event['pathParameters']['id']
+        body = parse_json_body(event)
+
+        try:
+            position = {'id': item_id, 'x': float(body['x']), 'y': float(body['y']), 'seq': position_seq()}
+        except (KeyError, TypeError, ValueError):
+            return bad_request_response("x and y are required numbers")
+
+        if not body.get('final'):
+            throttle = get_position_throttle()
+            if throttle.get(item_id) is not None:
+                return create_response(202, {'id': item_id, 'status': 'skipped'}, "Position skipped")
+            throttle.set(item_id, position['seq'])
+            get_sqs_client().send_message(QueueUrl=os.environ['POSITIONS_QUEUE_URL'], MessageBody=dumps(position))
+            return create_response(202, {'id': item_id, 'status': 'queued'}, "Position queued")
+
+        status = get_repository().set_positions([position])[item_id]
+        if status == 'not_found':
+            return not_found_response("Item not found")
+        if status == 'failed':
+            return server_error_response("Error saving item position")
+
+        return success_response({'id': item_id, 'status': status}, "Position saved")
+
+    except KeyError:
+        return bad_request_response("Item ID is required")
+    except json.JSONDecodeError:
+        return bad_request_response("Invalid JSON in request body")
+    except Exception as e:
+        print(f"Error updating item position: {e}")
+        return server_error_response(f"Error updating item position: {str(e)}")
+
+
+def apply_queued_positions(event: dict, context: Any) -> dict:
+    """
+    Escribir las posiciones encoladas por update_item_position
+
+    Del lote solo se escribe la última posición de cada item, con un update
+    condicional por item (ver ItemRepository.set_positions). Los mensajes
+    de los items que no se pudieron escribir se devuelven como fallidos
+    (ReportBatchItemFailures) para que SQS los reintente; los descartados
+    por secuencia o por item inexistente se dan por procesados.
+    """
+    message_ids = {}
+    buffer = CoalescingBuffer(get_repository().set_positions)
+
+    for message in event.get('Records', []):
+        position = json.loads(message['body'])
+        message_ids.setdefault(position['id'], []).append(message['messageId'])
+        buffer.add(position['id'], position)
+
+    statuses = buffer.flush() or {}
+    failed = [item_id for item_id, status in statuses.items() if status == 'failed']
+
+    return {'batchItemFailures': [
+        {'itemIdentifier': message_id} for item_id in failed for message_id in message_ids[item_id]
+    ]}
 
-        # Obtener el item para eliminar el documento de S3
-        item = repository.get_by_id(item_id)
-        if item:
-            # Intentar eliminar el documento de S3
-            key = s3_helper.get_object_key_from_url(item.document)
-            if key:
-                s3_helper.delete_object(key)
 
-        success = repository.delete(item_id)
+def _parse_move(payload: Any) -> dict:
+    if not isinstance(payload, dict) or not isinstance(payload.get('id'), str) or not payload['id']:
+        raise ValueError("Every move must have a non-empty string id")
+    try:
+        move = {'id': payload['id'], 'x': float(payload['x']), 'y': float(payload['y'])}
+        if payload.get('version') is not None:
+            move['version'] = int(payload['version'])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError(f"Invalid move for item {payload['id']}: x and y are required numbers")
+    return move
+
+
+def move_items(event: dict, context: Any) -> dict:
+    """
+    Mover varios items en una sola solicitud
+
+    Body: {'items': [{'id', 'x', 'y', 'version'?}], 'atomic': bool}. Sin
+    atomic, cada item se actualiza por separado en paralelo; con atomic se
+    usan transacciones de hasta 100 items.
+    """
+    try:
+        body = parse_json_body(event)
+        payloads = body.get('items')
+
+        if not isinstance(payloads, list) or not payloads:
+            return bad_request_response("items must be a non-empty list")
+
+        if len(payloads) > MAX_BULK_MOVE_ITEMS:
+            return bad_request_response(f"A maximum of {MAX_BULK_MOVE_ITEMS} items is allowed")
+
+        moves = [_parse_move(payload) for payload in payloads]
+
+        if len({move['id'] for move in moves}) != len(moves):
+            return bad_request_response("Each item can only be moved once per request")
 
-        if not success:
+        if body.get('atomic'):
+            results = [
+                {'id': move['id'], 'status': status}
+                for move, status in zip(moves, get_repository().move_many_atomic(moves))
+            ]
+        else:
+            results = []
+            for move, (status, item) in zip(moves, get_repository().move_many(moves)):
+                result = {'id': move['id'], 'status': status}
+                if item:
+                    result['item'] = item.to_dict()
+                results.append(result)
+
+        moved_count = sum(1 for result in results if result['status'] == 'moved')
+
+        return success_response({
+            'results': results,
+            'moved': moved_count,
+            'failed': len(results) - moved_count
+        }, "Items moved successfully", event=event)
+
+    except json.JSONDecodeError:
+        return bad_request_response("Invalid JSON in request body")
+    except ValueError as e:
+        return bad_request_response(str(e))
+    except Exception as e:
+        print(f"Error moving items: {e}")
+        return server_error_response(f"Error moving items: {str(e)}")
+
+
+def delete_item(event: dict, context: Any) -> dict:
+    """
+    Eliminar un item
+
+    El documento de S3 se elimina de forma diferida: el stream de la tabla
+    de items dispara change_handler.handle_item_changes con el item
+    eliminado, así la respuesta solo espera el delete de DynamoDB y el
+    incremento de la versión de items del board (después del borrado, así
+    un GET concurrente nunca asocia la versión nueva al item eliminado).
+    """
+    try:
+        item_id = event['pathParameters']['id']
+
+        deleted_item = get_repository().delete(item_id)
+
+        if not deleted_item:
             return not_found_response("Item not found")
 
+        get_board_repository().bump_items_version(deleted_item.board_id)
+
         return success_response(
             message="Item deleted successfully"
         )
@@ -183,7 +576,7 @@ def delete_item(event: dict, context: Any) -> dict:
 def get_upload_url(event: dict, context: Any) -> dict:
     """Obtener URL pre-firmada para subir un documento a S3"""
     try:
-        body = json.loads(event.get('body', '{}'))
+        body = parse_json_body(event)
 
         file_name = body.get('file_name')
         content_type = body.get('content_type', 'application/octet-stream')
@@ -191,7 +584,7 @@ def get_upload_url(event: dict, context: Any) -> dict:
         if not file_name:
             return bad_request_response("file_name is required")
 
-        result = s3_helper.generate_presigned_upload_url(
+        result = get_s3_helper().generate_presigned_upload_url(
             file_name=file_name,
             content_type=content_type
         )
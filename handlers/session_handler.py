@@ -1,22 +1,31 @@
 import json
+from functools import lru_cache
 from typing import Any
 from models.session import Session
 from repositories.session_repository import SessionRepository
+from utils.pagination_helper import clamp_page_size
+from utils.request_helper import parse_json_body
 from utils.response_helper import (
     success_response,
     created_response,
     bad_request_response,
     not_found_response,
+    conditional_response,
+    entity_etag,
     server_error_response
 )
 
-repository = SessionRepository()
+
+@lru_cache(maxsize=None)
+def get_repository() -> SessionRepository:
+    """Crear el repositorio en el primer uso y reutilizarlo en el contenedor"""
+    return SessionRepository()
 
 
 def create_session(event: dict, context: Any) -> dict:
     """Crear una nueva sesión"""
     try:
-        body = json.loads(event.get('body', '{}'))
+        body = parse_json_body(event)
 
         session = Session(
             course_id=body.get('course_id'),
@@ -29,7 +38,7 @@ def create_session(event: dict, context: Any) -> dict:
         if not is_valid:
             return bad_request_response(error_message)
 
-        created_session = repository.create(session)
+        created_session = get_repository().create(session)
 
         return created_response(
             created_session.to_dict(),
@@ -50,12 +59,13 @@ def get_session(event: dict, context: Any) -> dict:
     try:
         session_id = event['pathParameters']['id']
 
-        session = repository.get_by_id(session_id)
+        session = get_repository().get_by_id(session_id)
 
         if not session:
             return not_found_response("Session not found")
 
-        return success_response(session.to_dict())
+        data = session.to_dict()
+        return conditional_response(event, data, entity_etag(data))
 
     except KeyError:
         return bad_request_response("Session ID is required")
@@ -68,15 +78,21 @@ def list_sessions(event: dict, context: Any) -> dict:
     """Listar todas las sesiones"""
     try:
         query_params = event.get('queryStringParameters') or {}
-        limit = int(query_params.get('limit', 50))
+        limit = clamp_page_size(query_params.get('limit'))
 
-        sessions = repository.list_all(limit=limit)
+        sessions, next_token = get_repository().list_all(
+            limit=limit,
+            next_token=query_params.get('next_token')
+        )
 
-        return success_response({
+        return conditional_response(event, {
             'sessions': [session.to_dict() for session in sessions],
-            'count': len(sessions)
+            'count': len(sessions),
+            'next_token': next_token
         })
 
+    except ValueError as e:
+        return bad_request_response(str(e))
     except Exception as e:
         print(f"Error listing sessions: {e}")
         return server_error_response(f"Error listing sessions: {str(e)}")
@@ -87,9 +103,9 @@ def get_sessions_by_course(event: dict, context: Any) -> dict:
     try:
         course_id = event['pathParameters']['course_id']
 
-        sessions = repository.get_by_course(course_id)
+        sessions = get_repository().get_by_course(course_id)
 
-        return success_response({
+        return conditional_response(event, {
             'sessions': [session.to_dict() for session in sessions],
             'count': len(sessions)
         })
@@ -106,9 +122,9 @@ def get_sessions_by_board(event: dict, context: Any) -> dict:
     try:
         board_id = event['pathParameters']['board_id']
 
-        sessions = repository.get_by_board(board_id)
+        sessions = get_repository().get_by_board(board_id)
 
-        return success_response({
+        return conditional_response(event, {
             'sessions': [session.to_dict() for session in sessions],
             'count': len(sessions)
         })
@@ -124,11 +140,7 @@ def update_session(event: dict, context: Any) -> dict:
     """Actualizar una sesión"""
     try:
         session_id = event['pathParameters']['id']
-        body = json.loads(event.get('body', '{}'))
-
-        existing_session = repository.get_by_id(session_id)
-        if not existing_session:
-            return not_found_response("Session not found")
+        body = parse_json_body(event)
 
         updates = {}
 
@@ -147,10 +159,10 @@ def update_session(event: dict, context: Any) -> dict:
         if not updates:
             return bad_request_response("No fields to update")
 
-        updated_session = repository.update(session_id, updates)
+        updated_session = get_repository().update(session_id, updates)
 
         if not updated_session:
-            return server_error_response("Failed to update session")
+            return not_found_response("Session not found")
 
         return success_response(
             updated_session.to_dict(),
@@ -173,7 +185,7 @@ def delete_session(event: dict, context: Any) -> dict:
     try:
         session_id = event['pathParameters']['id']
 
-        success = repository.delete(session_id)
+        success = get_repository().delete(session_id)
 
         if not success:
             return not_found_response("Session not found")
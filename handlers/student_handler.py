@@ -1,12 +1,36 @@
 import hashlib
 import json
+import os
+from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from models.student import Student
-from utils.response_helper import (bad_request_response, created_response, not_found_response, server_error_response, success_response)
+from utils.cache_helper import TTLCache
+from utils.pagination_helper import clamp_page_size
+from utils.request_helper import parse_json_body
+from utils.response_helper import (bad_request_response, conditional_response, created_response, entity_etag, not_found_response, server_error_response, success_response)
 from repositories.student_repository import StudentRepository
+from utils.score_analytics import collect_scores, score_stats
 
-repository = StudentRepository()
+# Las estadísticas recorren toda la tabla: cada contenedor las recalcula a
+# lo sumo una vez por minuto, y solo si alguien las pide
+STUDENT_STATS_CACHE_TTL = float(os.environ.get('STUDENT_STATS_CACHE_TTL', 60))
+
+DEFAULT_LEADERBOARD_SIZE = 10
+MAX_LEADERBOARD_SIZE = 100
+
+
+@lru_cache(maxsize=None)
+def get_repository() -> StudentRepository:
+    """Crear el repositorio en el primer uso y reutilizarlo en el contenedor"""
+    return StudentRepository()
+
+
+@lru_cache(maxsize=None)
+def get_stats_cache() -> TTLCache:
+    """Cache de las estadísticas de puntajes del contenedor"""
+    return TTLCache(ttl=STUDENT_STATS_CACHE_TTL, maxsize=1)
 
 
 def hash_password(password: str) -> str:
@@ -17,7 +41,7 @@ def hash_password(password: str) -> str:
 def create_student(event: dict, context: Any) -> dict:
     """Crear un nuevo estudiante"""
     try:
-        body = json.loads(event.get('body', '{}'))
+        body = parse_json_body(event)
 
         # Crear objeto Student
         student = Student(
@@ -34,12 +58,12 @@ def create_student(event: dict, context: Any) -> dict:
             return bad_request_response(error_message)
 
         # Verificar si el email ya existe
-        existing_student = repository.get_by_email(student.email)
+        existing_student = get_repository().get_by_email(student.email)
         if existing_student:
             return bad_request_response("Email already registered")
 
         # Crear estudiante
-        created_student = repository.create(student)
+        created_student = get_repository().create(student)
 
         return created_response(
             created_student.to_dict(),
@@ -60,12 +84,13 @@ def get_student(event: dict, context: Any) -> dict:
     try:
         student_id = event['pathParameters']['id']
 
-        student = repository.get_by_id(student_id)
+        student = get_repository().get_by_id(student_id)
 
         if not student:
             return not_found_response("Student not found")
 
-        return success_response(student.to_dict())
+        data = student.to_dict()
+        return conditional_response(event, data, entity_etag(data))
 
     except KeyError:
         return bad_request_response("Student ID is required")
@@ -78,15 +103,21 @@ def list_students(event: dict, context: Any) -> dict:
     """Listar todos los estudiantes"""
     try:
         query_params = event.get('queryStringParameters') or {}
-        limit = int(query_params.get('limit', 50))
+        limit = clamp_page_size(query_params.get('limit'))
 
-        students = repository.list_all(limit=limit)
+        students, next_token = get_repository().list_all(
+            limit=limit,
+            next_token=query_params.get('next_token')
+        )
 
-        return success_response({
+        return conditional_response(event, {
             'students': [student.to_dict() for student in students],
-            'count': len(students)
+            'count': len(students),
+            'next_token': next_token
         })
 
+    except ValueError as e:
+        return bad_request_response(str(e))
     except Exception as e:
         print(f"Error listing students: {e}")
         return server_error_response(f"Error listing students: {str(e)}")
@@ -96,12 +127,7 @@ def update_student(event: dict, context: Any) -> dict:
     """Actualizar un estudiante"""
     try:
         student_id = event['pathParameters']['id']
-        body = json.loads(event.get('body', '{}'))
-
-        # Verificar que el estudiante existe
-        existing_student = repository.get_by_id(student_id)
-        if not existing_student:
-            return not_found_response("Student not found")
+        body = parse_json_body(event)
 
         # Preparar actualizaciones
         updates = {}
@@ -111,7 +137,7 @@ def update_student(event: dict, context: Any) -> dict:
 
         if 'email' in body:
             # Verificar que el nuevo email no esté en uso
-            email_student = repository.get_by_email(body['email'])
+            email_student = get_repository().get_by_email(body['email'])
             if email_student and email_student.id != student_id:
                 return bad_request_response("Email already in use")
             updates['email'] = body['email']
@@ -132,10 +158,10 @@ def update_student(event: dict, context: Any) -> dict:
             return bad_request_response("No fields to update")
 
         # Actualizar estudiante
-        updated_student = repository.update(student_id, updates)
+        updated_student = get_repository().update(student_id, updates)
 
         if not updated_student:
-            return server_error_response("Failed to update student")
+            return not_found_response("Student not found")
 
         return success_response(
             updated_student.to_dict(),
@@ -158,7 +184,7 @@ def delete_student(event: dict, context: Any) -> dict:
     try:
         student_id = event['pathParameters']['id']
 
-        success = repository.delete(student_id)
+        success = get_repository().delete(student_id)
 
         if not success:
             return not_found_response("Student not found")
@@ -179,15 +205,62 @@ def get_student_by_email(event: dict, context: Any) -> dict:
     try:
         email = event['pathParameters']['email']
 
-        student = repository.get_by_email(email)
+        student = get_repository().get_by_email(email)
 
         if not student:
             return not_found_response("Student not found")
 
-        return success_response(student.to_dict())
+        data = student.to_dict()
+        return conditional_response(event, data, entity_etag(data))
 
     except KeyError:
         return bad_request_response("Email is required")
     except Exception as e:
         print(f"Error getting student by email: {e}")
         return server_error_response(f"Error getting student by email: {str(e)}")
+
+
+def get_score_stats(event: dict, context: Any) -> dict:
+    """
+    Obtener estadísticas de puntajes de todos los estudiantes
+
+    Se calculan al primer pedido con un scan paralelo que proyecta solo
+    score y active, y se guardan en cache durante STUDENT_STATS_CACHE_TTL
+    segundos ('computed_at' indica cuándo se calcularon).
+    """
+    try:
+        stats = get_stats_cache().get('scores')
+        if stats is None:
+            scores, actives = collect_scores(get_repository().iter_scores())
+            stats = dict(score_stats(scores, actives), computed_at=datetime.utcnow().isoformat())
+            get_stats_cache().set('scores', stats)
+
+        return conditional_response(event, stats)
+
+    except Exception as e:
+        print(f"Error getting score stats: {e}")
+        return server_error_response(f"Error getting score stats: {str(e)}")
+
+
+def get_top_students(event: dict, context: Any) -> dict:
+    """Obtener el ranking de los N estudiantes activos con mayor puntaje"""
+    try:
+        query_params = event.get('queryStringParameters') or {}
+        try:
+            n = int(query_params.get('n', DEFAULT_LEADERBOARD_SIZE))
+        except (TypeError, ValueError):
+            return bad_request_response("n must be an integer")
+
+        if n < 1 or n > MAX_LEADERBOARD_SIZE:
+            return bad_request_response(f"n must be between 1 and {MAX_LEADERBOARD_SIZE}")
+
+        students = get_repository().get_top(n)
+
+        return conditional_response(event, {
+            'students': [dict(student, rank=rank) for rank, student in enumerate(students, start=1)],
+            'count': len(students)
+        })
+
+    except Exception as e:
+        print(f"Error getting top students: {e}")
+        return server_error_response(f"Error getting top students: {str(e)}")
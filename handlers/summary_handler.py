@@ -0,0 +1,154 @@
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from repositories.board_summary_repository import BoardSummaryRepository
+from repositories.item_repository import ItemRepository
+from utils.dynamodb_helper import from_stream_image
+from utils.idempotency_helper import stream_marker
+from utils.lod_helper import ZOOM_LEVEL_CELL_SIZES, build_levels, cell_bbox, cell_key
+from utils.response_helper import (
+    success_response,
+    bad_request_response,
+    conditional_response,
+    server_error_response
+)
+
+# Nombre de este consumidor en los marcadores de registros aplicados
+SUMMARY_CONSUMER = 'board-summaries'
+
+
+@lru_cache(maxsize=None)
+def get_repository() -> BoardSummaryRepository:
+    """Crear el repositorio en el primer uso y reutilizarlo en el contenedor"""
+    return BoardSummaryRepository()
+
+
+@lru_cache(maxsize=None)
+def get_item_repository() -> ItemRepository:
+    """Crear el repositorio de items en el primer uso"""
+    return ItemRepository()
+
+
+def _parse_level(query_params: dict) -> int:
+    try:
+        level = int(query_params.get('level', 0))
+    except (TypeError, ValueError):
+        raise ValueError("level must be an integer")
+
+    if level < 0 or level >= len(ZOOM_LEVEL_CELL_SIZES):
+        raise ValueError(f"level must be between 0 and {len(ZOOM_LEVEL_CELL_SIZES) - 1}")
+    return level
+
+
+def get_board_summary(event: dict, context: Any) -> dict:
+    """Obtener la grilla resumida de un board para un nivel de zoom"""
+    try:
+        board_id = event['pathParameters']['id']
+        level = _parse_level(event.get('queryStringParameters') or {})
+
+        cells = get_repository().get_level(board_id, level)
+
+        return conditional_response(event, {
+            'board_id': board_id,
+            'level': level,
+            'cell_size': ZOOM_LEVEL_CELL_SIZES[level],
+            'cells': [cell.to_dict() for cell in cells],
+            'count': len(cells)
+        })
+
+    except KeyError:
+        return bad_request_response("Board ID is required")
+    except ValueError as e:
+        return bad_request_response(str(e))
+    except Exception as e:
+        print(f"Error getting board summary: {e}")
+        return server_error_response(f"Error getting board summary: {str(e)}")
+
+
+def refresh_board_summary(event: dict, context: Any) -> dict:
+    """Recalcular todos los niveles de zoom de un board desde sus items"""
+    try:
+        board_id = event['pathParameters']['id']
+
+        ids, xs, ys = [], [], []
+        for item in get_item_repository().iter_by_board(board_id):
+            ids.append(item.id)
+            xs.append(item.x)
+            ys.append(item.y)
+
+        levels = build_levels(ids, xs, ys)
+        for level, cells in enumerate(levels):
+            get_repository().replace_level(board_id, level, cells)
+
+        return success_response({
+            'board_id': board_id,
+            'item_count': len(ids),
+            'levels': [
+                {'level': level, 'cell_size': ZOOM_LEVEL_CELL_SIZES[level], 'cells': len(cells)}
+                for level, cells in enumerate(levels)
+            ]
+        }, "Board summary refreshed successfully")
+
+    except KeyError:
+        return bad_request_response("Board ID is required")
+    except Exception as e:
+        print(f"Error refreshing board summary: {e}")
+        return server_error_response(f"Error refreshing board summary: {str(e)}")
+
+
+def _item_cells(image: Optional[dict]) -> list:
+    if not image or not image.get('board_id'):
+        return []
+    x, y = float(image.get('x', 0)), float(image.get('y', 0))
+    return [(image['board_id'], level, cell_key(x, y, cell_size))
+            for level, cell_size in enumerate(ZOOM_LEVEL_CELL_SIZES)]
+
+
+def _refill_cell(key: tuple, limit: int, exclude: set) -> List[str]:
+    """Otros items de una celda, para completar sus representativos"""
+    board_id, level, cell = key
+    cell_size = ZOOM_LEVEL_CELL_SIZES[level]
+    items = get_item_repository().sample_by_area(
+        board_id,
+        cell_bbox(cell, cell_size),
+        limit,
+        accept=lambda item: item.id not in exclude and cell_key(item.x, item.y, cell_size) == cell
+    )
+    return [item.id for item in items]
+
+
+def update_board_summaries(event: dict, context: Any) -> dict:
+    """
+    Mantener las grillas de resumen de los boards a partir del stream de items
+
+    Los cambios del lote se agrupan por celda, así un lote con muchos
+    movimientos en la misma celda cuesta una sola escritura del conteo.
+    Cada registro deja un marcador por celda para que un lote reintentado
+    no vuelva a sumarse.
+    """
+    changes: Dict[tuple, list] = defaultdict(list)
+
+    for record in event.get('Records', []):
+        images = record.get('dynamodb', {})
+        old_item = from_stream_image(images.get('OldImage'))
+        new_item = from_stream_image(images.get('NewImage'))
+
+        old_cells = _item_cells(old_item)
+        new_cells = _item_cells(new_item)
+
+        for level in range(len(ZOOM_LEVEL_CELL_SIZES)):
+            old_cell = old_cells[level] if old_cells else None
+            new_cell = new_cells[level] if new_cells else None
+            if old_cell == new_cell:
+                continue
+            if old_cell:
+                marker = stream_marker(SUMMARY_CONSUMER, record, '#'.join(map(str, old_cell)))
+                changes[old_cell].append((marker, (old_item['id'], -1)))
+            if new_cell:
+                marker = stream_marker(SUMMARY_CONSUMER, record, '#'.join(map(str, new_cell)))
+                changes[new_cell].append((marker, (new_item['id'], 1)))
+
+    get_repository().apply_changes(changes, _refill_cell)
+
+    return {'cells_updated': len(changes)}
@@ -0,0 +1,45 @@
+from typing import Any
+
+from utils.change_publisher import get_publisher
+from utils.response_helper import (
+    success_response,
+    bad_request_response,
+    server_error_response
+)
+
+
+def connect(event: dict, context: Any) -> dict:
+    """
+    Suscribir una conexión WebSocket a los cambios de un board
+
+    El board se indica en la URL de conexión: wss://...?board_id=<id>
+    """
+    try:
+        connection_id = event['requestContext']['connectionId']
+        board_id = (event.get('queryStringParameters') or {}).get('board_id')
+
+        if not board_id:
+            return bad_request_response("board_id query parameter is required")
+
+        get_publisher().registry.add(connection_id, board_id)
+
+        return success_response(message="Connected")
+
+    except KeyError:
+        return bad_request_response("Connection ID is required")
+    except Exception as e:
+        print(f"Error connecting: {e}")
+        return server_error_response(f"Error connecting: {str(e)}")
+
+
+def disconnect(event: dict, context: Any) -> dict:
+    """Eliminar la suscripción de una conexión cerrada"""
+    try:
+        get_publisher().registry.remove(event['requestContext']['connectionId'])
+        return success_response(message="Disconnected")
+
+    except KeyError:
+        return bad_request_response("Connection ID is required")
+    except Exception as e:
+        print(f"Error disconnecting: {e}")
+        return server_error_response(f"Error disconnecting: {str(e)}")
@@ -4,19 +4,25 @@ import uuid
 
 
 class Board:
+    __slots__ = ('id', 'title', 'active', 'created_at', 'updated_at', 'item_count')
+
     def __init__(
             self,
             title: str,
             active: bool = True,
             id: Optional[str] = None,
             created_at: Optional[str] = None,
-            updated_at: Optional[str] = None
+            updated_at: Optional[str] = None,
+            item_count: int = 0
     ):
         self.id = id or str(uuid.uuid4())
         self.title = title
         self.active = active
-        self.created_at = created_at or datetime.utcnow().isoformat()
-        self.updated_at = updated_at or datetime.utcnow().isoformat()
+        # Un único timestamp por construcción, solo si falta alguno
+        now = None if created_at and updated_at else datetime.utcnow().isoformat()
+        self.created_at = created_at or now
+        self.updated_at = updated_at or now
+        self.item_count = item_count  # Cantidad de items (mantenida por el stream de items)
 
     def to_dict(self) -> dict:
         """Convertir el board a diccionario"""
@@ -25,19 +31,21 @@ class Board:
             'title': self.title,
             'active': self.active,
             'created_at': self.created_at,
-            'updated_at': self.updated_at
+            'updated_at': self.updated_at,
+            'item_count': self.item_count
         }
 
     @staticmethod
     def from_dict(data: dict) -> 'Board':
-        """Crear un objeto Board desde un diccionario"""
-        return Board(
-            id=data.get('id'),
-            title=data.get('title'),
-            active=data.get('active', True),
-            created_at=data.get('created_at'),
-            updated_at=data.get('updated_at')
-        )
+        """Crear un objeto Board desde una fila guardada, sin generar valores por defecto"""
+        board = Board.__new__(Board)
+        board.id = data.get('id')
+        board.title = data.get('title')
+        board.active = data.get('active', True)
+        board.created_at = data.get('created_at')
+        board.updated_at = data.get('updated_at')
+        board.item_count = int(data.get('item_count', 0))
+        return board
 
     def validate(self) -> tuple[bool, Optional[str]]:
         """Validar los datos del board"""
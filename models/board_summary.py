@@ -0,0 +1,45 @@
+from typing import List, Optional
+
+
+class BoardSummaryCell:
+    def __init__(
+            self,
+            board_id: str,
+            level: int,
+            cell: str,
+            count: int = 0,
+            item_ids: Optional[List[str]] = None
+    ):
+        self.board_id = board_id
+        self.level = level
+        self.cell = cell  # "<columna>#<fila>" en la grilla del nivel
+        self.count = count
+        self.item_ids = item_ids or []  # Items representativos de la celda
+
+    @staticmethod
+    def partition_key(board_id: str, level: int) -> str:
+        """Clave de partición de un nivel de zoom de un board"""
+        return f"{board_id}#{level}"
+
+    def to_dict(self) -> dict:
+        """Convertir la celda a diccionario"""
+        column, row = self.cell.split('#')
+        return {
+            'cell': self.cell,
+            'column': int(column),
+            'row': int(row),
+            'count': self.count,
+            'item_ids': self.item_ids
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> 'BoardSummaryCell':
+        """Crear una celda desde un item de DynamoDB"""
+        board_id, level = data.get('board_level', '#0').rsplit('#', 1)
+        return BoardSummaryCell(
+            board_id=board_id,
+            level=int(level),
+            cell=data.get('cell'),
+            count=int(data.get('count', 0)),
+            item_ids=sorted(data.get('item_ids', []))
+        )
@@ -4,6 +4,8 @@ import uuid
 
 
 class Course:
+    __slots__ = ('id', 'name', 'instructor_id', 'active', 'created_at', 'updated_at', 'session_count')
+
     def __init__(
             self,
             name: str,
@@ -11,14 +13,18 @@ class Course:
             active: bool = True,
             id: Optional[str] = None,
             created_at: Optional[str] = None,
-            updated_at: Optional[str] = None
+            updated_at: Optional[str] = None,
+            session_count: int = 0
     ):
         self.id = id or str(uuid.uuid4())
         self.name = name
         self.instructor_id = instructor_id
         self.active = active
-        self.created_at = created_at or datetime.utcnow().isoformat()
-        self.updated_at = updated_at or datetime.utcnow().isoformat()
+        # Un único timestamp por construcción, solo si falta alguno
+        now = None if created_at and updated_at else datetime.utcnow().isoformat()
+        self.created_at = created_at or now
+        self.updated_at = updated_at or now
+        self.session_count = session_count  # Cantidad de sesiones (mantenida por el stream de sesiones)
 
     def to_dict(self) -> dict:
         """Convertir el curso a diccionario"""
@@ -28,20 +34,22 @@ class Course:
             'instructor_id': self.instructor_id,
             'active': self.active,
             'created_at': self.created_at,
-            'updated_at': self.updated_at
+            'updated_at': self.updated_at,
+            'session_count': self.session_count
         }
 
     @staticmethod
     def from_dict(data: dict) -> 'Course':
-        """Crear un objeto Course desde un diccionario"""
-        return Course(
-            id=data.get('id'),
-            name=data.get('name'),
-            instructor_id=data.get('instructor_id'),
-            active=data.get('active', True),
-            created_at=data.get('created_at'),
-            updated_at=data.get('updated_at')
-        )
+        """Crear un objeto Course desde una fila guardada, sin generar valores por defecto"""
+        course = Course.__new__(Course)
+        course.id = data.get('id')
+        course.name = data.get('name')
+        course.instructor_id = data.get('instructor_id')
+        course.active = data.get('active', True)
+        course.created_at = data.get('created_at')
+        course.updated_at = data.get('updated_at')
+        course.session_count = int(data.get('session_count', 0))
+        return course
 
     def validate(self) -> tuple[bool, Optional[str]]:
         """Validar los datos del curso"""
@@ -4,6 +4,8 @@ import uuid
 
 
 class Instructor:
+    __slots__ = ('id', 'name', 'email', 'password', 'active', 'created_at', 'updated_at', 'course_count')
+
     def __init__(
             self,
             name: str,
@@ -12,15 +14,19 @@ class Instructor:
             active: bool = True,
             id: Optional[str] = None,
             created_at: Optional[str] = None,
-            updated_at: Optional[str] = None
+            updated_at: Optional[str] = None,
+            course_count: int = 0
     ):
         self.id = id or str(uuid.uuid4())
         self.name = name
         self.email = email
         self.password = password
         self.active = active
-        self.created_at = created_at or datetime.utcnow().isoformat()
-        self.updated_at = updated_at or datetime.utcnow().isoformat()
+        # Un único timestamp por construcción, solo si falta alguno
+        now = None if created_at and updated_at else datetime.utcnow().isoformat()
+        self.created_at = created_at or now
+        self.updated_at = updated_at or now
+        self.course_count = course_count  # Cantidad de cursos (mantenida por el stream de cursos)
 
     def to_dict(self, include_password: bool = False) -> dict:
         """Convertir el instructor a diccionario"""
@@ -30,7 +36,8 @@ class Instructor:
             'email': self.email,
             'active': self.active,
             'created_at': self.created_at,
-            'updated_at': self.updated_at
+            'updated_at': self.updated_at,
+            'course_count': self.course_count
         }
         if include_password:
             data['password'] = self.password
@@ -38,16 +45,17 @@ class Instructor:
 
     @staticmethod
     def from_dict(data: dict) -> 'Instructor':
-        """Crear un objeto Instructor desde un diccionario"""
-        return Instructor(
-            id=data.get('id'),
-            name=data.get('name'),
-            email=data.get('email'),
-            password=data.get('password'),
-            active=data.get('active', True),
-            created_at=data.get('created_at'),
-            updated_at=data.get('updated_at')
-        )
+        """Crear un objeto Instructor desde una fila guardada, sin generar valores por defecto"""
+        instructor = Instructor.__new__(Instructor)
+        instructor.id = data.get('id')
+        instructor.name = data.get('name')
+        instructor.email = data.get('email')
+        instructor.password = data.get('password')
+        instructor.active = data.get('active', True)
+        instructor.created_at = data.get('created_at')
+        instructor.updated_at = data.get('updated_at')
+        instructor.course_count = int(data.get('course_count', 0))
+        return instructor
 
     def validate(self) -> tuple[bool, Optional[str]]:
         """Validar los datos del instructor"""
@@ -4,12 +4,15 @@ import uuid
 
 
 class Item:
+    __slots__ = ('id', 'board_id', 'x', 'y', 'document', 'version', 'created_at', 'updated_at')
+
     def __init__(
             self,
             board_id: str,
             x: float,
             y: float,
             document: str,
+            version: int = 1,
             id: Optional[str] = None,
             created_at: Optional[str] = None,
             updated_at: Optional[str] = None
@@ -19,8 +22,11 @@ class Item:
         self.x = x
         self.y = y
         self.document = document  # URL de S3
-        self.created_at = created_at or datetime.utcnow().isoformat()
-        self.updated_at = updated_at or datetime.utcnow().isoformat()
+        self.version = version  # Versión para control optimista de concurrencia
+        # Un único timestamp por construcción, solo si falta alguno
+        now = None if created_at and updated_at else datetime.utcnow().isoformat()
+        self.created_at = created_at or now
+        self.updated_at = updated_at or now
 
     def to_dict(self) -> dict:
         """Convertir el item a diccionario"""
@@ -30,22 +36,29 @@ class Item:
             'x': self.x,
             'y': self.y,
             'document': self.document,
+            'version': self.version,
             'created_at': self.created_at,
             'updated_at': self.updated_at
         }
 
     @staticmethod
     def from_dict(data: dict) -> 'Item':
-        """Crear un objeto Item desde un diccionario"""
-        return Item(
-            id=data.get('id'),
-            board_id=data.get('board_id'),
-            x=float(data.get('x', 0)),
-            y=float(data.get('y', 0)),
-            document=data.get('document'),
-            created_at=data.get('created_at'),
-            updated_at=data.get('updated_at')
-        )
+        """
+        Crear un objeto Item desde un diccionario
+
+        Se usa para filas ya guardadas, en listados de miles de items: asigna
+        los campos sin pasar por __init__, así no se generan uuid ni timestamps.
+        """
+        item = Item.__new__(Item)
+        item.id = data.get('id')
+        item.board_id = data.get('board_id')
+        item.x = float(data.get('x', 0))
+        item.y = float(data.get('y', 0))
+        item.document = data.get('document')
+        item.version = int(data.get('version', 0))
+        item.created_at = data.get('created_at')
+        item.updated_at = data.get('updated_at')
+        return item
 
     def validate(self) -> tuple[bool, Optional[str]]:
         """Validar los datos del item"""
@@ -4,6 +4,8 @@ import uuid
 
 
 class Session:
+    __slots__ = ('id', 'course_id', 'board_id', 'name', 'active', 'created_at', 'updated_at')
+
     def __init__(
             self,
             course_id: str,
@@ -19,8 +21,10 @@ class Session:
         self.board_id = board_id
         self.name = name
         self.active = active
-        self.created_at = created_at or datetime.utcnow().isoformat()
-        self.updated_at = updated_at or datetime.utcnow().isoformat()
+        # Un único timestamp por construcción, solo si falta alguno
+        now = None if created_at and updated_at else datetime.utcnow().isoformat()
+        self.created_at = created_at or now
+        self.updated_at = updated_at or now
 
     def to_dict(self) -> dict:
         """Convertir la sesión a diccionario"""
@@ -36,16 +40,16 @@ class Session:
 
     @staticmethod
     def from_dict(data: dict) -> 'Session':
-        """Crear un objeto Session desde un diccionario"""
-        return Session(
-            id=data.get('id'),
-            course_id=data.get('course_id'),
-            board_id=data.get('board_id'),
-            name=data.get('name'),
-            active=data.get('active', True),
-            created_at=data.get('created_at'),
-            updated_at=data.get('updated_at')
-        )
+        """Crear un objeto Session desde una fila guardada, sin generar valores por defecto"""
+        session = Session.__new__(Session)
+        session.id = data.get('id')
+        session.course_id = data.get('course_id')
+        session.board_id = data.get('board_id')
+        session.name = data.get('name')
+        session.active = data.get('active', True)
+        session.created_at = data.get('created_at')
+        session.updated_at = data.get('updated_at')
+        return session
 
     def validate(self) -> tuple[bool, Optional[str]]:
         """Validar los datos de la sesión"""
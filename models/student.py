@@ -4,6 +4,8 @@ from typing import Optional
 
 
 class Student:
+    __slots__ = ('id', 'name', 'email', 'password', 'active', 'score', 'created_at', 'updated_at')
+
     def __init__(
         self,
         name: str,
@@ -21,8 +23,10 @@ class Student:
         self.password = password
         self.active = active
         self.score = score
-        self.created_at = created_at or datetime.utcnow().isoformat()
-        self.updated_at = updated_at or datetime.utcnow().isoformat()
+        # Un único timestamp por construcción, solo si falta alguno
+        now = None if created_at and updated_at else datetime.utcnow().isoformat()
+        self.created_at = created_at or now
+        self.updated_at = updated_at or now
 
     def to_dict(self, include_password: bool = False) -> dict:
         """Convertir el estudiante a diccionario"""
@@ -41,17 +45,17 @@ class Student:
 
     @staticmethod
     def from_dict(data: dict) -> 'Student':
-        """Crear un objeto Student desde un diccionario"""
-        return Student(
-            id=data.get('id'),
-            name=data.get('name'),
-            email=data.get('email'),
-            password=data.get('password'),
-            active=data.get('active', True),
-            score=int(data.get('score', 0)),
-            created_at=data.get('created_at'),
-            updated_at=data.get('updated_at')
-        )
+        """Crear un objeto Student desde una fila guardada, sin generar valores por defecto"""
+        student = Student.__new__(Student)
+        student.id = data.get('id')
+        student.name = data.get('name')
+        student.email = data.get('email')
+        student.password = data.get('password')
+        student.active = data.get('active', True)
+        student.score = int(data.get('score', 0))
+        student.created_at = data.get('created_at')
+        student.updated_at = data.get('updated_at')
+        return student
 
     def validate(self) -> tuple[bool, Optional[str]]:
         """Validar los datos del estudiante"""
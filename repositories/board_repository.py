@@ -1,15 +1,24 @@
 import os
-import boto3
-from typing import Optional, List
+from typing import Optional, List, Tuple, Iterator
 from botocore.exceptions import ClientError
 from models.board import Board
+from utils.aws_clients import get_dynamodb_resource
+from utils.batch_helper import batch_get_by_id
+from utils.cache_helper import get_table_cache
+from utils.dynamodb_helper import add_to_counter
+from utils.pagination_helper import DEFAULT_PAGE_SIZE, scan_page
+from utils.parallel_scan import parallel_scan
 
 
 class BoardRepository:
     def __init__(self):
-        self.dynamodb = boto3.resource('dynamodb')
+        self.dynamodb = get_dynamodb_resource()
         self.table_name = os.environ.get('BOARDS_TABLE')
         self.table = self.dynamodb.Table(self.table_name)
+        self.cache = get_table_cache(
+            self.table_name,
+            ttl=float(os.environ.get('BOARDS_CACHE_TTL', 0))
+        )
 
     def create(self, board: Board) -> Board:
         """Crear un nuevo board"""
@@ -26,24 +35,47 @@ class BoardRepository:
 
     def get_by_id(self, board_id: str) -> Optional[Board]:
         """Obtener board por ID"""
+        cached = self.cache.get(board_id)
+        if cached is not None:
+            return Board.from_dict(cached)
+
         try:
             response = self.table.get_item(Key={'id': board_id})
             if 'Item' in response:
+                self.cache.set(board_id, response['Item'])
                 return Board.from_dict(response['Item'])
             return None
         except ClientError as e:
             print(f"Error getting board: {e}")
             return None
 
-    def list_all(self, limit: int = 50) -> List[Board]:
-        """Listar todos los boards"""
+    def get_many(self, ids: List[str]) -> List[Optional[Board]]:
+        """Obtener varios boards por ID respetando el orden de entrada"""
+        try:
+            found = batch_get_by_id(self.dynamodb, self.table_name, ids)
+            return [Board.from_dict(found[item_id]) if item_id in found else None for item_id in ids]
+        except ClientError as e:
+            print(f"Error getting boards in batch: {e}")
+            return [None] * len(ids)
+
+    def list_all(
+            self,
+            limit: int = DEFAULT_PAGE_SIZE,
+            next_token: Optional[str] = None
+    ) -> Tuple[List[Board], Optional[str]]:
+        """Listar una página de boards"""
         try:
-            response = self.table.scan(Limit=limit)
-            boards = [Board.from_dict(item) for item in response.get('Items', [])]
-            return boards
+            items, next_token = scan_page(self.table, limit, next_token)
+            boards = [Board.from_dict(item) for item in items]
+            return boards, next_token
         except ClientError as e:
             print(f"Error listing boards: {e}")
-            return []
+            return [], None
+
+    def scan_all(self, total_segments: Optional[int] = None) -> Iterator[Board]:
+        """Recorrer todos los boards con un scan paralelo segmentado"""
+        for item in parallel_scan(self.table, total_segments):
+            yield Board.from_dict(item)
 
     def update(self, board_id: str, updates: dict) -> Optional[Board]:
         """Actualizar un board"""
@@ -68,16 +100,67 @@ class BoardRepository:
                 UpdateExpression=update_expression,
                 ExpressionAttributeValues=expression_attribute_values,
                 ExpressionAttributeNames=expression_attribute_names,
+                ConditionExpression='attribute_exists(id)',
                 ReturnValues='ALL_NEW'
             )
+            self.cache.invalidate(board_id)
 
             return Board.from_dict(response['Attributes'])
         except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return None
             print(f"Error updating board: {e}")
-            return None
+            raise e
+
+    def adjust_item_count(self, board_id: str, changes: List[Tuple[str, int]]) -> int:
+        """
+        Aplicar al contador de items los cambios de registros del stream
+
+        Args:
+            changes: Lista de (marcador, +1 o -1); cada marcador se aplica una sola vez
+
+        Returns:
+            Cantidad de cambios aplicados (0 si el board ya no existe)
+        """
+        applied = add_to_counter(self.table, {'id': board_id}, 'item_count', changes)
+        self.cache.invalidate(board_id)
+        return applied
+
+    def bump_items_version(self, board_id: str) -> bool:
+        """
+        Incrementar la versión de items del board al quitarle un item
+
+        Los borrados no dejan rastro en BoardUpdatedIndex; esta versión entra
+        en el ETag de los items del board desde el mismo request.
+
+        Returns:
+            False si el board ya no existe
+        """
+        try:
+            self.table.update_item(
+                Key={'id': board_id},
+                UpdateExpression='ADD items_version :one',
+                ExpressionAttributeValues={':one': 1},
+                ConditionExpression='attribute_exists(id)'
+            )
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise e
+
+    def get_items_version(self, board_id: str) -> int:
+        """Obtener la versión de items del board con lectura consistente (sin cache)"""
+        response = self.table.get_item(
+            Key={'id': board_id},
+            ProjectionExpression='items_version',
+            ConsistentRead=True
+        )
+        return int(response.get('Item', {}).get('items_version', 0))
 
     def delete(self, board_id: str) -> bool:
         """Eliminar un board"""
+        self.cache.invalidate(board_id)
         try:
             self.table.delete_item(
                 Key={'id': board_id},
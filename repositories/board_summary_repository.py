@@ -0,0 +1,218 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
+
+from botocore.exceptions import ClientError
+
+from models.board_summary import BoardSummaryCell
+from utils.aws_clients import get_dynamodb_resource
+from utils.batch_helper import BATCH_WRITE_WORKERS, batch_write
+from utils.idempotency_helper import apply_once
+from utils.lod_helper import MAX_CELL_REPRESENTATIVES, ZOOM_LEVEL_CELL_SIZES
+from utils.pagination_helper import iter_items
+
+# Reintentos ante escrituras concurrentes de los representativos de una celda
+REPRESENTATIVE_UPDATE_ATTEMPTS = 3
+
+
+class BoardSummaryRepository:
+    def __init__(self):
+        self.dynamodb = get_dynamodb_resource()
+        self.table_name = os.environ.get('BOARD_SUMMARIES_TABLE')
+        self.table = self.dynamodb.Table(self.table_name)
+        # Cliente thread-safe para aplicar los deltas en paralelo
+        self.client = self.dynamodb.meta.client
+
+    def get_level(self, board_id: str, level: int) -> List[BoardSummaryCell]:
+        """Obtener las celdas no vacías de un nivel de zoom"""
+        try:
+            items = iter_items(
+                self.table.query,
+                KeyConditionExpression='board_level = :board_level',
+                ExpressionAttributeValues={
+                    ':board_level': BoardSummaryCell.partition_key(board_id, level)
+                }
+            )
+            cells = [BoardSummaryCell.from_dict(item) for item in items]
+            return [cell for cell in cells if cell.count > 0]
+        except ClientError as e:
+            print(f"Error getting board summary: {e}")
+            return []
+
+    def replace_level(self, board_id: str, level: int, cells: Dict[str, dict]) -> None:
+        """
+        Reemplazar todas las celdas de un nivel de zoom
+
+        Raises:
+            RuntimeError si alguna escritura no se pudo completar
+        """
+        board_level = BoardSummaryCell.partition_key(board_id, level)
+        existing = iter_items(
+            self.table.query,
+            KeyConditionExpression='board_level = :board_level',
+            ExpressionAttributeValues={':board_level': board_level},
+            ProjectionExpression='cell'
+        )
+        stale = [item['cell'] for item in existing if item['cell'] not in cells]
+
+        requests = [
+            {'DeleteRequest': {'Key': {'board_level': board_level, 'cell': cell}}}
+            for cell in stale
+        ]
+        for cell, summary in cells.items():
+            record = {'board_level': board_level, 'cell': cell, 'count': summary['count']}
+            if summary['item_ids']:
+                record['item_ids'] = set(summary['item_ids'])
+            requests.append({'PutRequest': {'Item': record}})
+
+        failed = batch_write(self.dynamodb, self.table_name, requests)
+        if failed:
+            raise RuntimeError(f"Failed to write {len(failed)} summary cell(s)")
+
+    def delete_by_board(self, board_id: str) -> int:
+        """
+        Eliminar las celdas de todos los niveles de zoom de un board
+
+        Returns:
+            Número de celdas eliminadas
+
+        Raises:
+            RuntimeError si alguna celda no se pudo eliminar
+        """
+        requests = []
+        for level in range(len(ZOOM_LEVEL_CELL_SIZES)):
+            board_level = BoardSummaryCell.partition_key(board_id, level)
+            cells = iter_items(
+                self.table.query,
+                KeyConditionExpression='board_level = :board_level',
+                ExpressionAttributeValues={':board_level': board_level},
+                ProjectionExpression='cell'
+            )
+            requests.extend(
+                {'DeleteRequest': {'Key': {'board_level': board_level, 'cell': item['cell']}}}
+                for item in cells
+            )
+
+        failed = batch_write(self.dynamodb, self.table_name, requests)
+        if failed:
+            raise RuntimeError(f"Failed to delete {len(failed)} summary cell(s)")
+        return len(requests)
+
+    def _count_update(self, db_key: dict, changes: list) -> dict:
+        delta = sum(change for _, change in changes)
+        update = {
+            'TableName': self.table_name,
+            'Key': db_key,
+            'UpdateExpression': 'ADD #count :delta',
+            'ExpressionAttributeNames': {'#count': 'count'},
+            'ExpressionAttributeValues': {':delta': delta}
+        }
+        if delta <= 0:
+            # Una baja no recrea una celda que ya no existe (board eliminado
+            # o celda quitada por un refresh)
+            update['ConditionExpression'] = 'attribute_exists(board_level)'
+        return update
+
+    def _update_representatives(
+            self,
+            key: tuple,
+            db_key: dict,
+            changes: list,
+            refill: Callable[[tuple, int, set], List[str]]
+    ) -> None:
+        added, removed = [], set()
+        for item_id, change in changes:
+            if change > 0:
+                removed.discard(item_id)
+                added.append(item_id)
+            else:
+                added = [added_id for added_id in added if added_id != item_id]
+                removed.add(item_id)
+
+        for _ in range(REPRESENTATIVE_UPDATE_ATTEMPTS):
+            current = self.client.get_item(TableName=self.table_name, Key=db_key, ConsistentRead=True).get('Item')
+            if not current:
+                return
+
+            item_ids = set(current.get('item_ids', ()))
+            representatives = item_ids - removed
+            for item_id in added:
+                if len(representatives) >= MAX_CELL_REPRESENTATIVES:
+                    break
+                representatives.add(item_id)
+
+            # Si salieron representativos y la celda tiene más items, se
+            # completan con otros de la misma celda
+            missing = min(MAX_CELL_REPRESENTATIVES, int(current.get('count', 0))) - len(representatives)
+            if missing > 0:
+                representatives.update(refill(key, missing, representatives))
+            # El tope se aplica a la celda completa, no solo a lo agregado
+            representatives = set(sorted(representatives)[:MAX_CELL_REPRESENTATIVES])
+
+            if representatives == item_ids:
+                return
+
+            version = int(current.get('rep_version', 0))
+            update = {
+                'UpdateExpression': 'SET rep_version = :next',
+                'ConditionExpression': 'attribute_exists(board_level) AND ' + (
+                    'rep_version = :version' if version else 'attribute_not_exists(rep_version)'
+                ),
+                'ExpressionAttributeValues': {':next': version + 1}
+            }
+            if version:
+                update['ExpressionAttributeValues'][':version'] = version
+            if representatives:
+                update['UpdateExpression'] += ', item_ids = :item_ids'
+                update['ExpressionAttributeValues'][':item_ids'] = representatives
+            else:
+                update['UpdateExpression'] += ' REMOVE item_ids'
+
+            try:
+                self.client.update_item(TableName=self.table_name, Key=db_key, **update)
+                return
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                    raise e
+                # Otro lote cambió los representativos: releer y recalcular
+
+        print(f"Representatives of cell {key} not updated after {REPRESENTATIVE_UPDATE_ATTEMPTS} attempts")
+
+    def _apply_changes(
+            self,
+            key: tuple,
+            changes: List[Tuple[str, tuple]],
+            refill: Callable[[tuple, int, set], List[str]]
+    ) -> None:
+        board_id, level, cell = key
+        db_key = {'board_level': BoardSummaryCell.partition_key(board_id, level), 'cell': cell}
+
+        applied = apply_once(self.client, changes, lambda values: self._count_update(db_key, values))
+        if applied:
+            self._update_representatives(key, db_key, applied, refill)
+
+    def apply_changes(
+            self,
+            changes: Dict[tuple, List[Tuple[str, tuple]]],
+            refill: Callable[[tuple, int, set], List[str]]
+    ) -> None:
+        """
+        Aplicar cambios incrementales del stream a las celdas
+
+        El conteo se aplica a lo sumo una vez por registro (ver apply_once),
+        así reintentar un lote no lo duplica. Los representativos se
+        recalculan leyendo la celda: se quitan los que salieron, se agregan
+        los que entraron hasta el tope y, si faltan, se completan con refill.
+
+        Args:
+            changes: Dict de (board_id, level, cell) -> lista de
+                (marcador, (item_id, +1 o -1)) en orden del stream
+            refill: Recibe (clave de celda, cantidad, ids a excluir) y
+                devuelve ids de otros items de la celda
+        """
+        if not changes:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(BATCH_WRITE_WORKERS, len(changes))) as executor:
+            # list() propaga cualquier excepción de los workers
+            list(executor.map(lambda change: self._apply_changes(*change, refill), changes.items()))
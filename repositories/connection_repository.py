@@ -0,0 +1,50 @@
+import os
+import time
+from typing import List
+
+from botocore.exceptions import ClientError
+
+from utils.aws_clients import get_dynamodb_resource
+from utils.pagination_helper import iter_items
+
+# API Gateway cierra las conexiones WebSocket a las 2 horas
+CONNECTION_TTL_SECONDS = 2 * 60 * 60
+
+
+class ConnectionRepository:
+    """Conexiones WebSocket suscritas a los cambios de cada board"""
+
+    def __init__(self):
+        self.dynamodb = get_dynamodb_resource()
+        self.table_name = os.environ.get('CONNECTIONS_TABLE')
+        self.table = self.dynamodb.Table(self.table_name)
+
+    def add(self, connection_id: str, board_id: str) -> None:
+        """Suscribir una conexión a un board"""
+        self.table.put_item(Item={
+            'connection_id': connection_id,
+            'board_id': board_id,
+            'expires_at': int(time.time()) + CONNECTION_TTL_SECONDS
+        })
+
+    def remove(self, connection_id: str) -> None:
+        """Eliminar una conexión"""
+        try:
+            self.table.delete_item(Key={'connection_id': connection_id})
+        except ClientError as e:
+            print(f"Error removing connection: {e}")
+
+    def get_by_board(self, board_id: str) -> List[str]:
+        """Obtener los IDs de las conexiones suscritas a un board"""
+        try:
+            connections = iter_items(
+                self.table.query,
+                IndexName='BoardIndex',
+                KeyConditionExpression='board_id = :board_id',
+                ExpressionAttributeValues={':board_id': board_id},
+                ProjectionExpression='connection_id'
+            )
+            return [connection['connection_id'] for connection in connections]
+        except ClientError as e:
+            print(f"Error getting connections by board: {e}")
+            return []
@@ -1,15 +1,24 @@
 import os
-import boto3
-from typing import Optional, List
+from typing import Optional, List, Tuple, Iterator
 from botocore.exceptions import ClientError
 from models.course import Course
+from utils.aws_clients import get_dynamodb_resource
+from utils.batch_helper import batch_get_by_id
+from utils.cache_helper import get_table_cache
+from utils.dynamodb_helper import add_to_counter
+from utils.pagination_helper import DEFAULT_PAGE_SIZE, iter_items, scan_page
+from utils.parallel_scan import parallel_scan
 
 
 class CourseRepository:
     def __init__(self):
-        self.dynamodb = boto3.resource('dynamodb')
+        self.dynamodb = get_dynamodb_resource()
         self.table_name = os.environ.get('COURSES_TABLE')
         self.table = self.dynamodb.Table(self.table_name)
+        self.cache = get_table_cache(
+            self.table_name,
+            ttl=float(os.environ.get('COURSES_CACHE_TTL', 0))
+        )
 
     def create(self, course: Course) -> Course:
         """Crear un nuevo curso"""
@@ -26,37 +35,67 @@ class CourseRepository:
 
     def get_by_id(self, course_id: str) -> Optional[Course]:
         """Obtener curso por ID"""
+        cached = self.cache.get(course_id)
+        if cached is not None:
+            return Course.from_dict(cached)
+
         try:
             response = self.table.get_item(Key={'id': course_id})
             if 'Item' in response:
+                self.cache.set(course_id, response['Item'])
                 return Course.from_dict(response['Item'])
             return None
         except ClientError as e:
             print(f"Error getting course: {e}")
             return None
 
+    def get_many(self, ids: List[str]) -> List[Optional[Course]]:
+        """Obtener varios cursos por ID respetando el orden de entrada"""
+        try:
+            found = batch_get_by_id(self.dynamodb, self.table_name, ids)
+            return [Course.from_dict(found[item_id]) if item_id in found else None for item_id in ids]
+        except ClientError as e:
+            print(f"Error getting courses in batch: {e}")
+            return [None] * len(ids)
+
+    def iter_by_instructor(self, instructor_id: str, page_size: Optional[int] = None) -> Iterator[Course]:
+        """Recorrer cursos por instructor página a página"""
+        params = {
+            'IndexName': 'InstructorIndex',
+            'KeyConditionExpression': 'instructor_id = :instructor_id',
+            'ExpressionAttributeValues': {':instructor_id': instructor_id}
+        }
+        if page_size:
+            params['Limit'] = page_size
+        for item in iter_items(self.table.query, **params):
+            yield Course.from_dict(item)
+
     def get_by_instructor(self, instructor_id: str) -> List[Course]:
         """Obtener cursos por instructor"""
         try:
-            response = self.table.query(
-                IndexName='InstructorIndex',
-                KeyConditionExpression='instructor_id = :instructor_id',
-                ExpressionAttributeValues={':instructor_id': instructor_id}
-            )
-            return [Course.from_dict(item) for item in response.get('Items', [])]
+            return list(self.iter_by_instructor(instructor_id))
         except ClientError as e:
             print(f"Error getting courses by instructor: {e}")
             return []
 
-    def list_all(self, limit: int = 50) -> List[Course]:
-        """Listar todos los cursos"""
+    def list_all(
+            self,
+            limit: int = DEFAULT_PAGE_SIZE,
+            next_token: Optional[str] = None
+    ) -> Tuple[List[Course], Optional[str]]:
+        """Listar una página de cursos"""
         try:
-            response = self.table.scan(Limit=limit)
-            courses = [Course.from_dict(item) for item in response.get('Items', [])]
-            return courses
+            items, next_token = scan_page(self.table, limit, next_token)
+            courses = [Course.from_dict(item) for item in items]
+            return courses, next_token
         except ClientError as e:
             print(f"Error listing courses: {e}")
-            return []
+            return [], None
+
+    def scan_all(self, total_segments: Optional[int] = None) -> Iterator[Course]:
+        """Recorrer todos los cursos con un scan paralelo segmentado"""
+        for item in parallel_scan(self.table, total_segments):
+            yield Course.from_dict(item)
 
     def update(self, course_id: str, updates: dict) -> Optional[Course]:
         """Actualizar un curso"""
@@ -81,16 +120,35 @@ class CourseRepository:
                 UpdateExpression=update_expression,
                 ExpressionAttributeValues=expression_attribute_values,
                 ExpressionAttributeNames=expression_attribute_names,
+                ConditionExpression='attribute_exists(id)',
                 ReturnValues='ALL_NEW'
             )
+            self.cache.invalidate(course_id)
 
             return Course.from_dict(response['Attributes'])
         except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return None
             print(f"Error updating course: {e}")
-            return None
+            raise e
+
+    def adjust_session_count(self, course_id: str, changes: List[Tuple[str, int]]) -> int:
+        """
+        Aplicar al contador de sesiones los cambios de registros del stream
+
+        Args:
+            changes: Lista de (marcador, +1 o -1); cada marcador se aplica una sola vez
+
+        Returns:
+            Cantidad de cambios aplicados (0 si el curso ya no existe)
+        """
+        applied = add_to_counter(self.table, {'id': course_id}, 'session_count', changes)
+        self.cache.invalidate(course_id)
+        return applied
 
     def delete(self, course_id: str) -> bool:
         """Eliminar un curso"""
+        self.cache.invalidate(course_id)
         try:
             self.table.delete_item(
                 Key={'id': course_id},
@@ -1,15 +1,24 @@
 import os
-import boto3
-from typing import Optional, List
+from typing import Optional, List, Tuple, Iterator
 from botocore.exceptions import ClientError
 from models.instructor import Instructor
+from utils.aws_clients import get_dynamodb_resource
+from utils.batch_helper import batch_get_by_id
+from utils.cache_helper import get_table_cache
+from utils.dynamodb_helper import add_to_counter
+from utils.pagination_helper import DEFAULT_PAGE_SIZE, scan_page
+from utils.parallel_scan import parallel_scan
 
 
 class InstructorRepository:
     def __init__(self):
-        self.dynamodb = boto3.resource('dynamodb')
+        self.dynamodb = get_dynamodb_resource()
         self.table_name = os.environ.get('INSTRUCTORS_TABLE')
         self.table = self.dynamodb.Table(self.table_name)
+        self.cache = get_table_cache(
+            self.table_name,
+            ttl=float(os.environ.get('INSTRUCTORS_CACHE_TTL', 0))
+        )
 
     def create(self, instructor: Instructor) -> Instructor:
         """Crear un nuevo instructor"""
@@ -26,15 +35,29 @@ class InstructorRepository:
 
     def get_by_id(self, instructor_id: str) -> Optional[Instructor]:
         """Obtener instructor por ID"""
+        cached = self.cache.get(instructor_id)
+        if cached is not None:
+            return Instructor.from_dict(cached)
+
         try:
             response = self.table.get_item(Key={'id': instructor_id})
             if 'Item' in response:
+                self.cache.set(instructor_id, response['Item'])
                 return Instructor.from_dict(response['Item'])
             return None
         except ClientError as e:
             print(f"Error getting instructor: {e}")
             return None
 
+    def get_many(self, ids: List[str]) -> List[Optional[Instructor]]:
+        """Obtener varios instructores por ID respetando el orden de entrada"""
+        try:
+            found = batch_get_by_id(self.dynamodb, self.table_name, ids)
+            return [Instructor.from_dict(found[item_id]) if item_id in found else None for item_id in ids]
+        except ClientError as e:
+            print(f"Error getting instructors in batch: {e}")
+            return [None] * len(ids)
+
     def get_by_email(self, email: str) -> Optional[Instructor]:
         """Obtener instructor por email"""
         try:
@@ -50,15 +73,24 @@ class InstructorRepository:
             print(f"Error getting instructor by email: {e}")
             return None
 
-    def list_all(self, limit: int = 50) -> List[Instructor]:
-        """Listar todos los instructores"""
+    def list_all(
+            self,
+            limit: int = DEFAULT_PAGE_SIZE,
+            next_token: Optional[str] = None
+    ) -> Tuple[List[Instructor], Optional[str]]:
+        """Listar una página de instructores"""
         try:
-            response = self.table.scan(Limit=limit)
-            instructors = [Instructor.from_dict(item) for item in response.get('Items', [])]
-            return instructors
+            items, next_token = scan_page(self.table, limit, next_token)
+            instructors = [Instructor.from_dict(item) for item in items]
+            return instructors, next_token
         except ClientError as e:
             print(f"Error listing instructors: {e}")
-            return []
+            return [], None
+
+    def scan_all(self, total_segments: Optional[int] = None) -> Iterator[Instructor]:
+        """Recorrer todos los instructores con un scan paralelo segmentado"""
+        for item in parallel_scan(self.table, total_segments):
+            yield Instructor.from_dict(item)
 
     def update(self, instructor_id: str, updates: dict) -> Optional[Instructor]:
         """Actualizar un instructor"""
@@ -85,16 +117,35 @@ class InstructorRepository:
                 UpdateExpression=update_expression,
                 ExpressionAttributeValues=expression_attribute_values,
                 ExpressionAttributeNames=expression_attribute_names,
+                ConditionExpression='attribute_exists(id)',
                 ReturnValues='ALL_NEW'
             )
+            self.cache.invalidate(instructor_id)
 
             return Instructor.from_dict(response['Attributes'])
         except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return None
             print(f"Error updating instructor: {e}")
-            return None
+            raise e
+
+    def adjust_course_count(self, instructor_id: str, changes: List[Tuple[str, int]]) -> int:
+        """
+        Aplicar al contador de cursos los cambios de registros del stream
+
+        Args:
+            changes: Lista de (marcador, +1 o -1); cada marcador se aplica una sola vez
+
+        Returns:
+            Cantidad de cambios aplicados (0 si el instructor ya no existe)
+        """
+        applied = add_to_counter(self.table, {'id': instructor_id}, 'course_count', changes)
+        self.cache.invalidate(instructor_id)
+        return applied
 
     def delete(self, instructor_id: str) -> bool:
         """Eliminar un instructor"""
+        self.cache.invalidate(instructor_id)
         try:
             self.table.delete_item(
                 Key={'id': instructor_id},
@@ -1,21 +1,95 @@
+import itertools
 import os
-import boto3
-from typing import Optional, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Tuple, Iterator, Callable, Dict
 from botocore.exceptions import ClientError
 from models.item import Item
+from utils.aws_clients import get_dynamodb_resource
+from utils.batch_helper import batch_delete_by_id, batch_get_by_id, batch_write, chunked
+from utils.cache_helper import get_table_cache
+from utils.dynamodb_helper import to_dynamodb
+from utils.pagination_helper import DEFAULT_PAGE_SIZE, iter_items, scan_page
+from utils.parallel_scan import parallel_scan
+from utils.spatial_helper import MAX_VIEWPORT_TILE_ROWS, contains, tile_key, tile_ranges, tile_rows
+
+VIEWPORT_QUERY_WORKERS = 8
+MOVE_WORKERS = 8
+# Límite de acciones de DynamoDB por TransactWriteItems
+TRANSACT_CHUNK_SIZE = 100
+# Lecturas y escrituras condicionales al mover una sola coordenada
+SINGLE_COORDINATE_ATTEMPTS = 3
+
+# Atributos de Item expuestos por la API (el resto son índices internos)
+PUBLIC_FIELDS = ('id', 'board_id', 'x', 'y', 'document', 'version', 'created_at', 'updated_at')
+
+
+# Secuencias distintas por milisegundo dentro de un contenedor
+POSITION_SEQ_PER_MS = 1000
+_position_counter = itertools.count()
+
+
+def position_seq() -> int:
+    """
+    Secuencia de una escritura de posición: hora del servidor en ms y un contador
+
+    Todas las escrituras de x/y guardan position_seq, así una posición
+    encolada antes de un PUT o de un movimiento masivo no los pisa al
+    aplicarse después. El contador del contenedor desempata las escrituras
+    del mismo milisegundo en orden de llegada; entre contenedores solo
+    ordena el milisegundo.
+    """
+    return int(time.time() * 1000) * POSITION_SEQ_PER_MS + next(_position_counter) % POSITION_SEQ_PER_MS
+
+
+class VersionConflictError(Exception):
+    """La versión del item no coincide con la esperada"""
+
+
+class _PinnedCoordinateChanged(Exception):
+    """La coordenada no enviada cambió entre la lectura y la escritura"""
 
 
 class ItemRepository:
     def __init__(self):
-        self.dynamodb = boto3.resource('dynamodb')
+        self.dynamodb = get_dynamodb_resource()
         self.table_name = os.environ.get('ITEMS_TABLE')
         self.table = self.dynamodb.Table(self.table_name)
+        # Cliente de bajo nivel para las operaciones que corren en hilos: el
+        # resource no es thread-safe, el cliente sí (y acepta tipos de Python)
+        self.client = self.dynamodb.meta.client
+        self.cache = get_table_cache(
+            self.table_name,
+            ttl=float(os.environ.get('ITEMS_CACHE_TTL', 0))
+        )
+
+    @staticmethod
+    def _to_record(item: Item) -> dict:
+        """Item listo para DynamoDB, con la clave de tile del índice espacial"""
+        record = to_dynamodb(item.to_dict())
+        record['tile'] = tile_key(item.x, item.y)
+        return record
+
+    @staticmethod
+    def _with_tile(updates: dict, current: Optional[dict] = None) -> dict:
+        """
+        Agregar la clave de tile a las actualizaciones que mueven el item
+
+        Args:
+            current: Coordenada no enviada ({'x': ...} o {'y': ...}) leída
+                del item, cuando se mueve solo una
+        """
+        if 'x' not in updates and 'y' not in updates:
+            return updates
+
+        coordinates = dict(current or {}, **{axis: updates[axis] for axis in ('x', 'y') if axis in updates})
+        return dict(updates, tile=tile_key(float(coordinates.get('x') or 0), float(coordinates.get('y') or 0)))
 
     def create(self, item: Item) -> Item:
         """Crear un nuevo item"""
         try:
             self.table.put_item(
-                Item=item.to_dict(),
+                Item=self._to_record(item),
                 ConditionExpression='attribute_not_exists(id)'
             )
             return item
@@ -24,81 +98,525 @@ class ItemRepository:
                 raise ValueError("Item with this ID already exists")
             raise e
 
+    def create_many(self, items: List[Item]) -> List[bool]:
+        """
+        Crear varios items con BatchWriteItem
+
+        Returns:
+            Lista con el resultado de cada item, en el mismo orden de entrada
+        """
+        requests = [{'PutRequest': {'Item': self._to_record(item)}} for item in items]
+        failed = batch_write(self.dynamodb, self.table_name, requests)
+        failed_ids = {request['PutRequest']['Item']['id'] for request in failed}
+        return [item.id not in failed_ids for item in items]
+
     def get_by_id(self, item_id: str) -> Optional[Item]:
         """Obtener item por ID"""
+        cached = self.cache.get(item_id)
+        if cached is not None:
+            return Item.from_dict(cached)
+
         try:
             response = self.table.get_item(Key={'id': item_id})
             if 'Item' in response:
+                self.cache.set(item_id, response['Item'])
                 return Item.from_dict(response['Item'])
             return None
         except ClientError as e:
             print(f"Error getting item: {e}")
             return None
 
+    def get_many(self, ids: List[str]) -> List[Optional[Item]]:
+        """Obtener varios items por ID respetando el orden de entrada"""
+        try:
+            found = batch_get_by_id(self.dynamodb, self.table_name, ids)
+            return [Item.from_dict(found[item_id]) if item_id in found else None for item_id in ids]
+        except ClientError as e:
+            print(f"Error getting items in batch: {e}")
+            return [None] * len(ids)
+
+    def iter_by_board(self, board_id: str, page_size: Optional[int] = None) -> Iterator[Item]:
+        """Recorrer items por board página a página"""
+        params = {
+            'IndexName': 'BoardIndex',
+            'KeyConditionExpression': 'board_id = :board_id',
+            'ExpressionAttributeValues': {':board_id': board_id}
+        }
+        if page_size:
+            params['Limit'] = page_size
+        for item in iter_items(self.table.query, **params):
+            yield Item.from_dict(item)
+
+    def iter_records_by_board(self, board_id: str) -> Iterator[dict]:
+        """
+        Recorrer los items de un board como dicts crudos de DynamoDB
+
+        Evita construir modelos cuando el resultado solo se serializa. Se
+        proyectan únicamente los campos públicos de Item.
+        """
+        records = iter_items(
+            self.table.query,
+            IndexName='BoardIndex',
+            KeyConditionExpression='board_id = :board_id',
+            ExpressionAttributeValues={':board_id': board_id},
+            ProjectionExpression=', '.join(f'#{field}' for field in PUBLIC_FIELDS),
+            ExpressionAttributeNames={f'#{field}': field for field in PUBLIC_FIELDS}
+        )
+        for record in records:
+            record.setdefault('version', 0)
+            yield record
+
     def get_by_board(self, board_id: str) -> List[Item]:
         """Obtener items por board"""
         try:
-            response = self.table.query(
-                IndexName='BoardIndex',
-                KeyConditionExpression='board_id = :board_id',
-                ExpressionAttributeValues={':board_id': board_id}
-            )
-            return [Item.from_dict(item) for item in response.get('Items', [])]
+            return list(self.iter_by_board(board_id))
         except ClientError as e:
             print(f"Error getting items by board: {e}")
             return []
 
-    def list_all(self, limit: int = 50) -> List[Item]:
-        """Listar todos los items"""
+    def get_changed_since(self, board_id: str, since: str) -> List[Item]:
+        """Obtener los items de un board creados o modificados después de un cursor"""
         try:
-            response = self.table.scan(Limit=limit)
-            items = [Item.from_dict(item) for item in response.get('Items', [])]
-            return items
+            items = iter_items(
+                self.table.query,
+                IndexName='BoardUpdatedIndex',
+                KeyConditionExpression='board_id = :board_id AND updated_at > :since',
+                ExpressionAttributeValues={':board_id': board_id, ':since': since}
+            )
+            return [Item.from_dict(item) for item in items]
         except ClientError as e:
-            print(f"Error listing items: {e}")
+            print(f"Error getting items changed since {since}: {e}")
+            return []
+
+    def get_last_updated_at(self, board_id: str) -> Optional[str]:
+        """Obtener el updated_at más reciente de los items de un board (una sola lectura)"""
+        response = self.table.query(
+            IndexName='BoardUpdatedIndex',
+            KeyConditionExpression='board_id = :board_id',
+            ExpressionAttributeValues={':board_id': board_id},
+            ProjectionExpression='updated_at',
+            ScanIndexForward=False,
+            Limit=1
+        )
+        items = response.get('Items', [])
+        return items[0]['updated_at'] if items else None
+
+    def _query_tile_range(
+            self,
+            board_id: str,
+            tile_range: Tuple[str, str],
+            bbox: Tuple[float, float, float, float]
+    ) -> List[Item]:
+        x0, y0, x1, y1 = bbox
+        items = iter_items(
+            self.client.query,
+            TableName=self.table_name,
+            IndexName='BoardTileIndex',
+            KeyConditionExpression='board_id = :board_id AND tile BETWEEN :first_tile AND :last_tile',
+            FilterExpression='#x BETWEEN :x0 AND :x1 AND #y BETWEEN :y0 AND :y1',
+            ExpressionAttributeNames={'#x': 'x', '#y': 'y'},
+            ExpressionAttributeValues=to_dynamodb({
+                ':board_id': board_id,
+                ':first_tile': tile_range[0],
+                ':last_tile': tile_range[1],
+                ':x0': x0,
+                ':x1': x1,
+                ':y0': y0,
+                ':y1': y1
+            })
+        )
+        return [Item.from_dict(item) for item in items]
+
+    def get_by_viewport(self, board_id: str, bbox: Tuple[float, float, float, float]) -> List[Item]:
+        """
+        Obtener los items de un board dentro de un viewport
+
+        Solo se leen las filas de tiles que cubre el viewport (una query por
+        fila, en paralelo). Si el viewport es muy grande se lee la partición
+        completa del board.
+        """
+        try:
+            row_count = tile_rows(bbox[1], bbox[3])
+            if row_count > MAX_VIEWPORT_TILE_ROWS:
+                return [item for item in self.iter_by_board(board_id) if contains(bbox, item.x, item.y)]
+
+            with ThreadPoolExecutor(max_workers=min(row_count, VIEWPORT_QUERY_WORKERS)) as executor:
+                rows = executor.map(lambda tile_range: self._query_tile_range(board_id, tile_range, bbox), tile_ranges(*bbox))
+                return [item for row in rows for item in row]
+        except ClientError as e:
+            print(f"Error getting items by viewport: {e}")
             return []
 
-    def update(self, item_id: str, updates: dict) -> Optional[Item]:
-        """Actualizar un item"""
+    def sample_by_area(
+            self,
+            board_id: str,
+            bbox: Tuple[float, float, float, float],
+            limit: int,
+            accept: Optional[Callable[[Item], bool]] = None
+    ) -> List[Item]:
+        """
+        Obtener hasta `limit` items de un board dentro de un área
+
+        Lee fila por fila de tiles y se detiene al juntar los necesarios. Si
+        el área cubre más de MAX_VIEWPORT_TILE_ROWS filas recorre la
+        partición del board, que acota el costo igual que en get_by_viewport.
+
+        Args:
+            accept: Filtro opcional; solo se cuentan los items que lo cumplen
+        """
+        if tile_rows(bbox[1], bbox[3]) > MAX_VIEWPORT_TILE_ROWS:
+            candidates = (item for item in self.iter_by_board(board_id) if contains(bbox, item.x, item.y))
+        else:
+            candidates = (item for tile_range in tile_ranges(*bbox)
+                          for item in self._query_tile_range(board_id, tile_range, bbox))
+
+        found = []
+        for item in candidates:
+            if accept is None or accept(item):
+                found.append(item)
+                if len(found) >= limit:
+                    return found
+        return found
+
+    def list_all(
+            self,
+            limit: int = DEFAULT_PAGE_SIZE,
+            next_token: Optional[str] = None
+    ) -> Tuple[List[Item], Optional[str]]:
+        """Listar una página de items"""
+        try:
+            items, next_token = scan_page(self.table, limit, next_token)
+            items = [Item.from_dict(item) for item in items]
+            return items, next_token
+        except ClientError as e:
+            print(f"Error listing items: {e}")
+            return [], None
+
+    def delete_by_board(
+            self,
+            board_id: str,
+            on_progress: Optional[Callable[[int], None]] = None
+    ) -> int:
+        """
+        Eliminar todos los items de un board
+
+        Returns:
+            Número de items eliminados
+        """
+        keys = iter_items(
+            self.table.query,
+            IndexName='BoardIndex',
+            KeyConditionExpression='board_id = :board_id',
+            ExpressionAttributeValues={':board_id': board_id},
+            ProjectionExpression='id'
+        )
+        deleted = batch_delete_by_id(self.dynamodb, self.table_name, keys, on_progress)
+        self.cache.clear()
+        return deleted
+
+    def scan_all(self, total_segments: Optional[int] = None) -> Iterator[Item]:
+        """Recorrer todos los items con un scan paralelo segmentado"""
+        for item in parallel_scan(self.table, total_segments):
+            yield Item.from_dict(item)
+
+    def update(
+            self,
+            item_id: str,
+            updates: dict,
+            expected_version: Optional[int] = None
+    ) -> Optional[Item]:
+        """
+        Actualizar un item
+
+        Es un solo round trip salvo al mover una sola coordenada: el tile
+        depende también de la otra, así que se lee y se escribe con una
+        condición que la fija. Si otro request la cambió en el medio se
+        vuelve a leer, hasta SINGLE_COORDINATE_ATTEMPTS veces.
+
+        Args:
+            item_id: ID del item
+            updates: Campos a actualizar
+            expected_version: Si se indica, solo se actualiza cuando la
+                versión almacenada coincide (control optimista)
+
+        Returns:
+            El item actualizado o None si no existe
+
+        Raises:
+            VersionConflictError si la versión almacenada no coincide o la
+            otra coordenada siguió cambiando en todos los intentos
+        """
+        if ('x' in updates) == ('y' in updates):
+            return self._update(item_id, self._with_tile(updates), expected_version)
+
+        pinned = 'y' if 'x' in updates else 'x'
+        for _ in range(SINGLE_COORDINATE_ATTEMPTS):
+            response = self.client.get_item(
+                TableName=self.table_name,
+                Key={'id': item_id},
+                ProjectionExpression='#pinned',
+                ExpressionAttributeNames={'#pinned': pinned},
+                ConsistentRead=True
+            )
+            if 'Item' not in response:
+                return None
+
+            current = {pinned: response['Item'].get(pinned)}
+            try:
+                return self._update(item_id, self._with_tile(updates, current), expected_version, current)
+            except _PinnedCoordinateChanged:
+                continue
+
+        raise VersionConflictError("Item was moved by another request")
+
+    def _update(
+            self,
+            item_id: str,
+            updates: dict,
+            expected_version: Optional[int],
+            pinned: Optional[dict] = None
+    ) -> Optional[Item]:
         try:
             update_expression = "SET "
             expression_attribute_values = {}
             expression_attribute_names = {}
 
             for key, value in updates.items():
-                if key not in ['id', 'created_at']:
+                if key not in ['id', 'created_at', 'version', 'position_seq']:
                     update_expression += f"#{key} = :{key}, "
-                    expression_attribute_values[f":{key}"] = value
+                    expression_attribute_values[f":{key}"] = to_dynamodb(value)
                     expression_attribute_names[f"#{key}"] = key
 
             from datetime import datetime
-            update_expression += "#updated_at = :updated_at"
+            if 'tile' in updates:
+                update_expression += "#position_seq = :position_seq, "
+                expression_attribute_values[":position_seq"] = position_seq()
+                expression_attribute_names["#position_seq"] = "position_seq"
+
+            update_expression += "#updated_at = :updated_at, #version = if_not_exists(#version, :zero) + :one"
             expression_attribute_values[":updated_at"] = datetime.utcnow().isoformat()
+            expression_attribute_values[":zero"] = 0
+            expression_attribute_values[":one"] = 1
             expression_attribute_names["#updated_at"] = "updated_at"
+            expression_attribute_names["#version"] = "version"
 
-            response = self.table.update_item(
+            condition_expression = 'attribute_exists(id)'
+            if expected_version is not None:
+                if expected_version == 0:
+                    # Items creados antes de existir el atributo version
+                    condition_expression += ' AND attribute_not_exists(#version)'
+                else:
+                    condition_expression += ' AND #version = :expected_version'
+                    expression_attribute_values[":expected_version"] = expected_version
+
+            # La coordenada no enviada debe seguir siendo la usada para el tile
+            for axis, value in (pinned or {}).items():
+                expression_attribute_names[f"#pinned_{axis}"] = axis
+                if value is None:
+                    condition_expression += f' AND attribute_not_exists(#pinned_{axis})'
+                else:
+                    condition_expression += f' AND #pinned_{axis} = :pinned_{axis}'
+                    expression_attribute_values[f":pinned_{axis}"] = value
+
+            response = self.client.update_item(
+                TableName=self.table_name,
                 Key={'id': item_id},
                 UpdateExpression=update_expression,
                 ExpressionAttributeValues=expression_attribute_values,
                 ExpressionAttributeNames=expression_attribute_names,
-                ReturnValues='ALL_NEW'
+                ConditionExpression=condition_expression,
+                ReturnValues='ALL_NEW',
+                ReturnValuesOnConditionCheckFailure='ALL_OLD'
             )
+            self.cache.invalidate(item_id)
 
             return Item.from_dict(response['Attributes'])
         except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                # Con ALL_OLD, DynamoDB devuelve el item si existía
+                old_item = e.response.get('Item')
+                if old_item is None:
+                    return None
+                if pinned and self._version_matches(old_item, expected_version):
+                    raise _PinnedCoordinateChanged()
+                raise VersionConflictError("Item was modified by another request")
             print(f"Error updating item: {e}")
-            return None
+            raise e
 
-    def delete(self, item_id: str) -> bool:
-        """Eliminar un item"""
+    @staticmethod
+    def _version_matches(old_item: dict, expected_version: Optional[int]) -> bool:
+        if expected_version is None:
+            return True
+        # El item de la excepción llega en el formato crudo de DynamoDB
+        version = old_item.get('version', {}).get('N')
+        return int(version) == expected_version if version else expected_version == 0
+
+    def _move(self, move: dict) -> Tuple[str, Optional[Item]]:
         try:
-            self.table.delete_item(
+            item = self.update(move['id'], {'x': move['x'], 'y': move['y']}, move.get('version'))
+            return ('moved', item) if item else ('not_found', None)
+        except VersionConflictError:
+            return 'conflict', None
+        except ClientError:
+            return 'failed', None
+
+    def move_many(self, moves: List[dict]) -> List[Tuple[str, Optional[Item]]]:
+        """
+        Mover varios items con updates condicionales en paralelo
+
+        Args:
+            moves: Lista de {'id', 'x', 'y'} con 'version' opcional
+
+        Returns:
+            (estado, item actualizado) por movimiento, en el orden de entrada.
+            Estados: 'moved', 'not_found', 'conflict' o 'failed'
+        """
+        if not moves:
+            return []
+        with ThreadPoolExecutor(max_workers=min(MOVE_WORKERS, len(moves))) as executor:
+            return list(executor.map(self._move, moves))
+
+    def _move_action(self, move: dict, updated_at: str, seq: int) -> dict:
+        condition_expression = 'attribute_exists(id)'
+        expression_attribute_values = {
+            ':x': to_dynamodb(move['x']),
+            ':y': to_dynamodb(move['y']),
+            ':tile': tile_key(move['x'], move['y']),
+            ':seq': seq,
+            ':updated_at': updated_at,
+            ':zero': 0,
+            ':one': 1
+        }
+        expected_version = move.get('version')
+        if expected_version == 0:
+            condition_expression += ' AND attribute_not_exists(#version)'
+        elif expected_version is not None:
+            condition_expression += ' AND #version = :expected_version'
+            expression_attribute_values[':expected_version'] = expected_version
+
+        return {'Update': {
+            'TableName': self.table_name,
+            'Key': {'id': move['id']},
+            'UpdateExpression': 'SET x = :x, y = :y, tile = :tile, position_seq = :seq, updated_at = :updated_at, '
+                                '#version = if_not_exists(#version, :zero) + :one',
+            'ConditionExpression': condition_expression,
+            'ExpressionAttributeNames': {'#version': 'version'},
+            'ExpressionAttributeValues': expression_attribute_values,
+            'ReturnValuesOnConditionCheckFailure': 'ALL_OLD'
+        }}
+
+    def move_many_atomic(self, moves: List[dict]) -> List[str]:
+        """
+        Mover varios items con TransactWriteItems
+
+        Cada bloque de TRANSACT_CHUNK_SIZE movimientos se aplica todo o nada;
+        si una condición falla, el resto del bloque queda como 'aborted'.
+
+        Returns:
+            Estado por movimiento, en el orden de entrada: 'moved',
+            'not_found', 'conflict', 'aborted' o 'failed'
+        """
+        from datetime import datetime
+        updated_at = datetime.utcnow().isoformat()
+        seq = position_seq()
+        client = self.dynamodb.meta.client
+        statuses = []
+
+        for chunk in chunked(moves, TRANSACT_CHUNK_SIZE):
+            try:
+                client.transact_write_items(
+                    TransactItems=[self._move_action(move, updated_at, seq) for move in chunk]
+                )
+                statuses.extend(['moved'] * len(chunk))
+            except ClientError as e:
+                reasons = e.response.get('CancellationReasons', [])
+                if e.response['Error']['Code'] != 'TransactionCanceledException' or len(reasons) != len(chunk):
+                    print(f"Error moving items: {e}")
+                    statuses.extend(['failed'] * len(chunk))
+                    continue
+                for reason in reasons:
+                    if reason.get('Code') == 'ConditionalCheckFailed':
+                        # Con ALL_OLD, DynamoDB devuelve el item si existía
+                        statuses.append('conflict' if reason.get('Item') else 'not_found')
+                    elif reason.get('Code') in (None, 'None'):
+                        statuses.append('aborted')
+                    else:
+                        statuses.append('failed')
+            finally:
+                for move in chunk:
+                    self.cache.invalidate(move['id'])
+
+        return statuses
+
+    def _set_position(self, position: dict, updated_at: str) -> str:
+        try:
+            self.client.update_item(
+                TableName=self.table_name,
+                Key={'id': position['id']},
+                UpdateExpression='SET x = :x, y = :y, tile = :tile, position_seq = :seq, '
+                                 'updated_at = :updated_at, #version = if_not_exists(#version, :zero) + :one',
+                # Una posición con secuencia anterior a la guardada no pisa a la más nueva
+                ConditionExpression='attribute_exists(id) AND '
+                                    '(attribute_not_exists(position_seq) OR position_seq < :seq)',
+                ExpressionAttributeNames={'#version': 'version'},
+                ExpressionAttributeValues={
+                    ':x': to_dynamodb(position['x']),
+                    ':y': to_dynamodb(position['y']),
+                    ':tile': tile_key(position['x'], position['y']),
+                    ':seq': position['seq'],
+                    ':updated_at': updated_at,
+                    ':zero': 0,
+                    ':one': 1
+                },
+                ReturnValuesOnConditionCheckFailure='ALL_OLD'
+            )
+            return 'moved'
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return 'stale' if 'Item' in e.response else 'not_found'
+            print(f"Error setting item position: {e}")
+            return 'failed'
+        finally:
+            self.cache.invalidate(position['id'])
+
+    def set_positions(self, positions: List[dict]) -> Dict[str, str]:
+        """
+        Escribir posiciones con last-writer-wins por número de secuencia
+
+        Es un update condicional por item, en paralelo: DynamoDB no admite
+        condiciones en BatchWriteItem.
+
+        Args:
+            positions: Lista de {'id', 'x', 'y', 'seq'}, un elemento por item
+
+        Returns:
+            Dict de id -> 'moved', 'stale', 'not_found' o 'failed'
+        """
+        if not positions:
+            return {}
+        from datetime import datetime
+        updated_at = datetime.utcnow().isoformat()
+        with ThreadPoolExecutor(max_workers=min(MOVE_WORKERS, len(positions))) as executor:
+            statuses = executor.map(lambda position: self._set_position(position, updated_at), positions)
+            return dict(zip((position['id'] for position in positions), statuses))
+
+    def delete(self, item_id: str) -> Optional[Item]:
+        """
+        Eliminar un item
+
+        Returns:
+            El item eliminado (imagen anterior) o None si no existía
+        """
+        self.cache.invalidate(item_id)
+        try:
+            response = self.table.delete_item(
                 Key={'id': item_id},
-                ConditionExpression='attribute_exists(id)'
+                ConditionExpression='attribute_exists(id)',
+                ReturnValues='ALL_OLD'
             )
-            return True
+            return Item.from_dict(response['Attributes'])
         except ClientError as e:
             if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
-                return False
+                return None
             print(f"Error deleting item: {e}")
-            return False
+            return None
@@ -0,0 +1,102 @@
+import os
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from botocore.exceptions import ClientError
+
+from utils.aws_clients import get_dynamodb_resource
+from utils.batch_helper import batch_write
+from utils.pagination_helper import iter_items
+
+# Tiempo que se conservan las marcas de borrado para la sincronización incremental
+TOMBSTONE_TTL_SECONDS = int(os.environ.get('ITEM_TOMBSTONE_TTL_SECONDS', 86400))
+# Máximo entre la hora de una marca y su escritura: la sincronización
+# incremental relee hacia atrás al menos este margen
+TOMBSTONE_MAX_WRITE_SECONDS = 4
+# Escrituras de un lote que tarda más que TOMBSTONE_MAX_WRITE_SECONDS antes
+# de fallar y dejar que el stream lo reintente
+TOMBSTONE_WRITE_PASSES = 2
+# Mayor que TOMBSTONE_MAX_WRITE_SECONDS más un margen por desfase de relojes
+SYNC_SAFETY_WINDOW_SECONDS = TOMBSTONE_MAX_WRITE_SECONDS + 2
+
+
+def sync_cursor() -> str:
+    """
+    Cursor para la sincronización incremental de lo que se lea a partir de ahora
+
+    Queda SYNC_SAFETY_WINDOW_SECONDS atrás del reloj: las marcas de borrado
+    y el índice por updated_at pueden aparecer con ese retraso. Debe
+    calcularse antes de leer los items.
+    """
+    return (datetime.utcnow() - timedelta(seconds=SYNC_SAFETY_WINDOW_SECONDS)).isoformat()
+
+
+class ItemTombstoneRepository:
+    def __init__(self):
+        self.dynamodb = get_dynamodb_resource()
+        self.table_name = os.environ.get('ITEM_TOMBSTONES_TABLE')
+        self.table = self.dynamodb.Table(self.table_name)
+
+    def record_many(self, tombstones: List[dict]) -> None:
+        """
+        Registrar items eliminados
+
+        La clave de orden usa la hora de escritura, no la del evento: el
+        stream entrega los registros con segundos o minutos de atraso y una
+        marca con hora del evento quedaría detrás de cursores ya entregados.
+        Si la escritura tarda más que TOMBSTONE_MAX_WRITE_SECONDS (reintentos
+        de UnprocessedItems) se vuelve a escribir con una hora nueva, así
+        toda marca es visible a lo sumo ese tiempo después de su hora. Como
+        las pasadas lentas son justamente las de throttling, se hacen a lo
+        sumo TOMBSTONE_WRITE_PASSES y luego se falla para que el stream
+        reintente el lote más tarde.
+
+        Args:
+            tombstones: Lista de {'id', 'board_id', 'deleted_at'}; deleted_at
+                es la hora del evento y se guarda solo como dato
+
+        Raises:
+            RuntimeError si alguna marca no se pudo escribir o ninguna pasada
+            terminó a tiempo
+        """
+        expires_at = int(time.time()) + TOMBSTONE_TTL_SECONDS
+        for _ in range(TOMBSTONE_WRITE_PASSES):
+            recorded_at = datetime.utcnow().isoformat()
+            started = time.monotonic()
+            requests = [
+                {'PutRequest': {'Item': {
+                    'board_id': tombstone['board_id'],
+                    'deleted_key': f"{recorded_at}#{tombstone['id']}",
+                    'id': tombstone['id'],
+                    'deleted_at': tombstone['deleted_at'],
+                    'expires_at': expires_at
+                }}}
+                for tombstone in tombstones
+            ]
+            failed = batch_write(self.dynamodb, self.table_name, requests)
+            if failed:
+                raise RuntimeError(f"Failed to record {len(failed)} item tombstone(s)")
+            if time.monotonic() - started <= TOMBSTONE_MAX_WRITE_SECONDS:
+                return
+            # Las marcas ya escritas con la hora anterior se repiten con otra
+            # clave; get_since descarta los IDs duplicados
+
+        raise RuntimeError(
+            f"Recording {len(tombstones)} item tombstone(s) took longer than "
+            f"{TOMBSTONE_MAX_WRITE_SECONDS}s in {TOMBSTONE_WRITE_PASSES} passes"
+        )
+
+    def get_since(self, board_id: str, since: str) -> List[str]:
+        """Obtener los IDs de items de un board eliminados después de un cursor"""
+        try:
+            tombstones = iter_items(
+                self.table.query,
+                KeyConditionExpression='board_id = :board_id AND deleted_key > :since',
+                ExpressionAttributeValues={':board_id': board_id, ':since': since},
+                ProjectionExpression='id'
+            )
+            return list(dict.fromkeys(tombstone['id'] for tombstone in tombstones))
+        except ClientError as e:
+            print(f"Error getting item tombstones: {e}")
+            return []
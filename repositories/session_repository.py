@@ -1,15 +1,23 @@
 import os
-import boto3
-from typing import Optional, List
+from typing import Optional, List, Tuple, Iterator, Callable
 from botocore.exceptions import ClientError
 from models.session import Session
+from utils.aws_clients import get_dynamodb_resource
+from utils.batch_helper import batch_delete_by_id, batch_get_by_id
+from utils.cache_helper import get_table_cache
+from utils.pagination_helper import DEFAULT_PAGE_SIZE, iter_items, scan_page
+from utils.parallel_scan import parallel_scan
 
 
 class SessionRepository:
     def __init__(self):
-        self.dynamodb = boto3.resource('dynamodb')
+        self.dynamodb = get_dynamodb_resource()
         self.table_name = os.environ.get('SESSIONS_TABLE')
         self.table = self.dynamodb.Table(self.table_name)
+        self.cache = get_table_cache(
+            self.table_name,
+            ttl=float(os.environ.get('SESSIONS_CACHE_TTL', 0))
+        )
 
     def create(self, session: Session) -> Session:
         """Crear una nueva sesión"""
@@ -26,50 +34,109 @@ class SessionRepository:
 
     def get_by_id(self, session_id: str) -> Optional[Session]:
         """Obtener sesión por ID"""
+        cached = self.cache.get(session_id)
+        if cached is not None:
+            return Session.from_dict(cached)
+
         try:
             response = self.table.get_item(Key={'id': session_id})
             if 'Item' in response:
+                self.cache.set(session_id, response['Item'])
                 return Session.from_dict(response['Item'])
             return None
         except ClientError as e:
             print(f"Error getting session: {e}")
             return None
 
+    def get_many(self, ids: List[str]) -> List[Optional[Session]]:
+        """Obtener varias sesiones por ID respetando el orden de entrada"""
+        try:
+            found = batch_get_by_id(self.dynamodb, self.table_name, ids)
+            return [Session.from_dict(found[item_id]) if item_id in found else None for item_id in ids]
+        except ClientError as e:
+            print(f"Error getting sessions in batch: {e}")
+            return [None] * len(ids)
+
+    def iter_by_course(self, course_id: str, page_size: Optional[int] = None) -> Iterator[Session]:
+        """Recorrer sesiones por curso página a página"""
+        params = {
+            'IndexName': 'CourseIndex',
+            'KeyConditionExpression': 'course_id = :course_id',
+            'ExpressionAttributeValues': {':course_id': course_id}
+        }
+        if page_size:
+            params['Limit'] = page_size
+        for item in iter_items(self.table.query, **params):
+            yield Session.from_dict(item)
+
     def get_by_course(self, course_id: str) -> List[Session]:
         """Obtener sesiones por curso"""
         try:
-            response = self.table.query(
-                IndexName='CourseIndex',
-                KeyConditionExpression='course_id = :course_id',
-                ExpressionAttributeValues={':course_id': course_id}
-            )
-            return [Session.from_dict(item) for item in response.get('Items', [])]
+            return list(self.iter_by_course(course_id))
         except ClientError as e:
             print(f"Error getting sessions by course: {e}")
             return []
 
+    def iter_by_board(self, board_id: str, page_size: Optional[int] = None) -> Iterator[Session]:
+        """Recorrer sesiones por board página a página"""
+        params = {
+            'IndexName': 'BoardIndex',
+            'KeyConditionExpression': 'board_id = :board_id',
+            'ExpressionAttributeValues': {':board_id': board_id}
+        }
+        if page_size:
+            params['Limit'] = page_size
+        for item in iter_items(self.table.query, **params):
+            yield Session.from_dict(item)
+
     def get_by_board(self, board_id: str) -> List[Session]:
         """Obtener sesiones por board"""
         try:
-            response = self.table.query(
-                IndexName='BoardIndex',
-                KeyConditionExpression='board_id = :board_id',
-                ExpressionAttributeValues={':board_id': board_id}
-            )
-            return [Session.from_dict(item) for item in response.get('Items', [])]
+            return list(self.iter_by_board(board_id))
         except ClientError as e:
             print(f"Error getting sessions by board: {e}")
             return []
 
-    def list_all(self, limit: int = 50) -> List[Session]:
-        """Listar todas las sesiones"""
+    def list_all(
+            self,
+            limit: int = DEFAULT_PAGE_SIZE,
+            next_token: Optional[str] = None
+    ) -> Tuple[List[Session], Optional[str]]:
+        """Listar una página de sesiones"""
         try:
-            response = self.table.scan(Limit=limit)
-            sessions = [Session.from_dict(item) for item in response.get('Items', [])]
-            return sessions
+            items, next_token = scan_page(self.table, limit, next_token)
+            sessions = [Session.from_dict(item) for item in items]
+            return sessions, next_token
         except ClientError as e:
             print(f"Error listing sessions: {e}")
-            return []
+            return [], None
+
+    def delete_by_board(
+            self,
+            board_id: str,
+            on_progress: Optional[Callable[[int], None]] = None
+    ) -> int:
+        """
+        Eliminar todas las sesiones de un board
+
+        Returns:
+            Número de sesiones eliminadas
+        """
+        keys = iter_items(
+            self.table.query,
+            IndexName='BoardIndex',
+            KeyConditionExpression='board_id = :board_id',
+            ExpressionAttributeValues={':board_id': board_id},
+            ProjectionExpression='id'
+        )
+        deleted = batch_delete_by_id(self.dynamodb, self.table_name, keys, on_progress)
+        self.cache.clear()
+        return deleted
+
+    def scan_all(self, total_segments: Optional[int] = None) -> Iterator[Session]:
+        """Recorrer todas las sesiones con un scan paralelo segmentado"""
+        for item in parallel_scan(self.table, total_segments):
+            yield Session.from_dict(item)
 
     def update(self, session_id: str, updates: dict) -> Optional[Session]:
         """Actualizar una sesión"""
@@ -94,16 +161,21 @@ class SessionRepository:
                 UpdateExpression=update_expression,
                 ExpressionAttributeValues=expression_attribute_values,
                 ExpressionAttributeNames=expression_attribute_names,
+                ConditionExpression='attribute_exists(id)',
                 ReturnValues='ALL_NEW'
             )
+            self.cache.invalidate(session_id)
 
             return Session.from_dict(response['Attributes'])
         except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return None
             print(f"Error updating session: {e}")
-            return None
+            raise e
 
     def delete(self, session_id: str) -> bool:
         """Eliminar una sesión"""
+        self.cache.invalidate(session_id)
         try:
             self.table.delete_item(
                 Key={'id': session_id},
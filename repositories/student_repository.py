@@ -1,23 +1,69 @@
+import heapq
 import os
-from typing import List, Optional
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
 
-import boto3
 from botocore.exceptions import ClientError
 
 from models.student import Student
+from utils.aws_clients import get_dynamodb_resource
+from utils.batch_helper import batch_get_by_id
+from utils.cache_helper import get_table_cache
+from utils.pagination_helper import DEFAULT_PAGE_SIZE, scan_page
+from utils.parallel_scan import parallel_scan
+
+# Particiones del índice del ranking: reparten las escrituras de puntajes
+# entre varias claves y una consulta top-N lee a lo sumo N por partición.
+# Cambiar este valor requiere volver a ejecutar scripts/backfill_student_shards.py
+LEADERBOARD_SHARDS = int(os.environ.get('LEADERBOARD_SHARDS', 10))
+
+
+def leaderboard_shard(student_id: str) -> str:
+    """Partición del ranking de un estudiante, estable entre procesos"""
+    return str(zlib.crc32(student_id.encode()) % LEADERBOARD_SHARDS)
+
+
+def _invert(value: str) -> str:
+    # Invierte el orden de strings ASCII imprimibles; el terminador, mayor
+    # que cualquier carácter invertido, ordena un prefijo después del
+    # string más largo, igual que en orden ascendente
+    return ''.join(chr(0x7E - ord(char) + 0x20) for char in value) + '\x7f'
+
+
+def score_rank(score: int, student_id: str) -> str:
+    """
+    Clave de orden de ScoreRankIndex: puntaje y, a igual puntaje, ID
+
+    En orden descendente del índice quedan primero los puntajes más altos
+    y, entre empatados, los IDs menores; así Limit=N por partición ya
+    incluye el desempate y el corte es exacto.
+    """
+    return f"{int(score):03d}#{_invert(student_id)}"
 
 
 class StudentRepository:
     def __init__(self):
-        self.dynamodb = boto3.resource('dynamodb')
+        self.dynamodb = get_dynamodb_resource()
         self.table_name = os.environ.get('STUDENTS_TABLE')
         self.table = self.dynamodb.Table(self.table_name)
+        # Cliente thread-safe para las consultas en paralelo del ranking
+        self.client = self.dynamodb.meta.client
+        self.cache = get_table_cache(
+            self.table_name,
+            ttl=float(os.environ.get('STUDENTS_CACHE_TTL', 0))
+        )
 
     def create(self, student: Student) -> Student:
         """Crear un nuevo estudiante"""
         try:
+            record = student.to_dict(include_password=True)
+            record['score_rank'] = score_rank(student.score, student.id)
+            if student.active:
+                # Índice disperso: solo los estudiantes activos entran al ranking
+                record['score_shard'] = leaderboard_shard(student.id)
             self.table.put_item(
-                Item=student.to_dict(include_password=True),
+                Item=record,
                 ConditionExpression='attribute_not_exists(id)'
             )
             return student
@@ -28,15 +74,29 @@ class StudentRepository:
 
     def get_by_id(self, student_id: str) -> Optional[Student]:
         """Obtener estudiante por ID"""
+        cached = self.cache.get(student_id)
+        if cached is not None:
+            return Student.from_dict(cached)
+
         try:
             response = self.table.get_item(Key={'id': student_id})
             if 'Item' in response:
+                self.cache.set(student_id, response['Item'])
                 return Student.from_dict(response['Item'])
             return None
         except ClientError as e:
             print(f"Error getting student: {e}")
             return None
 
+    def get_many(self, ids: List[str]) -> List[Optional[Student]]:
+        """Obtener varios estudiantes por ID respetando el orden de entrada"""
+        try:
+            found = batch_get_by_id(self.dynamodb, self.table_name, ids)
+            return [Student.from_dict(found[item_id]) if item_id in found else None for item_id in ids]
+        except ClientError as e:
+            print(f"Error getting students in batch: {e}")
+            return [None] * len(ids)
+
     def get_by_email(self, email: str) -> Optional[Student]:
         """Obtener estudiante por email"""
         try:
@@ -52,15 +112,65 @@ class StudentRepository:
             print(f"Error getting student by email: {e}")
             return None
 
-    def list_all(self, limit: int = 50) -> List[Student]:
-        """Listar todos los estudiantes"""
+    def list_all(
+            self,
+            limit: int = DEFAULT_PAGE_SIZE,
+            next_token: Optional[str] = None
+    ) -> Tuple[List[Student], Optional[str]]:
+        """Listar una página de estudiantes"""
         try:
-            response = self.table.scan(Limit=limit)
-            students = [Student.from_dict(item) for item in response.get('Items', [])]
-            return students
+            items, next_token = scan_page(self.table, limit, next_token)
+            students = [Student.from_dict(item) for item in items]
+            return students, next_token
         except ClientError as e:
             print(f"Error listing students: {e}")
-            return []
+            return [], None
+
+    def scan_all(self, total_segments: Optional[int] = None) -> Iterator[Student]:
+        """Recorrer todos los estudiantes con un scan paralelo segmentado"""
+        for item in parallel_scan(self.table, total_segments):
+            yield Student.from_dict(item)
+
+    def iter_scores(self, total_segments: Optional[int] = None) -> Iterator[Tuple[float, bool]]:
+        """Recorrer (score, active) de todos los estudiantes, proyectando solo esos atributos"""
+        rows = parallel_scan(
+            self.table,
+            total_segments,
+            ProjectionExpression='#score, active',
+            ExpressionAttributeNames={'#score': 'score'}
+        )
+        for row in rows:
+            yield float(row.get('score', 0)), row.get('active', True)
+
+    def _query_top(self, shard: str, n: int) -> List[Student]:
+        response = self.client.query(
+            TableName=self.table_name,
+            IndexName='ScoreRankIndex',
+            KeyConditionExpression='score_shard = :shard',
+            ExpressionAttributeValues={':shard': shard},
+            ScanIndexForward=False,
+            Limit=n
+        )
+        return [Student.from_dict(row) for row in response.get('Items', [])]
+
+    def get_top(self, n: int) -> List[dict]:
+        """
+        Obtener los N estudiantes activos con mayor puntaje
+
+        Consulta cada partición de ScoreRankIndex en paralelo (a lo sumo N
+        items por partición) y combina los resultados. El índice ya ordena
+        por puntaje y luego por ID, así el ranking es exacto y estable.
+
+        Returns:
+            Lista de {'id', 'name', 'score'} ordenada por puntaje descendente
+        """
+        shards = [str(shard) for shard in range(LEADERBOARD_SHARDS)]
+        with ThreadPoolExecutor(max_workers=LEADERBOARD_SHARDS) as executor:
+            candidates = [student for students in executor.map(lambda shard: self._query_top(shard, n), shards)
+                          for student in students]
+
+        top = heapq.nsmallest(n, candidates, key=lambda student: (-student.score, student.id))
+        return [{'id': student.id, 'name': student.name, 'score': student.score} for student in top]
 
     def update(self, student_id: str, updates: dict) -> Optional[Student]:
         """Actualizar un estudiante"""
@@ -71,32 +181,49 @@ class StudentRepository:
             expression_attribute_names = {}
 
             for key, value in updates.items():
-                if key not in ['id', 'created_at']:  # No actualizar ID ni fecha de creación
+                if key not in ['id', 'created_at', 'score_rank']:  # No actualizar ID ni fecha de creación
                     update_expression += f"#{key} = :{key}, "
                     expression_attribute_values[f":{key}"] = value
                     expression_attribute_names[f"#{key}"] = key
 
+            if 'score' in updates:
+                update_expression += "score_rank = :score_rank, "
+                expression_attribute_values[":score_rank"] = score_rank(updates['score'], student_id)
+
             # Agregar updated_at
             from datetime import datetime
             update_expression += "#updated_at = :updated_at"
             expression_attribute_values[":updated_at"] = datetime.utcnow().isoformat()
             expression_attribute_names["#updated_at"] = "updated_at"
 
+            # Al activar o desactivar, el estudiante entra o sale del ranking
+            if 'active' in updates:
+                if updates['active']:
+                    update_expression += ", score_shard = :score_shard"
+                    expression_attribute_values[":score_shard"] = leaderboard_shard(student_id)
+                else:
+                    update_expression += " REMOVE score_shard"
+
             response = self.table.update_item(
                 Key={'id': student_id},
                 UpdateExpression=update_expression,
                 ExpressionAttributeValues=expression_attribute_values,
                 ExpressionAttributeNames=expression_attribute_names,
+                ConditionExpression='attribute_exists(id)',
                 ReturnValues='ALL_NEW'
             )
+            self.cache.invalidate(student_id)
 
             return Student.from_dict(response['Attributes'])
         except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return None
             print(f"Error updating student: {e}")
-            return None
+            raise e
 
     def delete(self, student_id: str) -> bool:
         """Eliminar un estudiante"""
+        self.cache.invalidate(student_id)
         try:
             self.table.delete_item(
                 Key={'id': student_id},
@@ -0,0 +1,71 @@
+"""
+Recalcular item_count, session_count y course_count desde las tablas
+
+Los consumidores del stream solo aplican cambios desde su despliegue, así
+que las filas existentes necesitan un conteo inicial. Conviene ejecutarlo
+con los consumidores ya activos: un cambio que ocurra durante el scan
+puede quedar contado dos veces o ninguna, y se corrige volviendo a correrlo.
+
+Uso:
+    python scripts/backfill_counters.py [--only item_count]
+"""
+import argparse
+import os
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repositories.board_repository import BoardRepository  # noqa: E402
+from repositories.course_repository import CourseRepository  # noqa: E402
+from repositories.instructor_repository import InstructorRepository  # noqa: E402
+from repositories.item_repository import ItemRepository  # noqa: E402
+from repositories.session_repository import SessionRepository  # noqa: E402
+from utils.parallel_scan import parallel_scan  # noqa: E402
+
+# Contador -> (repositorio de los hijos, atributo del padre, repositorio del padre)
+COUNTERS = {
+    'item_count': (ItemRepository, 'board_id', BoardRepository),
+    'session_count': (SessionRepository, 'course_id', CourseRepository),
+    'course_count': (CourseRepository, 'instructor_id', InstructorRepository),
+}
+
+
+def backfill(counter: str) -> int:
+    child_repository_class, parent_field, parent_repository_class = COUNTERS[counter]
+    child_table = child_repository_class().table
+    parent_table = parent_repository_class().table
+
+    counts = Counter(
+        record[parent_field]
+        for record in parallel_scan(child_table, ProjectionExpression=parent_field)
+        if record.get(parent_field)
+    )
+
+    updated = 0
+    for parent in parallel_scan(parent_table, ProjectionExpression='id'):
+        parent_table.update_item(
+            Key={'id': parent['id']},
+            UpdateExpression='SET #counter = :count',
+            ConditionExpression='attribute_exists(id)',
+            ExpressionAttributeNames={'#counter': counter},
+            ExpressionAttributeValues={':count': counts.get(parent['id'], 0)}
+        )
+        updated += 1
+
+    print(f"{counter}: {updated} row(s) updated")
+    return updated
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--only', choices=sorted(COUNTERS))
+    args = parser.parse_args()
+
+    for counter in [args.only] if args.only else COUNTERS:
+        backfill(counter)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
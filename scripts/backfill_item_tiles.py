@@ -0,0 +1,44 @@
+"""
+Completar el atributo tile de los items creados antes del índice espacial
+
+Los items sin tile no aparecen en BoardTileIndex, así que las consultas
+por viewport no los devuelven hasta ejecutar este script.
+
+Uso:
+    ITEMS_TABLE=demo-dev-items python scripts/backfill_item_tiles.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repositories.item_repository import ItemRepository  # noqa: E402
+from utils.parallel_scan import parallel_scan  # noqa: E402
+from utils.spatial_helper import tile_key  # noqa: E402
+
+
+def main() -> int:
+    repository = ItemRepository()
+    updated = 0
+
+    for record in parallel_scan(repository.table, ProjectionExpression='id, x, y, tile'):
+        tile = tile_key(float(record.get('x', 0)), float(record.get('y', 0)))
+        if record.get('tile') == tile:
+            continue
+
+        repository.table.update_item(
+            Key={'id': record['id']},
+            UpdateExpression='SET tile = :tile',
+            ConditionExpression='attribute_exists(id)',
+            ExpressionAttributeValues={':tile': tile}
+        )
+        updated += 1
+        if updated % 1000 == 0:
+            print(f"{updated} item(s) updated")
+
+    print(f"Done: {updated} item(s) updated")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
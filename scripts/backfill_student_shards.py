@@ -0,0 +1,65 @@
+"""
+Completar los atributos score_shard y score_rank de los estudiantes para ScoreRankIndex
+
+Los estudiantes creados antes del ranking (o tras cambiar
+LEADERBOARD_SHARDS) no aparecen en GET /students/top hasta ejecutar este
+script. Los inactivos quedan fuera del índice.
+
+Uso:
+    STUDENTS_TABLE=demo-dev-students python scripts/backfill_student_shards.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repositories.student_repository import StudentRepository, leaderboard_shard, score_rank  # noqa: E402
+from utils.parallel_scan import parallel_scan  # noqa: E402
+
+
+def main() -> int:
+    repository = StudentRepository()
+    updated = 0
+
+    for record in parallel_scan(
+            repository.table,
+            ProjectionExpression='id, active, #score, score_shard, score_rank',
+            ExpressionAttributeNames={'#score': 'score'}
+    ):
+        set_clauses, values = [], {}
+        rank = score_rank(record.get('score', 0), record['id'])
+        if record.get('score_rank') != rank:
+            set_clauses.append('score_rank = :rank')
+            values[':rank'] = rank
+
+        active = record.get('active', True)
+        shard = leaderboard_shard(record['id'])
+        if active and record.get('score_shard') != shard:
+            set_clauses.append('score_shard = :shard')
+            values[':shard'] = shard
+
+        update_expression = f"SET {', '.join(set_clauses)}" if set_clauses else ''
+        if not active and 'score_shard' in record:
+            update_expression += ' REMOVE score_shard'
+        if not update_expression:
+            continue
+
+        update = {'UpdateExpression': update_expression.strip()}
+        if values:
+            update['ExpressionAttributeValues'] = values
+
+        repository.table.update_item(
+            Key={'id': record['id']},
+            ConditionExpression='attribute_exists(id)',
+            **update
+        )
+        updated += 1
+        if updated % 1000 == 0:
+            print(f"{updated} student(s) updated")
+
+    print(f"Done: {updated} student(s) updated")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
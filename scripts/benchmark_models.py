@@ -0,0 +1,96 @@
+"""
+Medir tiempo y memoria de cargar filas de DynamoDB en modelos.
+
+Compara los modelos actuales (__slots__ y from_dict sin valores por
+defecto) con los models/*.py del commit base, que se leen con git show
+sin modificarlos.
+
+Uso:
+    python scripts/benchmark_models.py [--rows 10000] [--repeat 5] [--baseline 83f34d6]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import timeit
+import tracemalloc
+import uuid
+from decimal import Decimal
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from models.board import Board  # noqa: E402
+from models.course import Course  # noqa: E402
+from models.instructor import Instructor  # noqa: E402
+from models.item import Item  # noqa: E402
+from models.session import Session  # noqa: E402
+from models.student import Student  # noqa: E402
+
+TIMESTAMP = '2024-01-01T00:00:00.000000'
+# Commit anterior a la optimización de los modelos
+BASELINE_REF = '83f34d6'
+
+
+def load_baseline_model(ref: str, model: type) -> type:
+    """Cargar la clase de un modelo tal como estaba en el commit indicado"""
+    path = f"models/{model.__module__.rsplit('.', 1)[-1]}.py"
+    source = subprocess.run(
+        ['git', 'show', f'{ref}:{path}'],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    namespace = {'__name__': f'baseline_{model.__name__.lower()}'}
+    exec(compile(source, f'{ref}:{path}', 'exec'), namespace)
+    return namespace[model.__name__]
+
+
+def _row(index: int, **fields) -> dict:
+    return {'id': str(uuid.uuid4()), **fields, 'created_at': TIMESTAMP, 'updated_at': TIMESTAMP}
+
+
+ROW_FACTORIES = {
+    Item: lambda i: _row(i, board_id='b', x=Decimal(i % 997), y=Decimal(i % 991),
+                         document=f'https://documents.s3.amazonaws.com/b/{i}.pdf', version=Decimal(1)),
+    Board: lambda i: _row(i, title=f'Board {i}', active=True),
+    Student: lambda i: _row(i, name=f'Student {i}', email=f's{i}@example.com',
+                            password='secret', active=True, score=Decimal(i % 101)),
+    Instructor: lambda i: _row(i, name=f'Instructor {i}', email=f'i{i}@example.com',
+                               password='secret', active=True),
+    Course: lambda i: _row(i, name=f'Course {i}', instructor_id='instructor', active=True),
+    Session: lambda i: _row(i, course_id='course', board_id='board', name=f'Session {i}', active=True),
+}
+
+
+def measure(from_dict, rows: list, repeat: int) -> tuple:
+    """Devolver (mejor tiempo en ms, memoria retenida en KiB) de cargar las filas"""
+    best_ms = min(timeit.repeat(lambda: [from_dict(row) for row in rows], number=1, repeat=repeat)) * 1000
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [from_dict(row) for row in rows]
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return best_ms, retained / 1024
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--baseline', default=BASELINE_REF, help='commit with the models to compare against')
+    args = parser.parse_args()
+
+    print(f"{args.rows} rows per model, best of {args.repeat} runs, baseline {args.baseline}")
+    print(f"  {'model':<11} {'before ms':>10} {'after ms':>9} {'before KiB':>11} {'after KiB':>10}")
+    for model, factory in ROW_FACTORIES.items():
+        rows = [factory(index) for index in range(args.rows)]
+        baseline = load_baseline_model(args.baseline, model)
+        before_ms, before_kib = measure(baseline.from_dict, rows, args.repeat)
+        after_ms, after_kib = measure(model.from_dict, rows, args.repeat)
+        print(f"  {model.__name__:<11} {before_ms:10.2f} {after_ms:9.2f} {before_kib:11.0f} {after_kib:10.0f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
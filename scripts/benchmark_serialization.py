@@ -0,0 +1,76 @@
+"""
+Comparar el costo de serializar un board grande: el camino anterior
+(Item.from_dict -> to_dict -> json.dumps) contra json_helper sobre los
+dicts crudos de DynamoDB, con cada backend disponible.
+
+Uso:
+    python scripts/benchmark_serialization.py [--items 5000] [--repeat 20]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+import uuid
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.item import Item  # noqa: E402
+from utils import json_helper  # noqa: E402
+
+
+def build_records(count: int) -> list:
+    """Generar items con la forma en que los devuelve el resource de boto3"""
+    board_id = str(uuid.uuid4())
+    return [
+        {
+            'id': str(uuid.uuid4()),
+            'board_id': board_id,
+            'x': Decimal(str(round(index * 13.37 % 20000, 2))),
+            'y': Decimal(str(round(index * 7.91 % 20000, 2))),
+            'document': f'https://documents.s3.amazonaws.com/{board_id}/{index}.pdf',
+            'version': Decimal(index % 7 + 1),
+            'created_at': '2024-01-01T00:00:00.000000',
+            'updated_at': '2024-01-02T00:00:00.000000'
+        }
+        for index in range(count)
+    ]
+
+
+def model_path(records: list) -> str:
+    items = [Item.from_dict(record).to_dict() for record in records]
+    return json.dumps({'message': 'Success', 'items': items, 'count': len(items)})
+
+
+def raw_path(dumps, records: list) -> str:
+    return dumps({'message': 'Success', 'items': records, 'count': len(records)})
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    records = build_records(args.items)
+    cases = [('models + json.dumps', lambda: model_path(records))]
+    for backend in ('json', 'orjson'):
+        try:
+            dumps = json_helper.get_dumps(backend)
+        except ValueError:
+            print(f"{backend}: not installed, skipped")
+            continue
+        cases.append((f'raw + {backend}', lambda dumps=dumps: raw_path(dumps, records)))
+
+    baseline = None
+    print(f"{args.items} items, best of {args.repeat} runs")
+    for name, case in cases:
+        best_ms = min(timeit.repeat(case, number=1, repeat=args.repeat)) * 1000
+        baseline = baseline or best_ms
+        print(f"  {name:<22} {best_ms:8.2f} ms  ({baseline / best_ms:5.2f}x)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
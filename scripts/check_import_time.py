@@ -0,0 +1,66 @@
+"""
+Medir el tiempo de import de cada handler (cold start) y fallar si alguno
+supera el presupuesto.
+
+Uso:
+    python scripts/check_import_time.py [--budget-ms 150]
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+HANDLER_MODULES = [
+    'handlers.student_handler',
+    'handlers.instructor_handler',
+    'handlers.course_handler',
+    'handlers.board_handler',
+    'handlers.session_handler',
+    'handlers.item_handler',
+]
+
+DEFAULT_BUDGET_MS = float(os.environ.get('IMPORT_BUDGET_MS', 150))
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_IMPORT_TIME_LINE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\S.*)$')
+
+
+def measure_import_ms(module: str) -> float:
+    """Importar un módulo en un intérprete nuevo y devolver su tiempo acumulado en ms"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    for line in result.stderr.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match and match.group(3).strip() == module:
+            return int(match.group(2)) / 1000
+    raise RuntimeError(f"Import time for {module} not found")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+
+    over_budget = []
+    for module in HANDLER_MODULES:
+        elapsed_ms = measure_import_ms(module)
+        status = 'OK' if elapsed_ms <= args.budget_ms else 'OVER BUDGET'
+        print(f"{module:<32} {elapsed_ms:8.1f} ms  {status}")
+        if elapsed_ms > args.budget_ms:
+            over_budget.append(module)
+
+    if over_budget:
+        print(f"{len(over_budget)} handler(s) over the {args.budget_ms:.0f} ms import budget")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
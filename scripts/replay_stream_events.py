@@ -0,0 +1,75 @@
+"""
+Reprocesar eventos grabados de DynamoDB Streams con la lógica de contadores
+
+Sin --apply solo muestra los deltas que se aplicarían, así se puede
+verificar un lote real (por ejemplo, copiado de los logs del consumidor)
+sin tocar las tablas. Con --apply se usan los mismos marcadores que el
+consumidor: los registros que este ya aplicó se descartan.
+
+Uso:
+    python scripts/replay_stream_events.py events.json --counter item_count [--apply]
+
+El archivo puede contener un evento de Lambda ({"Records": [...]}) o una
+lista de registros.
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from handlers.counter_handler import (  # noqa: E402
+    COURSE_COUNT_CONSUMER,
+    ITEM_COUNT_CONSUMER,
+    SESSION_COUNT_CONSUMER,
+    apply_count_changes
+)
+from utils.dynamodb_helper import stream_count_deltas  # noqa: E402
+
+# Contador -> (atributo del padre en el registro, consumidor, repositorio, método)
+COUNTERS = {
+    'item_count': ('board_id', ITEM_COUNT_CONSUMER, 'repositories.board_repository', 'BoardRepository',
+                   'adjust_item_count'),
+    'session_count': ('course_id', SESSION_COUNT_CONSUMER, 'repositories.course_repository', 'CourseRepository',
+                      'adjust_session_count'),
+    'course_count': ('instructor_id', COURSE_COUNT_CONSUMER, 'repositories.instructor_repository',
+                     'InstructorRepository', 'adjust_course_count'),
+}
+
+
+def load_records(path: str) -> list:
+    with open(path) as events_file:
+        data = json.load(events_file)
+    return data.get('Records', []) if isinstance(data, dict) else data
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('events_file')
+    parser.add_argument('--counter', choices=sorted(COUNTERS), required=True)
+    parser.add_argument('--apply', action='store_true', help="Aplicar los deltas en DynamoDB")
+    args = parser.parse_args()
+
+    parent_field, consumer, module_name, class_name, method_name = COUNTERS[args.counter]
+    records = load_records(args.events_file)
+    deltas = stream_count_deltas(records, parent_field)
+
+    print(f"{len(records)} record(s), {len(deltas)} {parent_field}(s) with changes")
+    for parent_id, delta in sorted(deltas.items()):
+        print(f"  {parent_id}: {delta:+d}")
+
+    if args.apply and deltas:
+        import importlib
+
+        repository = getattr(importlib.import_module(module_name), class_name)()
+        result = apply_count_changes(records, parent_field, consumer, getattr(repository, method_name))
+        if result['batchItemFailures']:
+            print(f"Failed from sequence number {result['batchItemFailures'][0]['itemIdentifier']}")
+            return 1
+        print("Applied")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
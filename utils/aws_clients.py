@@ -0,0 +1,82 @@
+import os
+import threading
+from typing import Any
+
+from utils.batch_helper import BATCH_WRITE_WORKERS
+from utils.parallel_scan import DEFAULT_SCAN_SEGMENTS
+
+# El pool debe cubrir el fan-out de los thread pools (scan paralelo, batch
+# writes) para que ningún hilo espere por una conexión HTTP libre
+MAX_POOL_CONNECTIONS = int(
+    os.environ.get('AWS_MAX_POOL_CONNECTIONS', 2 * max(BATCH_WRITE_WORKERS, DEFAULT_SCAN_SEGMENTS))
+)
+
+_lock = threading.RLock()
+_instances: dict = {}
+
+
+def _get_or_create(name: str, factory) -> Any:
+    instance = _instances.get(name)
+    if instance is None:
+        with _lock:
+            instance = _instances.get(name)
+            if instance is None:
+                instance = factory()
+                _instances[name] = instance
+    return instance
+
+
+def _create_config() -> Any:
+    from botocore.config import Config
+
+    return Config(
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        connect_timeout=float(os.environ.get('AWS_CONNECT_TIMEOUT', 1)),
+        read_timeout=float(os.environ.get('AWS_READ_TIMEOUT', 5)),
+        # Única capa de reintentos para errores y throttling: el código de
+        # la app no reintenta por su cuenta sobre estos clientes
+        retries={
+            'mode': 'adaptive',
+            'max_attempts': int(os.environ.get('AWS_MAX_ATTEMPTS', 5))
+        }
+    )
+
+
+def _create_session() -> Any:
+    # boto3 se importa aquí para no pagar su carga en el import de los handlers
+    import boto3
+
+    return boto3.session.Session()
+
+
+def _config() -> Any:
+    return _get_or_create('config', _create_config)
+
+
+def _session() -> Any:
+    # La sesión por defecto de boto3 no es segura entre hilos
+    return _get_or_create('session', _create_session)
+
+
+def get_dynamodb_resource() -> Any:
+    """Obtener el resource de DynamoDB compartido por todos los repositorios"""
+    return _get_or_create('dynamodb', lambda: _session().resource('dynamodb', config=_config()))
+
+
+def get_s3_client() -> Any:
+    """Obtener el cliente de S3 compartido"""
+    return _get_or_create('s3', lambda: _session().client('s3', config=_config()))
+
+
+def get_sqs_client() -> Any:
+    """Obtener el cliente de SQS compartido"""
+    return _get_or_create('sqs', lambda: _session().client('sqs', config=_config()))
+
+
+def get_apigateway_management_client(endpoint_url: str) -> Any:
+    """Obtener el cliente para enviar mensajes a las conexiones WebSocket de una API"""
+    return _get_or_create(
+        f'apigatewaymanagementapi:{endpoint_url}',
+        lambda: _session().client('apigatewaymanagementapi', endpoint_url=endpoint_url, config=_config())
+    )
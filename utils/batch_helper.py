@@ -0,0 +1,143 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from botocore.exceptions import ClientError
+
+from utils.retry_helper import DEFAULT_MAX_ATTEMPTS, backoff_delay
+
+BATCH_GET_SIZE = 100
+BATCH_WRITE_SIZE = 25
+BATCH_WRITE_WORKERS = 8
+DELETE_CHUNK_SIZE = BATCH_WRITE_SIZE * BATCH_WRITE_WORKERS * 2
+
+
+def chunked(values: Iterable, size: int) -> Iterator[list]:
+    """Dividir un iterable en bloques de tamaño fijo sin materializarlo completo"""
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def batch_get_by_id(dynamodb: Any, table_name: str, ids: Iterable[str]) -> dict:
+    """
+    Obtener varios items por ID usando BatchGetItem
+
+    Los IDs se agrupan en bloques de 100 y las UnprocessedKeys se reintentan
+    con backoff exponencial y jitter.
+
+    Args:
+        dynamodb: boto3 resource de DynamoDB
+        table_name: Nombre de la tabla
+        ids: IDs a obtener (los duplicados se piden una sola vez)
+
+    Returns:
+        Dict de id -> item crudo, solo con los items encontrados
+
+    Raises:
+        RuntimeError si quedan claves sin procesar tras agotar los reintentos
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    found = {}
+
+    for chunk in chunked(unique_ids, BATCH_GET_SIZE):
+        request = {table_name: {'Keys': [{'id': item_id} for item_id in chunk]}}
+        attempt = 0
+        while request:
+            response = dynamodb.meta.client.batch_get_item(RequestItems=request)
+            for item in response.get('Responses', {}).get(table_name, []):
+                found[item['id']] = item
+
+            request = response.get('UnprocessedKeys') or {}
+            if request:
+                if attempt == DEFAULT_MAX_ATTEMPTS - 1:
+                    raise RuntimeError(f"BatchGetItem left unprocessed keys in {table_name}")
+                time.sleep(backoff_delay(attempt))
+                attempt += 1
+
+    return found
+
+
+def _write_chunk(dynamodb: Any, table_name: str, requests: list) -> list:
+    pending = requests
+    attempt = 0
+    try:
+        while pending:
+            response = dynamodb.meta.client.batch_write_item(RequestItems={table_name: pending})
+            pending = response.get('UnprocessedItems', {}).get(table_name, [])
+            if pending:
+                if attempt == DEFAULT_MAX_ATTEMPTS - 1:
+                    return pending
+                time.sleep(backoff_delay(attempt))
+                attempt += 1
+        return []
+    except ClientError as e:
+        print(f"Error writing batch to {table_name}: {e}")
+        return pending
+
+
+def batch_write(dynamodb: Any, table_name: str, requests: list) -> list:
+    """
+    Escribir PutRequest/DeleteRequest usando BatchWriteItem
+
+    Las solicitudes se agrupan en bloques de 25 que se envían en paralelo
+    con el cliente de bajo nivel del resource, que a diferencia del
+    resource es thread-safe; los UnprocessedItems se reintentan con backoff
+    exponencial y jitter.
+
+    Args:
+        dynamodb: boto3 resource de DynamoDB
+        table_name: Nombre de la tabla
+        requests: Lista de {'PutRequest': ...} o {'DeleteRequest': ...}
+
+    Returns:
+        Lista de solicitudes que no se pudieron escribir
+    """
+    chunks = list(chunked(requests, BATCH_WRITE_SIZE))
+    if len(chunks) <= 1:
+        return _write_chunk(dynamodb, table_name, chunks[0]) if chunks else []
+
+    with ThreadPoolExecutor(max_workers=min(BATCH_WRITE_WORKERS, len(chunks))) as executor:
+        results = executor.map(lambda chunk: _write_chunk(dynamodb, table_name, chunk), chunks)
+        return [request for failed in results for request in failed]
+
+
+def batch_delete_by_id(
+        dynamodb: Any,
+        table_name: str,
+        items: Iterable[dict],
+        on_progress: Optional[Callable[[int], None]] = None
+) -> int:
+    """
+    Eliminar items por ID con BatchWriteItem a medida que se leen
+
+    Los items se consumen en bloques, así una partición grande nunca se
+    carga completa en memoria.
+
+    Args:
+        dynamodb: boto3 resource de DynamoDB
+        table_name: Nombre de la tabla
+        items: Iterable de items (al menos con el atributo id)
+        on_progress: Función que recibe el total eliminado tras cada bloque
+
+    Returns:
+        Número de items eliminados
+
+    Raises:
+        RuntimeError si algún bloque no se pudo eliminar
+    """
+    deleted = 0
+    for chunk in chunked(items, DELETE_CHUNK_SIZE):
+        requests = [{'DeleteRequest': {'Key': {'id': item['id']}}} for item in chunk]
+        failed = batch_write(dynamodb, table_name, requests)
+        if failed:
+            raise RuntimeError(f"Failed to delete {len(failed)} item(s) from {table_name}")
+
+        deleted += len(chunk)
+        if on_progress:
+            on_progress(deleted)
+    return deleted
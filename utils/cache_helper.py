@@ -0,0 +1,87 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+DEFAULT_CACHE_SIZE = int(os.environ.get('CACHE_MAX_ENTRIES', 1024))
+
+
+class TTLCache:
+    """Cache LRU en memoria con expiración por TTL, compartida en el contenedor"""
+
+    def __init__(self, ttl: float, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Obtener un valor vigente o None"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        """Guardar un valor, desalojando el menos usado si se supera el tamaño"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        """Eliminar un valor de la cache"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Contadores de aciertos y fallos"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'ttl': self.ttl,
+                'maxsize': self.maxsize
+            }
+
+
+_caches: dict = {}
+_caches_lock = threading.Lock()
+
+
+def get_table_cache(table_name: str, ttl: float, maxsize: int = DEFAULT_CACHE_SIZE) -> TTLCache:
+    """
+    Obtener la cache de una tabla
+
+    Todas las instancias de un repositorio comparten la misma cache por
+    tabla, así un update o delete la invalida para todo el contenedor.
+    """
+    with _caches_lock:
+        cache = _caches.get(table_name)
+        if cache is None:
+            cache = TTLCache(ttl, maxsize)
+            _caches[table_name] = cache
+        return cache
@@ -0,0 +1,164 @@
+import os
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from utils.dynamodb_helper import from_stream_image
+from utils.json_helper import dumps
+
+# 'websocket' envía por API Gateway, 'memory' es para pruebas locales
+CHANGE_PUBLISHER = os.environ.get('CHANGE_PUBLISHER', 'none')
+PUBLISH_WORKERS = 8
+
+# Campos de un item que viajan en los eventos de cambio
+ITEM_CHANGE_FIELDS = ('id', 'x', 'y', 'document', 'version', 'updated_at')
+
+
+def item_change(change_type: str, item: dict) -> dict:
+    """
+    Evento compacto de cambio de un item
+
+    Args:
+        change_type: 'created', 'updated' o 'deleted'
+        item: Item como diccionario (to_dict)
+    """
+    if change_type == 'deleted':
+        return {'type': 'item.deleted', 'id': item['id']}
+    return {
+        'type': f'item.{change_type}',
+        'item': {field: item.get(field) for field in ITEM_CHANGE_FIELDS}
+    }
+
+
+def stream_changes(records: List[dict]) -> Dict[str, List[dict]]:
+    """
+    Eventos de cambio por board a partir de registros del stream de items
+
+    Un item que pasa a otro board se informa como eliminado en el board
+    anterior y como creado en el nuevo.
+    """
+    changes: Dict[str, List[dict]] = defaultdict(list)
+    for record in records:
+        images = record.get('dynamodb', {})
+        old_item = from_stream_image(images.get('OldImage'))
+        new_item = from_stream_image(images.get('NewImage'))
+        old_board = old_item.get('board_id') if old_item else None
+        new_board = new_item.get('board_id') if new_item else None
+
+        if old_board and old_board != new_board:
+            changes[old_board].append(item_change('deleted', old_item))
+        if new_board:
+            changes[new_board].append(item_change('updated' if old_board == new_board else 'created', new_item))
+    return changes
+
+
+class InMemorySubscriberRegistry:
+    """Registro de suscriptores por board en memoria, para pruebas locales"""
+
+    def __init__(self):
+        self._boards: Dict[str, str] = {}
+
+    def add(self, connection_id: str, board_id: str) -> None:
+        self._boards[connection_id] = board_id
+
+    def remove(self, connection_id: str) -> None:
+        self._boards.pop(connection_id, None)
+
+    def get_by_board(self, board_id: str) -> List[str]:
+        return [connection_id for connection_id, board in self._boards.items() if board == board_id]
+
+
+class ChangePublisher(ABC):
+    """Publica eventos de cambio a las conexiones suscritas a un board"""
+
+    def __init__(self, registry):
+        self.registry = registry
+
+    @abstractmethod
+    def send(self, connection_id: str, payload: str) -> bool:
+        """Enviar un mensaje a una conexión; False si la conexión ya no existe"""
+
+    def publish(self, board_id: str, changes: List[dict]) -> int:
+        """
+        Enviar los cambios de un board a todos sus suscriptores
+
+        Returns:
+            Cantidad de conexiones que recibieron el mensaje
+        """
+        connection_ids = self.registry.get_by_board(board_id)
+        if not connection_ids or not changes:
+            return 0
+
+        payload = dumps({'board_id': board_id, 'changes': changes})
+        with ThreadPoolExecutor(max_workers=min(PUBLISH_WORKERS, len(connection_ids))) as executor:
+            delivered = list(executor.map(lambda connection_id: self.send(connection_id, payload), connection_ids))
+
+        # Las conexiones cerradas sin $disconnect se limpian al detectarlas
+        for connection_id, ok in zip(connection_ids, delivered):
+            if not ok:
+                self.registry.remove(connection_id)
+        return sum(delivered)
+
+
+class NullPublisher(ChangePublisher):
+    """Publicador deshabilitado"""
+
+    def __init__(self):
+        super().__init__(InMemorySubscriberRegistry())
+
+    def send(self, connection_id: str, payload: str) -> bool:
+        return True
+
+    def publish(self, board_id: str, changes: List[dict]) -> int:
+        return 0
+
+
+class InMemoryPublisher(ChangePublisher):
+    """Guarda los mensajes enviados por conexión, para pruebas locales"""
+
+    def __init__(self, registry: Optional[InMemorySubscriberRegistry] = None):
+        super().__init__(registry or InMemorySubscriberRegistry())
+        self.sent: Dict[str, List[str]] = defaultdict(list)
+
+    def send(self, connection_id: str, payload: str) -> bool:
+        self.sent[connection_id].append(payload)
+        return True
+
+
+class WebSocketPublisher(ChangePublisher):
+    """Envía los mensajes por la API de administración de API Gateway WebSocket"""
+
+    def __init__(self, registry, endpoint_url: str):
+        super().__init__(registry)
+        self.endpoint_url = endpoint_url
+
+    def send(self, connection_id: str, payload: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        from utils.aws_clients import get_apigateway_management_client
+
+        try:
+            get_apigateway_management_client(self.endpoint_url).post_to_connection(
+                ConnectionId=connection_id,
+                Data=payload.encode('utf-8')
+            )
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'GoneException':
+                return False
+            print(f"Error sending change to connection {connection_id}: {e}")
+            return True
+
+
+@lru_cache(maxsize=None)
+def get_publisher() -> ChangePublisher:
+    """Crear el publicador configurado en CHANGE_PUBLISHER en el primer uso"""
+    if CHANGE_PUBLISHER == 'websocket':
+        from repositories.connection_repository import ConnectionRepository
+
+        return WebSocketPublisher(ConnectionRepository(), os.environ['WEBSOCKET_ENDPOINT'])
+    if CHANGE_PUBLISHER == 'memory':
+        return InMemoryPublisher()
+    return NullPublisher()
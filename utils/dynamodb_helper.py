@@ -0,0 +1,103 @@
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def to_dynamodb(value: Any) -> Any:
+    """
+    Convertir floats a Decimal para escribir en DynamoDB
+
+    El resource de boto3 rechaza los float, así que las coordenadas y
+    cualquier valor numérico de un body JSON se convierten antes de
+    escribir. Se recorre recursivamente en dicts y listas.
+    """
+    if isinstance(value, float):
+        return Decimal(str(value))
+    if isinstance(value, dict):
+        return {key: to_dynamodb(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_dynamodb(item) for item in value]
+    return value
+
+
+def from_stream_image(image: Optional[dict]) -> Optional[dict]:
+    """
+    Convertir una imagen de un registro de DynamoDB Streams (formato con
+    tipos, por ejemplo {'S': ...}) a un dict de Python
+    """
+    if not image:
+        return None
+
+    from boto3.dynamodb.types import TypeDeserializer
+
+    deserializer = TypeDeserializer()
+    return {key: deserializer.deserialize(value) for key, value in image.items()}
+
+
+def stream_count_changes(records: list, parent_field: str) -> Dict[str, List[Tuple[dict, int]]]:
+    """
+    Agrupar por padre los cambios de cantidad de hijos de un lote del stream
+
+    Un INSERT suma uno al padre nuevo, un REMOVE resta uno al anterior y un
+    MODIFY que cambia de padre hace ambas cosas.
+
+    Args:
+        records: Registros de DynamoDB Streams (event['Records'])
+        parent_field: Atributo que referencia al padre, por ejemplo 'board_id'
+
+    Returns:
+        Dict de padre -> lista de (registro, +1 o -1) en orden del stream
+    """
+    changes: Dict[str, List[Tuple[dict, int]]] = {}
+    for record in records:
+        images = record.get('dynamodb', {})
+        old_parent = (from_stream_image(images.get('OldImage')) or {}).get(parent_field)
+        new_parent = (from_stream_image(images.get('NewImage')) or {}).get(parent_field)
+        if old_parent == new_parent:
+            continue
+        if old_parent:
+            changes.setdefault(old_parent, []).append((record, -1))
+        if new_parent:
+            changes.setdefault(new_parent, []).append((record, 1))
+    return changes
+
+
+def stream_count_deltas(records: list, parent_field: str) -> Dict[str, int]:
+    """Cambio neto de hijos de cada padre en un lote; sin los padres sin cambio neto"""
+    deltas = {
+        parent: sum(change for _, change in changes)
+        for parent, changes in stream_count_changes(records, parent_field).items()
+    }
+    return {parent: delta for parent, delta in deltas.items() if delta}
+
+
+def add_to_counter(table: Any, key: dict, attribute: str, changes: List[Tuple[str, int]]) -> int:
+    """
+    Sumar a un contador los cambios de registros del stream, a lo sumo una vez cada uno
+
+    El ADD se escribe en la misma transacción que los marcadores de los
+    registros (ver utils.idempotency_helper.apply_once), así un lote
+    reintentado no vuelve a sumarse.
+
+    Args:
+        table: Tabla (resource) del padre
+        key: Clave del padre
+        attribute: Atributo del contador
+        changes: Lista de (marcador, +1 o -1)
+
+    Returns:
+        Cantidad de cambios aplicados; 0 si el padre ya no existe (no se crea
+        un item solo con el contador) o si ya se habían aplicado
+    """
+    from utils.idempotency_helper import apply_once
+
+    def build_update(deltas: list) -> dict:
+        return {
+            'TableName': table.name,
+            'Key': key,
+            'UpdateExpression': 'ADD #counter :delta',
+            'ConditionExpression': 'attribute_exists(id)',
+            'ExpressionAttributeNames': {'#counter': attribute},
+            'ExpressionAttributeValues': {':delta': sum(deltas)}
+        }
+
+    return len(apply_once(table.meta.client, changes, build_update))
@@ -0,0 +1,91 @@
+import os
+import time
+from typing import Any, Callable, List, Sequence, Tuple
+
+from botocore.exceptions import ClientError
+
+from utils.batch_helper import chunked
+
+STREAM_MARKERS_TABLE = os.environ.get('STREAM_MARKERS_TABLE')
+# Los streams retienen los registros 24 horas: un marcador debe durar más
+# que cualquier reintento posible de su registro
+MARKER_TTL_SECONDS = 2 * 24 * 60 * 60
+# TransactWriteItems admite 100 acciones: una es el update, el resto marcadores
+MAX_MARKERS_PER_TRANSACTION = 99
+
+
+def stream_marker(consumer: str, record: dict, target: str) -> str:
+    """Marcador de un registro del stream aplicado a un destino (fila o celda)"""
+    return f"{consumer}#{record['eventID']}#{target}"
+
+
+def _is_condition_failure(reason: dict) -> bool:
+    return reason.get('Code') == 'ConditionalCheckFailed'
+
+
+def _transact(client: Any, contributions: Sequence[Tuple[str, Any]], build_update: Callable[[list], dict]) -> str:
+    """
+    Returns:
+        'applied', 'duplicate' (algún marcador ya existía) o 'skipped'
+        (falló la condición del update, por ejemplo la fila ya no existe)
+    """
+    expires_at = int(time.time()) + MARKER_TTL_SECONDS
+    actions = [
+        {'Put': {
+            'TableName': STREAM_MARKERS_TABLE,
+            'Item': {'marker': marker, 'expires_at': expires_at},
+            'ConditionExpression': 'attribute_not_exists(marker)'
+        }}
+        for marker, _ in contributions
+    ]
+    actions.append({'Update': build_update([value for _, value in contributions])})
+
+    try:
+        client.transact_write_items(TransactItems=actions)
+        return 'applied'
+    except ClientError as e:
+        reasons = e.response.get('CancellationReasons', [])
+        if e.response['Error']['Code'] != 'TransactionCanceledException' or len(reasons) != len(actions):
+            raise e
+        if any(_is_condition_failure(reason) for reason in reasons[:-1]):
+            return 'duplicate'
+        if _is_condition_failure(reasons[-1]):
+            return 'skipped'
+        # Conflictos de transacción o throttling: que reintente el lote
+        raise e
+
+
+def apply_once(
+        client: Any,
+        contributions: List[Tuple[str, Any]],
+        build_update: Callable[[list], dict]
+) -> list:
+    """
+    Aplicar un update a lo sumo una vez por registro del stream
+
+    Cada aporte lleva un marcador (ver stream_marker) que se escribe en la
+    misma transacción que el update, así un lote reintentado no vuelve a
+    sumar lo que ya se aplicó. Si algún marcador de un bloque ya existía
+    (un reintento que dividió el lote de otra forma), el bloque se aplica
+    de a un aporte para no perder los que faltaban.
+
+    Args:
+        client: Cliente de DynamoDB (el meta.client del resource)
+        contributions: Lista de (marcador, valor) de un mismo destino
+        build_update: Recibe los valores de un bloque y devuelve la acción
+            Update de TransactWriteItems que los aplica
+
+    Returns:
+        Valores aplicados en esta llamada (sin los ya aplicados antes ni los
+        descartados por la condición del update)
+    """
+    applied = []
+    for chunk in chunked(contributions, MAX_MARKERS_PER_TRANSACTION):
+        outcome = _transact(client, chunk, build_update)
+        if outcome == 'applied':
+            applied.extend(value for _, value in chunk)
+        elif outcome == 'duplicate' and len(chunk) > 1:
+            for marker, value in chunk:
+                if _transact(client, [(marker, value)], build_update) == 'applied':
+                    applied.append(value)
+    return applied
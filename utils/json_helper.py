@@ -0,0 +1,61 @@
+import json
+import os
+from decimal import Decimal
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional: sin él se usa json de la stdlib
+    orjson = None
+
+# 'auto' usa orjson si está instalado; 'json' fuerza la stdlib
+JSON_SERIALIZER = os.environ.get('JSON_SERIALIZER', 'auto')
+
+
+def _default(value: Any) -> Any:
+    # DynamoDB devuelve los números como Decimal y los sets de strings como set
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _orjson_dumps(value: Any, sort_keys: bool = False) -> str:
+    option = orjson.OPT_SORT_KEYS if sort_keys else 0
+    return orjson.dumps(value, default=_default, option=option).decode('utf-8')
+
+
+def _stdlib_dumps(value: Any, sort_keys: bool = False) -> str:
+    return json.dumps(value, default=_default, sort_keys=sort_keys, separators=(',', ':'))
+
+
+def get_backend(name: str = JSON_SERIALIZER) -> str:
+    """Resolver el nombre del serializador a usar ('orjson' o 'json')"""
+    if name == 'orjson' and orjson is None:
+        raise ValueError("orjson is not installed")
+    if name not in ('auto', 'orjson', 'json'):
+        raise ValueError(f"Unknown JSON serializer: {name}")
+    if name == 'auto':
+        return 'orjson' if orjson is not None else 'json'
+    return name
+
+
+_BACKENDS = {'orjson': _orjson_dumps, 'json': _stdlib_dumps}
+
+_dumps = _BACKENDS[get_backend()]
+
+
+def dumps(value: Any, sort_keys: bool = False) -> str:
+    """
+    Serializar a JSON compacto
+
+    Acepta directamente items de DynamoDB: los Decimal se escriben como
+    int o float y los sets como listas ordenadas.
+    """
+    return _dumps(value, sort_keys)
+
+
+def get_dumps(name: str):
+    """Obtener la función de serialización de un backend concreto"""
+    return _BACKENDS[get_backend(name)]
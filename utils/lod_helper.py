@@ -0,0 +1,91 @@
+import math
+import os
+from typing import Dict, List, Sequence
+
+# Tamaño de celda por nivel de zoom, del más alejado al más cercano
+ZOOM_LEVEL_CELL_SIZES = [
+    float(size) for size in os.environ.get('SUMMARY_CELL_SIZES', '4096,1024,256').split(',')
+]
+
+# Cantidad de items representativos que se guardan por celda
+MAX_CELL_REPRESENTATIVES = int(os.environ.get('SUMMARY_CELL_REPRESENTATIVES', 3))
+
+
+def cell_key(x: float, y: float, cell_size: float) -> str:
+    """Clave de la celda que contiene un punto"""
+    return f"{math.floor(x / cell_size)}#{math.floor(y / cell_size)}"
+
+
+def cell_coordinates(key: str) -> tuple[int, int]:
+    """Índices (columna, fila) de una clave de celda"""
+    column, row = key.split('#')
+    return int(column), int(row)
+
+
+def cell_bbox(key: str, cell_size: float) -> tuple[float, float, float, float]:
+    """
+    Área (x0, y0, x1, y1) que cubre una celda
+
+    El borde superior es exclusivo en la grilla pero el área lo incluye:
+    quien la use para buscar items debe confirmar la celda con cell_key.
+    """
+    column, row = cell_coordinates(key)
+    return column * cell_size, row * cell_size, (column + 1) * cell_size, (row + 1) * cell_size
+
+
+def _bin_points_python(ids: Sequence[str], xs: Sequence[float], ys: Sequence[float], cell_size: float) -> Dict[str, dict]:
+    cells: Dict[str, dict] = {}
+    for item_id, x, y in zip(ids, xs, ys):
+        cell = cells.setdefault(cell_key(x, y, cell_size), {'count': 0, 'item_ids': []})
+        cell['count'] += 1
+        if len(cell['item_ids']) < MAX_CELL_REPRESENTATIVES:
+            cell['item_ids'].append(item_id)
+    return cells
+
+
+def bin_points(ids: Sequence[str], xs: Sequence[float], ys: Sequence[float], cell_size: float) -> Dict[str, dict]:
+    """
+    Agrupar puntos en una grilla
+
+    Usa NumPy para el binning, que se despliega en la capa de
+    requirements.txt (ver serverless.yml); sin él, un recorrido en Python
+    con el mismo resultado.
+
+    Returns:
+        Dict de clave de celda -> {'count': int, 'item_ids': [ids representativos]}
+    """
+    if not ids:
+        return {}
+
+    try:
+        import numpy as np
+    except ImportError:
+        return _bin_points_python(ids, xs, ys, cell_size)
+
+    columns = np.floor(np.asarray(xs, dtype=np.float64) / cell_size).astype(np.int64)
+    rows = np.floor(np.asarray(ys, dtype=np.float64) / cell_size).astype(np.int64)
+
+    unique_cells, inverse, counts = np.unique(
+        np.stack([columns, rows], axis=1),
+        axis=0,
+        return_inverse=True,
+        return_counts=True
+    )
+    # Orden estable: los representativos son los primeros items de cada celda
+    order = np.argsort(inverse.reshape(-1), kind='stable')
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    cells = {}
+    for index, (column, row) in enumerate(unique_cells.tolist()):
+        start = int(starts[index])
+        representatives = order[start:start + min(int(counts[index]), MAX_CELL_REPRESENTATIVES)]
+        cells[f"{column}#{row}"] = {
+            'count': int(counts[index]),
+            'item_ids': [ids[position] for position in representatives.tolist()]
+        }
+    return cells
+
+
+def build_levels(ids: List[str], xs: List[float], ys: List[float]) -> List[Dict[str, dict]]:
+    """Grillas de todos los niveles de zoom para un conjunto de puntos"""
+    return [bin_points(ids, xs, ys, cell_size) for cell_size in ZOOM_LEVEL_CELL_SIZES]
@@ -0,0 +1,111 @@
+import base64
+import binascii
+import json
+from decimal import Decimal
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+from utils.json_helper import _default
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+# Clave primaria de las tablas que se listan con scan_page (todas de tipo S)
+DEFAULT_KEY_ATTRIBUTES = ('id',)
+
+
+def clamp_page_size(limit: Optional[Any], default: int = DEFAULT_PAGE_SIZE) -> int:
+    """
+    Normalizar el tamaño de página solicitado al rango [1, MAX_PAGE_SIZE]
+
+    Raises:
+        ValueError si el valor no es un entero
+    """
+    if limit is None or limit == '':
+        return default
+    try:
+        value = int(limit)
+    except (TypeError, ValueError):
+        raise ValueError("limit must be an integer")
+    return max(1, min(value, MAX_PAGE_SIZE))
+
+
+def encode_next_token(last_evaluated_key: Optional[dict]) -> Optional[str]:
+    """Convertir un LastEvaluatedKey de DynamoDB en un token opaco"""
+    if not last_evaluated_key:
+        return None
+    raw = json.dumps(last_evaluated_key, default=_default, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_next_token(
+        next_token: Optional[str],
+        key_attributes: Sequence[str] = DEFAULT_KEY_ATTRIBUTES
+) -> Optional[dict]:
+    """
+    Convertir un token opaco en un ExclusiveStartKey de DynamoDB
+
+    Args:
+        key_attributes: Atributos (de tipo string) de la clave de la tabla
+
+    Raises:
+        ValueError si el token no es válido o no tiene exactamente esos
+        atributos; sin esta validación DynamoDB lo rechaza con un ClientError
+    """
+    if not next_token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(next_token.encode())
+        key = json.loads(raw, parse_float=Decimal, parse_int=Decimal)
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError("Invalid next_token")
+    if not isinstance(key, dict) or set(key) != set(key_attributes):
+        raise ValueError("Invalid next_token")
+    if not all(isinstance(value, str) and value for value in key.values()):
+        raise ValueError("Invalid next_token")
+    return key
+
+
+def scan_page(
+        table: Any,
+        limit: int,
+        next_token: Optional[str] = None,
+        key_attributes: Sequence[str] = DEFAULT_KEY_ATTRIBUTES,
+        **kwargs
+) -> tuple[list, Optional[str]]:
+    """
+    Leer una página de un scan con tamaño acotado
+
+    Raises:
+        ValueError si el token no corresponde a la clave de la tabla
+
+    Returns:
+        Tupla con los items crudos de la página y el token de la siguiente página
+    """
+    params = dict(kwargs, Limit=clamp_page_size(limit))
+    start_key = decode_next_token(next_token, key_attributes)
+    if start_key:
+        params['ExclusiveStartKey'] = start_key
+
+    response = table.scan(**params)
+    return response.get('Items', []), encode_next_token(response.get('LastEvaluatedKey'))
+
+
+def iter_items(operation: Callable[..., dict], **kwargs) -> Iterator[dict]:
+    """
+    Recorrer todas las páginas de un query o scan siguiendo LastEvaluatedKey
+
+    Las páginas se piden a medida que se consumen, por lo que el llamador
+    puede detenerse antes sin leer la partición completa.
+
+    Args:
+        operation: table.query o table.scan
+        **kwargs: Parámetros de la operación
+    """
+    params = dict(kwargs)
+    while True:
+        response = operation(**params)
+        yield from response.get('Items', [])
+
+        last_evaluated_key = response.get('LastEvaluatedKey')
+        if not last_evaluated_key:
+            return
+        params['ExclusiveStartKey'] = last_evaluated_key
@@ -0,0 +1,94 @@
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, Optional
+
+DEFAULT_SCAN_SEGMENTS = int(os.environ.get('SCAN_SEGMENTS', 4))
+MAX_SCAN_SEGMENTS = 64
+
+_SEGMENT_DONE = object()
+
+
+def _put(pages: queue.Queue, stop: threading.Event, value: Any) -> None:
+    # Un put bloqueante dejaría al worker colgado si el consumidor ya se detuvo
+    while not stop.is_set():
+        try:
+            pages.put(value, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def _scan_segment(
+        client: Any,
+        segment: int,
+        total_segments: int,
+        pages: queue.Queue,
+        stop: threading.Event,
+        params: dict
+) -> None:
+    params = dict(params, Segment=segment, TotalSegments=total_segments)
+    try:
+        while not stop.is_set():
+            # El throttling lo reintenta botocore (retries adaptativos del cliente)
+            response = client.scan(**params)
+            _put(pages, stop, response.get('Items', []))
+
+            last_evaluated_key = response.get('LastEvaluatedKey')
+            if not last_evaluated_key:
+                break
+            params['ExclusiveStartKey'] = last_evaluated_key
+    except Exception as e:
+        _put(pages, stop, e)
+    finally:
+        _put(pages, stop, _SEGMENT_DONE)
+
+
+def parallel_scan(
+        table: Any,
+        total_segments: Optional[int] = None,
+        **kwargs
+) -> Iterator[dict]:
+    """
+    Leer una tabla completa con un scan segmentado en paralelo
+
+    Cada segmento se recorre en su propio hilo y las páginas se entregan a
+    medida que llegan, sin orden entre segmentos. La cola de páginas está
+    acotada, así que un consumidor lento frena a los workers en lugar de
+    acumular la tabla en memoria.
+
+    Los workers usan el cliente de bajo nivel de la tabla (thread-safe, a
+    diferencia del resource) con los tipos de Python del resource.
+
+    Args:
+        table: Tabla de DynamoDB (boto3 resource)
+        total_segments: Número de segmentos (default: SCAN_SEGMENTS o 4)
+        **kwargs: Parámetros adicionales del scan (ProjectionExpression, etc.)
+
+    Returns:
+        Iterador de items crudos de DynamoDB
+    """
+    total_segments = max(1, min(total_segments or DEFAULT_SCAN_SEGMENTS, MAX_SCAN_SEGMENTS))
+    pages: queue.Queue = queue.Queue(maxsize=total_segments * 2)
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=total_segments)
+
+    params = dict(kwargs, TableName=table.name)
+
+    try:
+        for segment in range(total_segments):
+            executor.submit(_scan_segment, table.meta.client, segment, total_segments, pages, stop, params)
+
+        remaining = total_segments
+        while remaining:
+            page = pages.get()
+            if page is _SEGMENT_DONE:
+                remaining -= 1
+                continue
+            if isinstance(page, Exception):
+                raise page
+            yield from page
+    finally:
+        stop.set()
+        executor.shutdown(wait=False)
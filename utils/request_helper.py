@@ -0,0 +1,19 @@
+import base64
+import json
+from typing import Any
+
+
+def parse_json_body(event: dict) -> Any:
+    """
+    Leer el body JSON de un request
+
+    Con binaryMediaTypes habilitado API Gateway puede entregar el body en
+    base64 (isBase64Encoded); se decodifica antes de parsear.
+
+    Raises:
+        json.JSONDecodeError si el body no es JSON válido
+    """
+    body = event.get('body') or '{}'
+    if event.get('isBase64Encoded'):
+        body = base64.b64decode(body).decode('utf-8')
+    return json.loads(body)
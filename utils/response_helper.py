@@ -1,13 +1,122 @@
-import json
+import base64
+import gzip
+import hashlib
+import os
 from typing import Any, Optional
 
+try:
+    import brotli
+except ImportError:  # brotli es opcional: sin él solo se ofrece gzip
+    brotli = None
+
+from utils.json_helper import dumps
+
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Credentials': True,
+}
+
+# Por debajo de este tamaño comprimir no compensa el costo de CPU
+COMPRESSION_MIN_BYTES = int(os.environ.get('COMPRESSION_MIN_BYTES', 1024))
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+# Deben coincidir con provider.apiGateway.binaryMediaTypes de serverless.yml.
+# API Gateway solo decodifica un body en base64 si el primer tipo del Accept
+# del request está en esa lista; con '*/*' también se rompían las
+# integraciones MOCK de los OPTIONS de CORS.
+BINARY_MEDIA_TYPES = ('application/json',)
+# La codificación elegida depende de ambos headers; va en toda respuesta
+# negociable (también sin comprimir y en los 304) para que los caches
+# intermedios no entreguen una variante a quien no la pidió
+VARY_HEADER = 'Accept, Accept-Encoding'
+
+
+def _accepted_encodings(accept_encoding: Optional[str]) -> dict:
+    # "gzip;q=0.8, br" -> {'gzip': 0.8, 'br': 1.0}; q puede ir en cualquier
+    # posición entre los parámetros ("gzip;foo=1;q=0.5")
+    encodings = {}
+    for part in (accept_encoding or '').split(','):
+        name, *params = part.split(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+        encodings[name] = quality
+    return encodings
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Elegir la codificación a usar según el header Accept-Encoding"""
+    encodings = _accepted_encodings(accept_encoding)
+    wildcard = encodings.get('*', 0.0)
+    candidates = ['br', 'gzip'] if brotli is not None else ['gzip']
+    for encoding in candidates:
+        if encodings.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def delivers_binary(accept: Optional[str]) -> bool:
+    """Indicar si API Gateway entregará como binario la respuesta a un request con este Accept"""
+    first = (accept or '').split(',')[0].partition(';')[0].strip().lower()
+    return first in BINARY_MEDIA_TYPES
+
+
+def compress_response(response: dict, accept_encoding: Optional[str], accept: Optional[str] = None) -> dict:
+    """
+    Comprimir el body de una respuesta si el cliente lo acepta
+
+    API Gateway exige el body en base64 con isBase64Encoded para contenido
+    binario, y solo lo decodifica cuando el Accept del request es uno de
+    BINARY_MEDIA_TYPES; en otro caso, y para bodies chicos, se devuelve sin
+    tocar.
+    """
+    body = response.get('body') or ''
+    raw = body.encode('utf-8')
+    if len(raw) < COMPRESSION_MIN_BYTES or not delivers_binary(accept):
+        return response
+
+    encoding = choose_encoding(accept_encoding)
+    if encoding is None:
+        return response
+
+    if encoding == 'br':
+        compressed = brotli.compress(raw, quality=BROTLI_QUALITY)
+    else:
+        compressed = gzip.compress(raw, compresslevel=GZIP_LEVEL)
+
+    headers = {**response['headers'], 'Content-Encoding': encoding}
+    if 'ETag' in headers:
+        headers['ETag'] = encoded_etag(headers['ETag'], encoding)
+
+    return {
+        **response,
+        'headers': headers,
+        'body': base64.b64encode(compressed).decode('ascii'),
+        'isBase64Encoded': True
+    }
+
 
 def create_response(
     status_code: int,
     body: Any,
-    message: Optional[str] = None
+    message: Optional[str] = None,
+    headers: Optional[dict] = None,
+    event: Optional[dict] = None
 ) -> dict:
-    """Crear una respuesta HTTP estandarizada"""
+    """
+    Crear una respuesta HTTP estandarizada
+
+    Si se pasa el event, el body se comprime según su Accept-Encoding y la
+    respuesta lleva Vary.
+    """
     response_body = {}
 
     if message:
@@ -19,20 +128,30 @@ def create_response(
         else:
             response_body['data'] = body
 
-    return {
+    response = {
         'statusCode': status_code,
         'headers': {
             'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Credentials': True,
+            **CORS_HEADERS,
+            **(headers or {})
         },
-        'body': json.dumps(response_body)
+        'body': dumps(response_body)
     }
 
+    if event is not None:
+        response['headers']['Vary'] = VARY_HEADER
+        response = compress_response(response, get_header(event, 'Accept-Encoding'), get_header(event, 'Accept'))
+    return response
 
-def success_response(data: Any = None, message: str = "Success") -> dict:
+
+def success_response(
+    data: Any = None,
+    message: str = "Success",
+    headers: Optional[dict] = None,
+    event: Optional[dict] = None
+) -> dict:
     """Respuesta de éxito (200)"""
-    return create_response(200, data, message)
+    return create_response(200, data, message, headers, event)
 
 
 def created_response(data: Any = None, message: str = "Created successfully") -> dict:
@@ -50,6 +169,119 @@ def not_found_response(message: str = "Resource not found") -> dict:
     return create_response(404, None, message)
 
 
+def conflict_response(message: str = "Conflict") -> dict:
+    """Respuesta de conflicto (409)"""
+    return create_response(409, None, message)
+
+
 def server_error_response(message: str = "Internal server error") -> dict:
     """Respuesta de error del servidor (500)"""
     return create_response(500, None, message)
+
+
+def _digest(value: Any) -> str:
+    raw = dumps(value, sort_keys=True)
+    return '"' + hashlib.sha256(raw.encode()).hexdigest()[:32] + '"'
+
+
+# Contadores que el stream actualiza sin modificar updated_at
+COUNTER_FIELDS = ('item_count', 'session_count', 'course_count')
+
+
+def entity_etag(data: dict) -> str:
+    """ETag fuerte de una entidad a partir de su ID, updated_at, versión y contadores"""
+    return _digest([data.get('id'), data.get('updated_at'), data.get('version')]
+                   + [data.get(field) for field in COUNTER_FIELDS])
+
+
+def collection_etag(*parts: Any) -> str:
+    """ETag fuerte de una colección a partir de su contenido o de un resumen de versión"""
+    return _digest(list(parts))
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """
+    ETag de la variante comprimida de una respuesta: '"<hash>"' -> '"<hash>-gzip"'
+
+    Cada codificación es otra representación y necesita su propio ETag fuerte.
+    """
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def _unencoded_etag(etag: str) -> str:
+    # Inversa de encoded_etag; ignora también el prefijo W/ (comparación débil)
+    if etag.startswith('W/'):
+        etag = etag[2:]
+    for encoding in ('br', 'gzip'):
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[:-len(suffix)] + '"'
+    return etag
+
+
+def get_header(event: dict, name: str) -> Optional[str]:
+    """Obtener un header del request sin distinguir mayúsculas"""
+    name = name.lower()
+    for key, value in (event.get('headers') or {}).items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def matching_etag(event: dict, etag: str) -> Optional[str]:
+    """
+    Obtener el ETag del If-None-Match que coincide con el actual, en cualquier codificación
+
+    Returns:
+        El ETag tal como lo envió el cliente, o None si ninguno coincide
+    """
+    if_none_match = get_header(event, 'If-None-Match')
+    if not if_none_match:
+        return None
+    if if_none_match.strip() == '*':
+        return etag
+    for candidate in (candidate.strip() for candidate in if_none_match.split(',')):
+        if _unencoded_etag(candidate) == etag:
+            return candidate
+    return None
+
+
+def etag_matches(event: dict, etag: str) -> bool:
+    """Indicar si el If-None-Match del request coincide con el ETag actual"""
+    return matching_etag(event, etag) is not None
+
+
+def not_modified_response(etag: str, event: Optional[dict] = None) -> dict:
+    """
+    Respuesta sin cambios (304), sin body
+
+    Si se pasa el event se devuelve el ETag de la variante que tiene el
+    cliente (la codificación con la que la recibió).
+    """
+    return {
+        'statusCode': 304,
+        'headers': {
+            **CORS_HEADERS,
+            'ETag': (matching_etag(event, etag) if event is not None else None) or etag,
+            'Cache-Control': 'no-cache',
+            'Vary': VARY_HEADER
+        },
+        'body': ''
+    }
+
+
+def conditional_response(
+    event: dict,
+    data: Any,
+    etag: Optional[str] = None,
+    message: str = "Success"
+) -> dict:
+    """
+    Respuesta de éxito con ETag que responde 304 si el cliente ya tiene la versión
+
+    Si no se indica el ETag se calcula a partir del contenido.
+    """
+    etag = etag or collection_etag(data)
+    if etag_matches(event, etag):
+        return not_modified_response(etag, event)
+    return success_response(data, message, {'ETag': etag, 'Cache-Control': 'no-cache'}, event)
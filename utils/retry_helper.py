@@ -0,0 +1,14 @@
+import random
+
+# Los errores de throttling los reintenta botocore (retries adaptativos en
+# utils.aws_clients). Este backoff es solo para los resultados parciales
+# de las operaciones batch (UnprocessedKeys / UnprocessedItems), que
+# botocore no reintenta por tratarse de respuestas exitosas.
+DEFAULT_MAX_ATTEMPTS = 8
+BASE_DELAY_SECONDS = 0.05
+MAX_DELAY_SECONDS = 2.0
+
+
+def backoff_delay(attempt: int) -> float:
+    """Calcular la espera con backoff exponencial y jitter completo"""
+    return random.uniform(0, min(MAX_DELAY_SECONDS, BASE_DELAY_SECONDS * (2 ** attempt)))
@@ -1,13 +1,16 @@
 import os
-import boto3
 from botocore.exceptions import ClientError
-from typing import Optional
+from typing import List, Optional
 import uuid
 
+from utils.aws_clients import get_s3_client
+
+DELETE_OBJECTS_BATCH_SIZE = 1000
+
 
 class S3Helper:
     def __init__(self):
-        self.s3_client = boto3.client('s3')
+        self.s3_client = get_s3_client()
         self.bucket_name = os.environ.get('DOCUMENTS_BUCKET')
 
     def generate_presigned_upload_url(
@@ -76,6 +79,38 @@ class S3Helper:
             print(f"Error deleting object from S3: {e}")
             return False
 
+    def delete_objects(self, keys: List[str]) -> List[str]:
+        """
+        Eliminar varios objetos de S3 con DeleteObjects (1000 keys por llamada)
+
+        Args:
+            keys: Claves de los objetos en S3
+
+        Returns:
+            Lista de claves que no se pudieron eliminar
+        """
+        failed = []
+        unique_keys = list(dict.fromkeys(keys))
+
+        for start in range(0, len(unique_keys), DELETE_OBJECTS_BATCH_SIZE):
+            chunk = unique_keys[start:start + DELETE_OBJECTS_BATCH_SIZE]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={
+                        'Objects': [{'Key': key} for key in chunk],
+                        'Quiet': True
+                    }
+                )
+                for error in response.get('Errors', []):
+                    print(f"Error deleting object {error.get('Key')} from S3: {error.get('Message')}")
+                    failed.append(error.get('Key'))
+            except ClientError as e:
+                print(f"Error deleting objects from S3: {e}")
+                failed.extend(chunk)
+
+        return failed
+
     def get_object_key_from_url(self, url: str) -> Optional[str]:
         """
         Extraer la key de S3 desde una URL
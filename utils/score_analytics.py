@@ -0,0 +1,164 @@
+import math
+import os
+from array import array
+from bisect import bisect_right
+from typing import Iterable, List, Sequence, Tuple
+
+SCORE_PERCENTILES = (10, 25, 50, 75, 90, 99)
+HISTOGRAM_BUCKET_SIZE = int(os.environ.get('SCORE_HISTOGRAM_BUCKET_SIZE', 10))
+MAX_SCORE = 100
+
+
+def collect_scores(rows: Iterable[Tuple[float, bool]]) -> Tuple[array, array]:
+    """
+    Acumular (score, active) en arrays compactos
+
+    Los array de la stdlib guardan los valores sin un objeto por fila y
+    NumPy los lee sin copiar con frombuffer.
+    """
+    scores = array('d')
+    actives = array('b')
+    for score, active in rows:
+        scores.append(score)
+        actives.append(1 if active else 0)
+    return scores, actives
+
+
+def _bucket_edges() -> List[int]:
+    """
+    Bordes del histograma, compartidos por el cálculo en NumPy y en Python
+
+    Siempre terminan en MAX_SCORE: si el tamaño no divide a 100, el último
+    bucket es más corto en lugar de quedar fuera del histograma.
+    """
+    return list(range(0, MAX_SCORE, HISTOGRAM_BUCKET_SIZE)) + [MAX_SCORE]
+
+
+def _bucket_index(edges: List[int], score: float) -> int:
+    # Buckets [desde, hasta) salvo el último, que incluye MAX_SCORE, igual que numpy.histogram
+    return min(bisect_right(edges, score) - 1, len(edges) - 2)
+
+
+def _percentile_python(sorted_scores: Sequence[float], percentile: float) -> float:
+    # Interpolación lineal, igual que el método por defecto de numpy.percentile
+    position = (len(sorted_scores) - 1) * percentile / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_scores) - 1)
+    return sorted_scores[lower] + (sorted_scores[upper] - sorted_scores[lower]) * (position - lower)
+
+
+def _group_python(scores: Sequence[float]) -> dict:
+    if not scores:
+        return {'count': 0, 'mean': None, 'median': None}
+    ordered = sorted(scores)
+    return {
+        'count': len(ordered),
+        'mean': sum(ordered) / len(ordered),
+        'median': _percentile_python(ordered, 50)
+    }
+
+
+def _empty_stats() -> dict:
+    empty_group = {'count': 0, 'mean': None, 'median': None}
+    return {
+        'count': 0,
+        'mean': None,
+        'std': None,
+        'min': None,
+        'max': None,
+        'percentiles': {f'p{p}': None for p in SCORE_PERCENTILES},
+        'histogram': _histogram_entries([0] * (len(_bucket_edges()) - 1)),
+        'by_status': {'active': dict(empty_group), 'inactive': dict(empty_group)}
+    }
+
+
+def _score_stats_python(scores: Sequence[float], actives: Sequence[int]) -> dict:
+    ordered = sorted(scores)
+    count = len(ordered)
+    mean = sum(ordered) / count
+
+    edges = _bucket_edges()
+    histogram = [0] * (len(edges) - 1)
+    for score in ordered:
+        if 0 <= score <= MAX_SCORE:
+            histogram[_bucket_index(edges, score)] += 1
+
+    return {
+        'count': count,
+        'mean': mean,
+        'std': math.sqrt(sum((score - mean) ** 2 for score in ordered) / count),
+        'min': ordered[0],
+        'max': ordered[-1],
+        'percentiles': {f'p{p}': _percentile_python(ordered, p) for p in SCORE_PERCENTILES},
+        'histogram': _histogram_entries(histogram),
+        'by_status': {
+            'active': _group_python([score for score, active in zip(scores, actives) if active]),
+            'inactive': _group_python([score for score, active in zip(scores, actives) if not active])
+        }
+    }
+
+
+def _as_numpy(np, values: Sequence, dtype):
+    # Los array de collect_scores se leen sin copiar
+    if isinstance(values, array):
+        return np.frombuffer(values, dtype=dtype)
+    return np.asarray(values, dtype=dtype)
+
+
+def _group_numpy(np, scores) -> dict:
+    if not scores.size:
+        return {'count': 0, 'mean': None, 'median': None}
+    return {
+        'count': int(scores.size),
+        'mean': float(scores.mean()),
+        'median': float(np.median(scores))
+    }
+
+
+def score_stats(scores: Sequence[float], actives: Sequence[int]) -> dict:
+    """
+    Estadísticas de puntajes: media, desvío, percentiles, histograma y
+    desglose por estado activo/inactivo
+
+    Usa NumPy, que se despliega en la capa de requirements.txt de las
+    funciones que lo necesitan (ver serverless.yml); sin él, por ejemplo en
+    un entorno local, usa un cálculo en Python con el mismo resultado.
+
+    Returns:
+        Dict con 'count', 'mean', 'std', 'min', 'max', 'percentiles',
+        'histogram' (lista de {'from', 'to', 'count'}) y 'by_status'; sin
+        puntajes, las mismas claves con None y conteos en cero
+    """
+    if not len(scores):
+        return _empty_stats()
+
+    try:
+        import numpy as np
+    except ImportError:
+        return _score_stats_python(scores, actives)
+
+    values = _as_numpy(np, scores, np.float64)
+    active_mask = _as_numpy(np, actives, np.int8).astype(bool)
+
+    histogram, _ = np.histogram(values, bins=_bucket_edges())
+    percentiles = np.percentile(values, SCORE_PERCENTILES)
+
+    return {
+        'count': int(values.size),
+        'mean': float(values.mean()),
+        'std': float(values.std()),
+        'min': float(values.min()),
+        'max': float(values.max()),
+        'percentiles': {f'p{p}': float(value) for p, value in zip(SCORE_PERCENTILES, percentiles)},
+        'histogram': _histogram_entries([int(count) for count in histogram]),
+        'by_status': {
+            'active': _group_numpy(np, values[active_mask]),
+            'inactive': _group_numpy(np, values[~active_mask])
+        }
+    }
+
+
+def _histogram_entries(counts: List[int]) -> List[dict]:
+    # 'to' es exclusivo salvo en el último bucket, que incluye MAX_SCORE
+    edges = _bucket_edges()
+    return [{'from': start, 'to': end, 'count': count} for start, end, count in zip(edges, edges[1:], counts)]
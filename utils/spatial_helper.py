@@ -0,0 +1,75 @@
+import math
+import os
+from typing import Iterator, Tuple
+
+# Tamaño de cada tile en unidades del board
+TILE_SIZE = float(os.environ.get('ITEM_TILE_SIZE', 512))
+
+# Desplazamiento para que los índices negativos se ordenen como strings
+TILE_INDEX_OFFSET = 1_000_000
+TILE_INDEX_WIDTH = 7
+
+# Si el viewport cubre más filas de tiles se lee la partición completa
+MAX_VIEWPORT_TILE_ROWS = int(os.environ.get('MAX_VIEWPORT_TILE_ROWS', 32))
+
+
+def tile_index(value: float) -> int:
+    """Índice del tile que contiene una coordenada"""
+    index = math.floor(value / TILE_SIZE) + TILE_INDEX_OFFSET
+    return max(0, min(index, 2 * TILE_INDEX_OFFSET))
+
+
+def _format_index(index: int) -> str:
+    return str(index).zfill(TILE_INDEX_WIDTH)
+
+
+def tile_key(x: float, y: float) -> str:
+    """
+    Clave de tile para el sort key del índice espacial
+
+    El formato es "<fila>#<columna>" con índices de ancho fijo, así las
+    columnas de una misma fila quedan contiguas y se leen con un BETWEEN.
+    """
+    return f"{_format_index(tile_index(y))}#{_format_index(tile_index(x))}"
+
+
+def parse_bbox(value: str) -> Tuple[float, float, float, float]:
+    """
+    Convertir "x0,y0,x1,y1" en una tupla normalizada (x0 <= x1, y0 <= y1)
+
+    Raises:
+        ValueError si el formato no es válido
+    """
+    try:
+        x0, y0, x1, y1 = (float(part) for part in value.split(','))
+    except (AttributeError, ValueError):
+        raise ValueError("bbox must be x0,y0,x1,y1")
+
+    if not all(math.isfinite(v) for v in (x0, y0, x1, y1)):
+        raise ValueError("bbox must be x0,y0,x1,y1")
+
+    return min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)
+
+
+def tile_rows(y0: float, y1: float) -> int:
+    """Cantidad de filas de tiles que cubre un viewport, sin generarlas"""
+    return tile_index(y1) - tile_index(y0) + 1
+
+
+def tile_ranges(x0: float, y0: float, x1: float, y1: float) -> Iterator[Tuple[str, str]]:
+    """
+    Rangos de sort key (inicio, fin) que cubren un viewport, uno por fila de tiles
+
+    Es un generador: un viewport enorme no construye millones de rangos.
+    Antes de recorrerlo se puede acotar con tile_rows.
+    """
+    first_column = _format_index(tile_index(x0))
+    last_column = _format_index(tile_index(x1))
+    for row in range(tile_index(y0), tile_index(y1) + 1):
+        yield f"{_format_index(row)}#{first_column}", f"{_format_index(row)}#{last_column}"
+
+
+def contains(bbox: Tuple[float, float, float, float], x: float, y: float) -> bool:
+    """Indicar si un punto está dentro del viewport"""
+    x0, y0, x1, y1 = bbox
+    return x0 <= x <= x1 and y0 <= y <= y1
@@ -0,0 +1,43 @@
+import threading
+from typing import Any, Callable, Dict, List
+
+
+class CoalescingBuffer:
+    """
+    Buffer que conserva solo el último valor de cada clave hasta el flush
+
+    Cada valor lleva un número de secuencia ('seq'); ante dos valores de la
+    misma clave gana el de mayor secuencia aunque llegue después, así el
+    orden de llegada de los mensajes no importa (last-writer-wins).
+    """
+
+    def __init__(self, flush_fn: Callable[[List[dict]], Any]):
+        self.flush_fn = flush_fn
+        self._pending: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, key: str, value: dict) -> bool:
+        """
+        Encolar un valor
+
+        Returns:
+            False si se descartó por tener una secuencia anterior a la encolada
+        """
+        with self._lock:
+            current = self._pending.get(key)
+            if current is not None and current['seq'] > value['seq']:
+                return False
+            self._pending[key] = value
+            return True
+
+    def flush(self) -> Any:
+        """Escribir los valores pendientes en una sola llamada a flush_fn"""
+        with self._lock:
+            values = list(self._pending.values())
+            self._pending = {}
+        if not values:
+            return None
+        return self.flush_fn(values)